@@ -0,0 +1,43 @@
+"""Add composite (created_at, id) index for keyset pagination
+
+Revision ID: cda527acce85
+Revises: 06afbe8b2304
+Create Date: 2026-10-18 02:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'cda527acce85'
+down_revision: Union[str, None] = '06afbe8b2304'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Индекс для сортировки и keyset-пагинации по (created_at, id).
+    # Для сортировки по id достаточно первичного ключа.
+    # CONCURRENTLY не блокирует запись в таблицу на время построения,
+    # но не может выполняться внутри транзакции миграции
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_user_created_at_id',
+            'user',
+            ['created_at', 'id'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_user_created_at_id',
+            table_name='user',
+            postgresql_concurrently=True,
+        )
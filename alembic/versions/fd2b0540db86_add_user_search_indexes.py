@@ -0,0 +1,76 @@
+"""Add B-tree and pg_trgm GIN indexes for user search
+
+Revision ID: fd2b0540db86
+Revises: cda527acce85
+Create Date: 2026-10-18 03:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'fd2b0540db86'
+down_revision: Union[str, None] = 'cda527acce85'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+
+    # Индексы строятся с CONCURRENTLY, без блокировки записи в таблицу
+    # (дольше всего строятся GIN-индексы); CONCURRENTLY не может
+    # выполняться внутри транзакции миграции
+    with op.get_context().autocommit_block():
+        # Индексы для точного поиска и сортировки (keyset-пагинации)
+        # по имени и фамилии
+        op.create_index(
+            'ix_user_name_id',
+            'user',
+            ['name', 'id'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_user_surname_id',
+            'user',
+            ['surname', 'id'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+        # Триграммные GIN-индексы для поиска по префиксу и подстроке (ILIKE)
+        op.create_index(
+            'ix_user_name_trgm',
+            'user',
+            ['name'],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_ops={'name': 'gin_trgm_ops'},
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_user_surname_trgm',
+            'user',
+            ['surname'],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_ops={'surname': 'gin_trgm_ops'},
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Расширение pg_trgm не удаляем: оно может использоваться другими объектами
+    with op.get_context().autocommit_block():
+        for name in (
+            'ix_user_surname_trgm',
+            'ix_user_name_trgm',
+            'ix_user_surname_id',
+            'ix_user_name_id',
+        ):
+            op.drop_index(name, table_name='user', postgresql_concurrently=True)
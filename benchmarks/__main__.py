@@ -0,0 +1,256 @@
+"""Бенчмарки API пользователей.
+
+Запуск в процессе (ASGI-транспорт httpx) на SQLite::
+
+    python -m benchmarks --database-url sqlite+aiosqlite:///bench.sqlite3 \\
+        --create-schema --users 10000 --output results.json
+
+Запуск против работающего сервера (база заполняется напрямую по
+``DATABASE_URL``, который должен совпадать с базой сервера)::
+
+    python -m benchmarks --base-url http://localhost:8000 --users 100000
+
+Сравнение с базовым отчетом (код выхода 1 при регрессии)::
+
+    python -m benchmarks --baseline baseline.json --tolerance 0.15
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks", description="Бенчмарки API пользователей"
+    )
+    parser.add_argument(
+        "--base-url",
+        help="Адрес работающего сервера; без него приложение " "запускается в процессе",
+    )
+    parser.add_argument(
+        "--database-url", help="Строка подключения к базе (по умолчанию DATABASE_URL)"
+    )
+    parser.add_argument(
+        "--create-schema",
+        action="store_true",
+        help="Создать таблицы по моделям (SQLite или пустая база без миграций)",
+    )
+    parser.add_argument(
+        "--users", type=int, default=10000, help="Количество пользователей"
+    )
+    parser.add_argument(
+        "--no-seed", action="store_true", help="Не пересоздавать пользователей"
+    )
+    parser.add_argument(
+        "--requests", type=int, default=500, help="Измеряемых запросов на сценарий"
+    )
+    parser.add_argument("--warmup", type=int, default=50, help="Прогревочных запросов")
+    parser.add_argument(
+        "--concurrency", type=int, default=16, help="Параллельных клиентов"
+    )
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        dest="scenarios",
+        help="Сценарий (можно повторять)",
+    )
+    parser.add_argument("--list", action="store_true", help="Показать сценарии и выйти")
+    parser.add_argument("--output", help="Файл для JSON-отчета")
+    parser.add_argument("--baseline", help="Базовый JSON-отчет для сравнения")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.1,
+        help="Допустимое ухудшение RPS и p99 относительно базового отчета",
+    )
+    return parser.parse_args(argv)
+
+
+def settings_snapshot() -> Dict[str, Any]:
+    """Настройки приложения, влияющие на результаты бенчмарков."""
+    from src.core.config import settings
+
+    keys = (
+        "DB_POOL_SIZE",
+        "DB_MAX_OVERFLOW",
+        "DB_MAX_CONNECTIONS",
+        "DB_STATEMENT_CACHE_SIZE",
+        "PASSWORD_HASH_EXECUTOR",
+        "PASSWORD_HASH_WORKERS",
+        "USER_CACHE_BACKEND",
+        "PROFILING_ENABLED",
+        "COMPRESSION_BACKEND",
+        "COMPRESSION_MINIMUM_SIZE",
+        "COMPRESSION_GZIP_LEVEL",
+        "COMPRESSION_BROTLI_QUALITY",
+        "RATE_LIMIT_BACKEND",
+        "RATE_LIMIT_RATE",
+        "RATE_LIMIT_BURST",
+        "MAX_IN_FLIGHT_REQUESTS",
+        "PASSWORD_BCRYPT_ROUNDS",
+        "USER_INSERT_BATCHING",
+        "USER_INSERT_BATCH_SIZE",
+        "USER_INSERT_BATCH_WINDOW",
+    )
+    snapshot = {key: getattr(settings, key) for key in keys}
+    # Бэкенд кэша по умолчанию зависит от количества воркеров
+    snapshot["USER_CACHE_BACKEND"] = settings.user_cache_backend
+    return snapshot
+
+
+async def run_scenarios(
+    client: Any,
+    scenarios: List[Any],
+    ctx: Any,
+    args: argparse.Namespace,
+    engine: Any,
+) -> List[Any]:
+    from benchmarks.runner import run_scenario, scenario_requests
+    from benchmarks.seed import load_users, restore_users
+
+    results = []
+    for scenario in scenarios:
+        # Строки, которые удалит сценарий, сохраняются и после него
+        # вставляются заново: следующие сценарии и прогоны с --no-seed
+        # работают с теми же данными
+        deleted_rows = []
+        if scenario.deletes:
+            requests, warmup = scenario_requests(scenario, args.requests, args.warmup)
+            deleted_rows = await load_users(
+                engine,
+                ctx.upcoming_deletable_ids((requests + warmup) * scenario.deletes),
+            )
+        result = await run_scenario(
+            client,
+            scenario,
+            ctx,
+            args.requests,
+            args.concurrency,
+            args.warmup,
+            measure_cpu=not args.base_url,
+        )
+        results.append(result)
+        print(
+            f"{scenario.name}: {result.total.rps} rps, "
+            f"p99 {result.total.latency_ms.p99} мс",
+            file=sys.stderr,
+        )
+        if deleted_rows:
+            restored = await restore_users(engine, deleted_rows)
+            ctx.reset_deletable()
+            print(
+                f"{scenario.name}: восстановлено пользователей: {restored}",
+                file=sys.stderr,
+            )
+    return results
+
+
+async def run(args: argparse.Namespace) -> int:
+    # Модули приложения импортируются после установки DATABASE_URL
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    from benchmarks.scenarios import select_scenarios
+    from src.core.config import settings
+
+    scenarios = select_scenarios(args.scenarios)
+    # Движок для заполнения базы и восстановления удаленных строк
+    engine = create_async_engine(settings.DATABASE_URL)
+    try:
+        return await run_with_engine(args, scenarios, engine)
+    finally:
+        await engine.dispose()
+
+
+async def run_with_engine(
+    args: argparse.Namespace, scenarios: List[Any], engine: Any
+) -> int:
+    import httpx
+
+    from benchmarks.report import (
+        BenchmarkReport,
+        compare_reports,
+        format_summary,
+        load_report,
+        save_report,
+    )
+    from benchmarks.scenarios import ScenarioContext
+    from benchmarks.seed import create_schema, load_user_ids, seed_users
+
+    if args.create_schema:
+        await create_schema(engine)
+    if not args.no_seed:
+        await seed_users(engine, args.users)
+    ids = await load_user_ids(engine)
+    target = engine.dialect.name
+    if not ids:
+        print("В базе нет пользователей: запустите без --no-seed", file=sys.stderr)
+        return 2
+
+    started_at = datetime.now(timezone.utc).isoformat()
+    ctx = ScenarioContext(ids)
+    limits = httpx.Limits(max_connections=args.concurrency)
+    if args.base_url:
+        client = httpx.AsyncClient(base_url=args.base_url, timeout=60, limits=limits)
+        async with client:
+            results = await run_scenarios(client, scenarios, ctx, args, engine)
+        mode, target, snapshot = "server", args.base_url, {}
+    else:
+        from src.app import app
+
+        # AsyncTestClient Litestar выполняет каждый запрос синхронно через
+        # blocking portal, поэтому параллельные клиенты в процессе
+        # обслуживаются через ASGITransport httpx
+        client = httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app),
+            base_url="http://testserver.local",
+            timeout=60,
+            limits=limits,
+        )
+        async with app.lifespan(), client:
+            results = await run_scenarios(client, scenarios, ctx, args, engine)
+        mode, snapshot = "in-process", settings_snapshot()
+
+    report = BenchmarkReport(
+        mode=mode,
+        target=target,
+        users=len(ids),
+        requests=args.requests,
+        concurrency=args.concurrency,
+        started_at=started_at,
+        scenarios=results,
+        settings=snapshot,
+    )
+    print(format_summary(report))
+    if args.output:
+        save_report(report, args.output)
+
+    if args.baseline:
+        regressions = compare_reports(
+            report, load_report(args.baseline), args.tolerance
+        )
+        for regression in regressions:
+            print(f"РЕГРЕССИЯ {regression}", file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    if args.list:
+        from benchmarks.scenarios import SCENARIOS
+
+        for scenario in SCENARIOS:
+            print(f"{scenario.name:<26}{scenario.description}")
+        return 0
+    if args.database_url:
+        os.environ["DATABASE_URL"] = args.database_url
+    return asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
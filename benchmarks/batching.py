@@ -0,0 +1,123 @@
+"""Сравнение вставки в транзакции запроса и объединения вставок в пачки.
+
+Сценарий ``signup_spike`` (параллельные POST /users) запускается для
+каждой конфигурации отдельным процессом с переменными окружения
+``USER_INSERT_BATCHING`` и ``USER_INSERT_BATCH_*``. Стоимость bcrypt
+снижается до минимальной (``--bcrypt-rounds``), чтобы время запроса
+определяли вставка и коммит, а не хеширование::
+
+    python -m benchmarks.batching --concurrency 64 --window 0.002 --window 0.01
+
+Остальные аргументы передаются ``python -m benchmarks`` без изменений.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from typing import Dict, List, Optional
+
+from benchmarks.report import BenchmarkReport, load_report
+
+
+def configurations(
+    windows: List[float], batch_size: int
+) -> Dict[str, Dict[str, str]]:
+    """Имя конфигурации и переменные окружения приложения."""
+    result = {"per-request": {"USER_INSERT_BATCHING": "false"}}
+    for window in windows:
+        result[f"batch-{window * 1000:g}ms"] = {
+            "USER_INSERT_BATCHING": "true",
+            "USER_INSERT_BATCH_WINDOW": str(window),
+            "USER_INSERT_BATCH_SIZE": str(batch_size),
+        }
+    return result
+
+
+def format_comparison(reports: Dict[str, BenchmarkReport]) -> str:
+    """Таблица вставок в секунду и задержек по конфигурациям."""
+    lines = [
+        f"{'config':<16}{'inserts/s':>10}{'p50 ms':>10}{'p95 ms':>10}"
+        f"{'p99 ms':>10}{'errors':>8}"
+    ]
+    for name, report in reports.items():
+        for scenario in report.scenarios:
+            total = scenario.total
+            lines.append(
+                f"{name:<16}{total.rps:>10.1f}{total.latency_ms.p50:>10.2f}"
+                f"{total.latency_ms.p95:>10.2f}{total.latency_ms.p99:>10.2f}"
+                f"{total.errors:>8}"
+            )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.batching", description=__doc__.splitlines()[0]
+    )
+    parser.add_argument(
+        "--window",
+        type=float,
+        action="append",
+        dest="windows",
+        help="USER_INSERT_BATCH_WINDOW в секундах (можно повторять; "
+        "по умолчанию 0.002 и 0.01)",
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=100, help="USER_INSERT_BATCH_SIZE"
+    )
+    parser.add_argument(
+        "--bcrypt-rounds", type=int, default=4, help="PASSWORD_BCRYPT_ROUNDS"
+    )
+    parser.add_argument(
+        "--concurrency", type=int, default=64, help="Параллельных клиентов"
+    )
+    parser.add_argument(
+        "--output-dir", default=".", help="Каталог для отчетов <конфигурация>.json"
+    )
+    parser.add_argument(
+        "--no-seed", action="store_true", help="Не пересоздавать пользователей"
+    )
+    args, benchmark_args = parser.parse_known_args(argv)
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    seeded = args.no_seed
+    exit_code = 0
+    reports: Dict[str, BenchmarkReport] = {}
+    for name, config in configurations(
+        args.windows or [0.002, 0.01], args.batch_size
+    ).items():
+        env = {
+            **os.environ,
+            **config,
+            "PASSWORD_BCRYPT_ROUNDS": str(args.bcrypt_rounds),
+        }
+        output = os.path.join(args.output_dir, f"{name}.json")
+        if os.path.exists(output):
+            os.remove(output)
+        command = [
+            sys.executable,
+            "-m",
+            "benchmarks",
+            "--scenario",
+            "signup_spike",
+            "--concurrency",
+            str(args.concurrency),
+            "--output",
+            output,
+        ]
+        command += (["--no-seed"] if seeded else []) + benchmark_args
+        print(f"== {name}", file=sys.stderr)
+        code = subprocess.run(command, env=env).returncode
+        # Схема и пользователи создаются только при первом прогоне
+        benchmark_args = [arg for arg in benchmark_args if arg != "--create-schema"]
+        seeded = True
+        exit_code = max(exit_code, code)
+        if os.path.exists(output):
+            reports[name] = load_report(output)
+    print(format_comparison(reports))
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,104 @@
+"""Сравнение настроек сжатия ответов.
+
+Для каждой конфигурации бенчмарк запускается в процессе отдельным
+процессом с переменными окружения ``COMPRESSION_*`` (настройки читаются
+при импорте приложения). Пользователи создаются один раз перед первым
+прогоном::
+
+    python -m benchmarks.compression --database-url sqlite+aiosqlite:///b.sqlite3 \\
+        --create-schema --users 10000 --scenario list_100 --scenario get_user
+
+Конфигурация ``brotli-*`` пропускается, если не установлен пакет brotli.
+Остальные аргументы передаются ``python -m benchmarks`` без изменений.
+"""
+
+import argparse
+import importlib.util
+import os
+import subprocess
+import sys
+from typing import Dict, List, Optional
+
+from benchmarks.report import BenchmarkReport, load_report
+
+# Имя конфигурации и переменные окружения приложения
+CONFIGURATIONS: Dict[str, Dict[str, str]] = {
+    "none": {"COMPRESSION_BACKEND": "none"},
+    "gzip-1": {"COMPRESSION_BACKEND": "gzip", "COMPRESSION_GZIP_LEVEL": "1"},
+    "gzip-6": {"COMPRESSION_BACKEND": "gzip", "COMPRESSION_GZIP_LEVEL": "6"},
+    "gzip-9": {"COMPRESSION_BACKEND": "gzip", "COMPRESSION_GZIP_LEVEL": "9"},
+    "brotli-4": {"COMPRESSION_BACKEND": "brotli", "COMPRESSION_BROTLI_QUALITY": "4"},
+}
+
+
+def format_comparison(reports: Dict[str, BenchmarkReport]) -> str:
+    """Таблица размера ответа и CPU на запрос по конфигурациям."""
+    lines = [
+        f"{'config':<10}{'scenario':<26}{'rps':>10}{'p99 ms':>10}"
+        f"{'bytes':>10}{'cpu ms':>8}"
+    ]
+    for name, report in reports.items():
+        for scenario in report.scenarios:
+            total = scenario.total
+            lines.append(
+                f"{name:<10}{scenario.name:<26}{total.rps:>10.1f}"
+                f"{total.latency_ms.p99:>10.2f}{total.response_bytes or 0:>10.0f}"
+                f"{scenario.cpu_ms_per_request or 0:>8.2f}"
+            )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.compression", description=__doc__.splitlines()[0]
+    )
+    parser.add_argument(
+        "--config",
+        action="append",
+        dest="configs",
+        choices=sorted(CONFIGURATIONS),
+        help="Конфигурация (можно повторять; по умолчанию все)",
+    )
+    parser.add_argument(
+        "--minimum-size", type=int, help="COMPRESSION_MINIMUM_SIZE для всех прогонов"
+    )
+    parser.add_argument(
+        "--output-dir", default=".", help="Каталог для отчетов <конфигурация>.json"
+    )
+    parser.add_argument(
+        "--no-seed", action="store_true", help="Не пересоздавать пользователей"
+    )
+    args, benchmark_args = parser.parse_known_args(argv)
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    seeded = args.no_seed
+    exit_code = 0
+    reports: Dict[str, BenchmarkReport] = {}
+    for name in args.configs or CONFIGURATIONS:
+        env = {**os.environ, **CONFIGURATIONS[name]}
+        if env["COMPRESSION_BACKEND"] == "brotli" and not importlib.util.find_spec(
+            "brotli"
+        ):
+            print(f"== {name}: пропущено, пакет brotli не установлен", file=sys.stderr)
+            continue
+        if args.minimum_size is not None:
+            env["COMPRESSION_MINIMUM_SIZE"] = str(args.minimum_size)
+        output = os.path.join(args.output_dir, f"{name}.json")
+        if os.path.exists(output):
+            os.remove(output)
+        command = [sys.executable, "-m", "benchmarks", "--output", output]
+        command += (["--no-seed"] if seeded else []) + benchmark_args
+        print(f"== {name}", file=sys.stderr)
+        code = subprocess.run(command, env=env).returncode
+        # Схема и пользователи создаются только при первом прогоне
+        benchmark_args = [arg for arg in benchmark_args if arg != "--create-schema"]
+        seeded = True
+        exit_code = max(exit_code, code)
+        if os.path.exists(output):
+            reports[name] = load_report(output)
+    print(format_comparison(reports))
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
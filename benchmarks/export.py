@@ -0,0 +1,178 @@
+"""Скорость потоковой выгрузки пользователей в NDJSON и CSV.
+
+Для каждого формата и размера пачки генератор выгрузки
+:func:`src.domain.users.export.export_users` читается до конца напрямую,
+без HTTP и сжатия. Время включает чтение серверным курсором, построение
+схем и кодирование. Выводятся строки и мегабайты в секунду и время до
+первого фрагмента после заголовка (когда клиент начинает получать
+данные)::
+
+    python -m benchmarks.export --database-url sqlite+aiosqlite:///b.sqlite3 \\
+        --create-schema --users 100000 --batch-sizes 100 1000 10000 --repeat 3
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from typing import List, Optional
+
+import msgspec
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from benchmarks.seed import create_schema, seed_users
+from src.core.config import settings
+from src.db.models import User
+from src.domain.users.controllers import USER_SCHEMA_COLUMNS
+from src.domain.users.export import ExportFormat, export_users
+
+FORMATS: List[ExportFormat] = ["ndjson", "csv"]
+
+
+class ExportResult(msgspec.Struct):
+    """Результат одного формата для одного размера пачки.
+
+    Attributes:
+        format: Формат выгрузки.
+        batch_size: Размер пачки строк серверного курсора.
+        rows: Выгружено строк.
+        bytes: Размер выгрузки в байтах.
+        median_s: Медианное время полной выгрузки.
+        rows_per_second: Строк в секунду по медианному времени.
+        mb_per_second: Мегабайт в секунду по медианному времени.
+        first_chunk_ms: Медианное время до первого фрагмента с данными.
+    """
+
+    format: str
+    batch_size: int
+    rows: int
+    bytes: int
+    median_s: float
+    rows_per_second: float
+    mb_per_second: float
+    first_chunk_ms: float
+
+
+async def measure(
+    engine: AsyncEngine,
+    export_format: ExportFormat,
+    batch_size: int,
+    rows: int,
+    repeat: int,
+) -> ExportResult:
+    """Измеряет полную выгрузку таблицы в одном формате."""
+    timings = []
+    first_chunks = []
+    size = 0
+    for _ in range(repeat):
+        size = 0
+        first_chunk = 0.0
+        # Заголовок CSV отдается до чтения курсора и не считается данными
+        skip = 1 if export_format == "csv" else 0
+        started = time.perf_counter()
+        async for chunk in export_users(
+            engine, USER_SCHEMA_COLUMNS, export_format, batch_size
+        ):
+            size += len(chunk)
+            if skip:
+                skip -= 1
+            elif not first_chunk:
+                first_chunk = time.perf_counter() - started
+        timings.append(time.perf_counter() - started)
+        first_chunks.append(first_chunk)
+    median = statistics.median(timings)
+    return ExportResult(
+        format=export_format,
+        batch_size=batch_size,
+        rows=rows,
+        bytes=size,
+        median_s=round(median, 3),
+        rows_per_second=round(rows / median, 1),
+        mb_per_second=round(size / median / 1e6, 2),
+        first_chunk_ms=round(statistics.median(first_chunks) * 1000, 3),
+    )
+
+
+def format_results(results: List[ExportResult]) -> str:
+    """Текстовая таблица результатов."""
+    lines = [
+        f"{'format':<8}{'batch':>7}{'rows':>10}{'MB':>9}{'median s':>10}"
+        f"{'rows/s':>12}{'MB/s':>8}{'first ms':>10}"
+    ]
+    for result in results:
+        lines.append(
+            f"{result.format:<8}{result.batch_size:>7}{result.rows:>10}"
+            f"{result.bytes / 1e6:>9.2f}{result.median_s:>10.3f}"
+            f"{result.rows_per_second:>12.1f}{result.mb_per_second:>8.2f}"
+            f"{result.first_chunk_ms:>10.3f}"
+        )
+    return "\n".join(lines)
+
+
+async def run(args: argparse.Namespace) -> List[ExportResult]:
+    engine = create_async_engine(args.database_url)
+    try:
+        if args.create_schema:
+            await create_schema(engine)
+        if not args.no_seed:
+            await seed_users(engine, args.users)
+        async with engine.connect() as connection:
+            rows = await connection.scalar(select(func.count()).select_from(User))
+        results = []
+        for batch_size in args.batch_sizes:
+            for export_format in FORMATS:
+                results.append(
+                    await measure(
+                        engine, export_format, batch_size, rows or 0, args.repeat
+                    )
+                )
+        return results
+    finally:
+        await engine.dispose()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.export", description=__doc__.splitlines()[0]
+    )
+    parser.add_argument(
+        "--database-url",
+        default=settings.DATABASE_URL,
+        help="Строка подключения к базе данных",
+    )
+    parser.add_argument(
+        "--create-schema",
+        action="store_true",
+        help="Создать таблицы по моделям (для SQLite и пустых баз)",
+    )
+    parser.add_argument(
+        "--users", type=int, default=100000, help="Количество пользователей в базе"
+    )
+    parser.add_argument(
+        "--no-seed", action="store_true", help="Не заполнять таблицу заново"
+    )
+    parser.add_argument(
+        "--batch-sizes",
+        type=int,
+        nargs="+",
+        default=[settings.EXPORT_BATCH_SIZE],
+        help="Размеры пачки серверного курсора",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="Выгрузок на формат и размер пачки"
+    )
+    parser.add_argument("--output", help="Файл для JSON-отчета")
+    args = parser.parse_args(argv)
+
+    results = asyncio.run(run(args))
+    print(format_results(results))
+    if args.output:
+        with open(args.output, "wb") as file:
+            file.write(msgspec.json.format(msgspec.json.encode(results)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,154 @@
+"""Пропускная способность хеширования паролей по схемам и стоимости.
+
+Для каждой комбинации схемы и стоимости измеряется время одного хеша
+и количество хешей в секунду в пуле из ``--workers`` потоков (как в
+``PasswordHasher`` с ``PASSWORD_HASH_EXECUTOR=thread``)::
+
+    python -m benchmarks.hashing --bcrypt-rounds 10 11 12 \\
+        --argon2-time-cost 1 2 3 --workers 4 --output hashing.json
+
+Схема argon2 пропускается, если не установлен пакет argon2-cffi.
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+import msgspec
+from passlib.exc import MissingBackendError
+
+from src.core.config import settings
+from src.core.security import build_crypt_context
+
+
+class HashingResult(msgspec.Struct):
+    """Результат одной комбинации схемы и стоимости.
+
+    Attributes:
+        scheme: Схема хеширования.
+        cost: Параметры стоимости.
+        hash_ms: Медианное время одного хеша в одном потоке.
+        hashes_per_second: Хешей в секунду в пуле потоков.
+        workers: Количество потоков пула.
+    """
+
+    scheme: str
+    cost: Dict[str, int]
+    hash_ms: float
+    hashes_per_second: float
+    workers: int
+
+
+def measure(
+    scheme: str, cost: Dict[str, int], hashes: int, workers: int
+) -> HashingResult:
+    """Измеряет время хеша и пропускную способность пула."""
+    context = build_crypt_context([scheme], **cost)
+    context.hash("benchmark")  # Прогрев бэкенда
+    timings = []
+    for _ in range(3):
+        started = time.perf_counter()
+        context.hash("benchmark")
+        timings.append(time.perf_counter() - started)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        started = time.perf_counter()
+        list(executor.map(context.hash, ["benchmark"] * hashes))
+        elapsed = time.perf_counter() - started
+    return HashingResult(
+        scheme=scheme,
+        cost=cost,
+        hash_ms=round(statistics.median(timings) * 1000, 2),
+        hashes_per_second=round(hashes / elapsed, 2),
+        workers=workers,
+    )
+
+
+def format_results(results: List[HashingResult]) -> str:
+    """Текстовая таблица результатов."""
+    lines = [f"{'scheme':<8}{'cost':<44}{'ms/hash':>10}{'hashes/s':>10}"]
+    for result in results:
+        cost = ", ".join(f"{name}={value}" for name, value in result.cost.items())
+        lines.append(
+            f"{result.scheme:<8}{cost:<44}{result.hash_ms:>10.2f}"
+            f"{result.hashes_per_second:>10.2f}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.hashing", description=__doc__.splitlines()[0]
+    )
+    parser.add_argument(
+        "--bcrypt-rounds",
+        type=int,
+        nargs="*",
+        default=[10, 11, 12],
+        help="Раунды bcrypt (пустой список - без bcrypt)",
+    )
+    parser.add_argument(
+        "--argon2-time-cost",
+        type=int,
+        nargs="*",
+        default=[1, 2, 3],
+        help="Проходы argon2id (пустой список - без argon2)",
+    )
+    parser.add_argument(
+        "--argon2-memory-cost",
+        type=int,
+        default=settings.PASSWORD_ARGON2_MEMORY_COST,
+        help="Память argon2id в КиБ",
+    )
+    parser.add_argument(
+        "--argon2-parallelism",
+        type=int,
+        default=settings.PASSWORD_ARGON2_PARALLELISM,
+        help="Параллелизм argon2id",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=settings.PASSWORD_HASH_WORKERS,
+        help="Потоков пула",
+    )
+    parser.add_argument(
+        "--hashes", type=int, default=20, help="Хешей на комбинацию в пуле"
+    )
+    parser.add_argument("--output", help="Файл для JSON-отчета")
+    args = parser.parse_args(argv)
+
+    combinations = [("bcrypt", {"bcrypt_rounds": r}) for r in args.bcrypt_rounds]
+    combinations += [
+        (
+            "argon2",
+            {
+                "argon2_time_cost": t,
+                "argon2_memory_cost": args.argon2_memory_cost,
+                "argon2_parallelism": args.argon2_parallelism,
+            },
+        )
+        for t in args.argon2_time_cost
+    ]
+    results: List[HashingResult] = []
+    missing = set()
+    for scheme, cost in combinations:
+        if scheme in missing:
+            continue
+        try:
+            results.append(measure(scheme, cost, args.hashes, args.workers))
+        except MissingBackendError:
+            print(f"== {scheme}: пропущено, нет бэкенда", file=sys.stderr)
+            missing.add(scheme)
+    print(format_results(results))
+    if args.output:
+        with open(args.output, "wb") as file:
+            file.write(msgspec.json.format(msgspec.json.encode(results)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,133 @@
+"""Задержка при перегрузке без защиты, со сбросом нагрузки и лимитом частоты.
+
+Сценарий ``overload`` (30% POST /users с bcrypt) выполняется с числом
+клиентов, заметно превышающим пул хеширования и пул соединений. Для
+каждой конфигурации бенчмарк запускается отдельным процессом с
+переменными окружения ``MAX_IN_FLIGHT_REQUESTS`` и ``RATE_LIMIT_*``
+(настройки читаются при импорте приложения)::
+
+    python -m benchmarks.overload --database-url sqlite+aiosqlite:///b.sqlite3 \\
+        --create-schema --users 10000 --concurrency 200 --max-in-flight 16
+
+Без защиты задержка принятых запросов растет вместе с очередью; при
+сбросе нагрузки часть запросов быстро получает 503, а p99 принятых
+остается ограниченным. Лимит частоты действует только на изменяющие
+запросы (здесь POST /users). В режиме в процессе все клиенты имеют один
+адрес, поэтому он действует как общий лимит маршрута.
+Остальные аргументы передаются ``python -m benchmarks`` без изменений.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from typing import Dict, List, Optional
+
+from benchmarks.report import BenchmarkReport, load_report
+
+
+def configurations(
+    max_in_flight: int, rate: float, burst: int
+) -> Dict[str, Dict[str, str]]:
+    """Имя конфигурации и переменные окружения приложения."""
+    unprotected = {"MAX_IN_FLIGHT_REQUESTS": "0", "RATE_LIMIT_BACKEND": "none"}
+    return {
+        "unprotected": unprotected,
+        "shed": {**unprotected, "MAX_IN_FLIGHT_REQUESTS": str(max_in_flight)},
+        "rate-limited": {
+            **unprotected,
+            "RATE_LIMIT_BACKEND": "memory",
+            "RATE_LIMIT_RATE": str(rate),
+            "RATE_LIMIT_BURST": str(burst),
+        },
+    }
+
+
+def format_comparison(reports: Dict[str, BenchmarkReport]) -> str:
+    """Таблица задержек принятых запросов и отказов по конфигурациям."""
+    lines = [
+        f"{'config':<14}{'operation':<14}{'rps':>9}{'p50 ms':>10}{'p99 ms':>10}"
+        f"{'max ms':>10}{'rejected':>10}{'rej p99':>10}"
+    ]
+    for name, report in reports.items():
+        for scenario in report.scenarios:
+            operations = scenario.operations or {scenario.name: scenario.total}
+            for label, stats in {"total": scenario.total, **operations}.items():
+                rejected_p99 = (
+                    f"{stats.rejected_latency_ms.p99:.2f}"
+                    if stats.rejected_latency_ms
+                    else "-"
+                )
+                lines.append(
+                    f"{name:<14}{label:<14}{stats.rps:>9.1f}"
+                    f"{stats.latency_ms.p50:>10.2f}{stats.latency_ms.p99:>10.2f}"
+                    f"{stats.latency_ms.max:>10.2f}{stats.rejected:>10}"
+                    f"{rejected_p99:>10}"
+                )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.overload", description=__doc__.splitlines()[0]
+    )
+    parser.add_argument(
+        "--max-in-flight",
+        type=int,
+        default=16,
+        help="MAX_IN_FLIGHT_REQUESTS конфигурации shed",
+    )
+    parser.add_argument(
+        "--rate", type=float, default=50.0, help="RATE_LIMIT_RATE для rate-limited"
+    )
+    parser.add_argument(
+        "--burst", type=int, default=50, help="RATE_LIMIT_BURST для rate-limited"
+    )
+    parser.add_argument(
+        "--concurrency", type=int, default=200, help="Параллельных клиентов"
+    )
+    parser.add_argument(
+        "--output-dir", default=".", help="Каталог для отчетов <конфигурация>.json"
+    )
+    parser.add_argument(
+        "--no-seed", action="store_true", help="Не пересоздавать пользователей"
+    )
+    args, benchmark_args = parser.parse_known_args(argv)
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    seeded = args.no_seed
+    exit_code = 0
+    reports: Dict[str, BenchmarkReport] = {}
+    for name, config in configurations(
+        args.max_in_flight, args.rate, args.burst
+    ).items():
+        env = {**os.environ, **config}
+        output = os.path.join(args.output_dir, f"{name}.json")
+        if os.path.exists(output):
+            os.remove(output)
+        command = [
+            sys.executable,
+            "-m",
+            "benchmarks",
+            "--scenario",
+            "overload",
+            "--concurrency",
+            str(args.concurrency),
+            "--output",
+            output,
+        ]
+        command += (["--no-seed"] if seeded else []) + benchmark_args
+        print(f"== {name}", file=sys.stderr)
+        code = subprocess.run(command, env=env).returncode
+        # Схема и пользователи создаются только при первом прогоне
+        benchmark_args = [arg for arg in benchmark_args if arg != "--create-schema"]
+        seeded = True
+        exit_code = max(exit_code, code)
+        if os.path.exists(output):
+            reports[name] = load_report(output)
+    print(format_comparison(reports))
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
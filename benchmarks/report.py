@@ -0,0 +1,127 @@
+from typing import Any, Dict, List, Optional
+
+import msgspec
+
+from benchmarks.runner import OperationStats, ScenarioResult
+
+
+class BenchmarkReport(msgspec.Struct):
+    """Отчет прогона бенчмарков.
+
+    Attributes:
+        mode: ``in-process`` или ``server``.
+        target: Адрес сервера или диалект базы данных при запуске в процессе.
+        users: Количество пользователей в таблице перед прогоном.
+        requests: Количество измеряемых запросов на сценарий.
+        concurrency: Количество параллельных клиентов.
+        started_at: Время начала прогона (ISO 8601, UTC).
+        settings: Настройки приложения, влияющие на производительность
+            (только при запуске в процессе).
+        scenarios: Результаты сценариев.
+    """
+
+    mode: str
+    target: str
+    users: int
+    requests: int
+    concurrency: int
+    started_at: str
+    scenarios: List[ScenarioResult]
+    settings: Dict[str, Any] = {}
+
+
+def load_report(path: str) -> BenchmarkReport:
+    """Читает отчет из JSON-файла."""
+    with open(path, "rb") as file:
+        return msgspec.json.decode(file.read(), type=BenchmarkReport)
+
+
+def save_report(report: BenchmarkReport, path: str) -> None:
+    """Сохраняет отчет в JSON-файл."""
+    with open(path, "wb") as file:
+        file.write(msgspec.json.format(msgspec.json.encode(report)))
+
+
+def _compare_stats(
+    name: str, current: OperationStats, baseline: OperationStats, tolerance: float
+) -> List[str]:
+    regressions: List[str] = []
+    if current.rps < baseline.rps * (1 - tolerance):
+        regressions.append(f"{name}: RPS {current.rps} < {baseline.rps} (базовый)")
+    if current.latency_ms.p99 > baseline.latency_ms.p99 * (1 + tolerance):
+        regressions.append(
+            f"{name}: p99 {current.latency_ms.p99} мс > "
+            f"{baseline.latency_ms.p99} мс (базовый)"
+        )
+    # Количество SQL-запросов детерминировано, поэтому допуск минимальный
+    if (
+        current.db_statements is not None
+        and baseline.db_statements is not None
+        and current.db_statements > baseline.db_statements + 0.01
+    ):
+        regressions.append(
+            f"{name}: SQL-запросов на запрос {current.db_statements} > "
+            f"{baseline.db_statements} (базовый)"
+        )
+    if current.errors > baseline.errors:
+        regressions.append(
+            f"{name}: ошибок {current.errors} > {baseline.errors} (базовый)"
+        )
+    return regressions
+
+
+def compare_reports(
+    report: BenchmarkReport, baseline: BenchmarkReport, tolerance: float
+) -> List[str]:
+    """Сравнивает отчет с базовым и возвращает найденные регрессии.
+
+    Регрессией считается падение RPS или рост p99 больше чем на
+    ``tolerance``, рост количества SQL-запросов на запрос и рост
+    количества ошибок. Сценарии, отсутствующие в одном из отчетов,
+    не сравниваются.
+
+    Args:
+        report: Текущий отчет.
+        baseline: Базовый отчет.
+        tolerance: Допустимое относительное отклонение (0.1 - 10%).
+
+    Returns:
+        List[str]: Описания регрессий; пустой список, если их нет.
+    """
+    baseline_scenarios = {scenario.name: scenario for scenario in baseline.scenarios}
+    regressions: List[str] = []
+    for scenario in report.scenarios:
+        base: Optional[ScenarioResult] = baseline_scenarios.get(scenario.name)
+        if base is None:
+            continue
+        regressions.extend(
+            _compare_stats(scenario.name, scenario.total, base.total, tolerance)
+        )
+    return regressions
+
+
+def format_summary(report: BenchmarkReport) -> str:
+    """Краткая таблица результатов для вывода в консоль."""
+    lines = [
+        f"{'scenario':<26}{'rps':>10}{'p50 ms':>10}{'p95 ms':>10}"
+        f"{'p99 ms':>10}{'sql/req':>9}{'bytes':>10}{'cpu ms':>8}{'errors':>8}"
+        f"{'rejected':>10}"
+    ]
+    for scenario in report.scenarios:
+        total = scenario.total
+        statements = (
+            "-" if total.db_statements is None else f"{total.db_statements:.2f}"
+        )
+        size = "-" if total.response_bytes is None else f"{total.response_bytes:.0f}"
+        cpu = (
+            "-"
+            if scenario.cpu_ms_per_request is None
+            else f"{scenario.cpu_ms_per_request:.2f}"
+        )
+        lines.append(
+            f"{scenario.name:<26}{total.rps:>10.1f}{total.latency_ms.p50:>10.2f}"
+            f"{total.latency_ms.p95:>10.2f}{total.latency_ms.p99:>10.2f}"
+            f"{statements:>9}{size:>10}{cpu:>8}{total.errors:>8}"
+            f"{total.rejected:>10}"
+        )
+    return "\n".join(lines)
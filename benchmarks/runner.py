@@ -0,0 +1,287 @@
+import asyncio
+import itertools
+import re
+import time
+from collections import defaultdict
+from typing import Any, Dict, Iterator, List, Optional, Protocol, Tuple
+
+import httpx
+import msgspec
+
+from benchmarks.scenarios import Scenario, ScenarioContext, ScenarioExhausted
+
+# Элемент заголовка Server-Timing: имя, длительность и описание
+SERVER_TIMING_RE = re.compile(r'(\w+);dur=([\d.]+)(?:;desc="(\d+) queries")?')
+
+# Коды быстрого отказа при перегрузке: лимит частоты и сброс нагрузки
+REJECTED_STATUSES = (429, 503)
+
+
+class Client(Protocol):
+    """HTTP-клиент с интерфейсом ``httpx.AsyncClient``."""
+
+    async def request(self, method: str, url: str, **kwargs: Any) -> httpx.Response: ...
+
+
+class LatencyStats(msgspec.Struct):
+    """Задержки ответов в миллисекундах."""
+
+    mean: float
+    p50: float
+    p95: float
+    p99: float
+    max: float
+
+
+class OperationStats(msgspec.Struct):
+    """Результаты одной операции сценария.
+
+    Attributes:
+        requests: Количество выполненных запросов.
+        errors: Запросы с неожиданным кодом ответа или ошибкой соединения.
+        rps: Запросов в секунду за время сценария.
+        latency_ms: Задержки успешных ответов.
+        db_statements: Среднее количество SQL-запросов на запрос (по
+            ``Server-Timing``; None, если сервер не отдает заголовок).
+        server_timing_ms: Средняя длительность этапов из ``Server-Timing``.
+        response_bytes: Средний размер тела ответа в байтах в том виде,
+            в котором он передан (после сжатия).
+        rejected: Запросы, отклоненные сервером с кодом 429 или 503
+            (не считаются ошибками).
+        rejected_latency_ms: Задержки отказов (None, если отказов не было).
+    """
+
+    requests: int
+    errors: int
+    rps: float
+    latency_ms: LatencyStats
+    db_statements: Optional[float] = None
+    server_timing_ms: Dict[str, float] = {}
+    response_bytes: Optional[float] = None
+    rejected: int = 0
+    rejected_latency_ms: Optional[LatencyStats] = None
+
+
+class ScenarioResult(msgspec.Struct):
+    """Результаты сценария.
+
+    Attributes:
+        name: Имя сценария.
+        description: Описание сценария.
+        concurrency: Количество параллельных клиентов.
+        duration: Длительность измерения в секундах.
+        total: Показатели по всем запросам сценария.
+        operations: Показатели по операциям смешанных сценариев.
+        cpu_ms_per_request: Процессорное время процесса бенчмарка на запрос
+            в миллисекундах (только при запуске приложения в процессе,
+            включает и клиент).
+    """
+
+    name: str
+    description: str
+    concurrency: int
+    duration: float
+    total: OperationStats
+    operations: Dict[str, OperationStats] = {}
+    cpu_ms_per_request: Optional[float] = None
+
+
+class _Samples:
+    """Накопленные измерения одной операции."""
+
+    def __init__(self) -> None:
+        self.latencies: List[float] = []
+        self.errors = 0
+        self.rejected: List[float] = []
+        self.statements: List[int] = []
+        self.sizes: List[int] = []
+        self.timings: Dict[str, List[float]] = defaultdict(list)
+
+    def add_response(self, latency: float, response: httpx.Response) -> None:
+        self.latencies.append(latency)
+        self.sizes.append(response.num_bytes_downloaded)
+        for name, duration, statements in SERVER_TIMING_RE.findall(
+            response.headers.get("server-timing", "")
+        ):
+            self.timings[name].append(float(duration))
+            if statements:
+                self.statements.append(int(statements))
+
+    def merge(self, other: "_Samples") -> None:
+        self.latencies.extend(other.latencies)
+        self.errors += other.errors
+        self.rejected.extend(other.rejected)
+        self.statements.extend(other.statements)
+        self.sizes.extend(other.sizes)
+        for name, values in other.timings.items():
+            self.timings[name].extend(values)
+
+    def stats(self, duration: float) -> OperationStats:
+        requests = len(self.latencies) + len(self.rejected) + self.errors
+        return OperationStats(
+            requests=requests,
+            errors=self.errors,
+            rps=round(requests / duration, 2) if duration else 0.0,
+            latency_ms=latency_stats(self.latencies),
+            db_statements=(
+                round(sum(self.statements) / len(self.statements), 3)
+                if self.statements
+                else None
+            ),
+            server_timing_ms={
+                name: round(sum(values) / len(values), 3)
+                for name, values in sorted(self.timings.items())
+            },
+            response_bytes=(
+                round(sum(self.sizes) / len(self.sizes), 1) if self.sizes else None
+            ),
+            rejected=len(self.rejected),
+            rejected_latency_ms=(
+                latency_stats(self.rejected) if self.rejected else None
+            ),
+        )
+
+
+def _round_ms(seconds: float) -> float:
+    return round(seconds * 1000, 3)
+
+
+def latency_stats(latencies: List[float]) -> LatencyStats:
+    """Сводка задержек в миллисекундах.
+
+    Args:
+        latencies: Задержки в секундах.
+
+    Returns:
+        LatencyStats: Среднее, перцентили и максимум.
+    """
+    latencies = sorted(latencies)
+    return LatencyStats(
+        mean=_round_ms(sum(latencies) / len(latencies)) if latencies else 0.0,
+        p50=_round_ms(percentile(latencies, 50)),
+        p95=_round_ms(percentile(latencies, 95)),
+        p99=_round_ms(percentile(latencies, 99)),
+        max=_round_ms(latencies[-1]) if latencies else 0.0,
+    )
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """Перцентиль по методу ближайшего ранга.
+
+    Args:
+        sorted_values: Значения по возрастанию.
+        q: Перцентиль от 0 до 100.
+
+    Returns:
+        float: Значение перцентиля или 0 для пустого списка.
+    """
+    if not sorted_values:
+        return 0.0
+    rank = max(int(-(-q * len(sorted_values) // 100)), 1)
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def scenario_requests(
+    scenario: Scenario, requests: int, warmup: int
+) -> Tuple[int, int]:
+    """Измеряемые и прогревочные запросы с учетом ``max_requests`` сценария.
+
+    Returns:
+        Tuple[int, int]: Количество измеряемых и прогревочных запросов.
+    """
+    if scenario.max_requests is not None:
+        requests = min(requests, scenario.max_requests)
+        warmup = min(warmup, scenario.max_requests // 10)
+    return requests, warmup
+
+
+async def run_scenario(
+    client: Client,
+    scenario: Scenario,
+    ctx: ScenarioContext,
+    requests: int,
+    concurrency: int,
+    warmup: int = 0,
+    measure_cpu: bool = False,
+) -> ScenarioResult:
+    """Выполняет сценарий в замкнутом цикле с ``concurrency`` клиентами.
+
+    Каждый клиент отправляет следующий запрос сразу после ответа на
+    предыдущий. Прогревочные запросы не попадают в результаты.
+
+    Args:
+        client: HTTP-клиент.
+        scenario: Сценарий.
+        ctx: Общее состояние сценариев.
+        requests: Количество измеряемых запросов.
+        concurrency: Количество параллельных клиентов.
+        warmup: Количество прогревочных запросов.
+        measure_cpu: Измерять процессорное время процесса на запрос (имеет
+            смысл, только если приложение выполняется в этом же процессе).
+
+    Returns:
+        ScenarioResult: Результаты сценария.
+    """
+    requests, warmup = scenario_requests(scenario, requests, warmup)
+    samples: Dict[str, _Samples] = defaultdict(_Samples)
+
+    async def worker(counter: Iterator[int], total: int, record: bool) -> None:
+        while next(counter) < total:
+            try:
+                operation = scenario.build(ctx)
+            except ScenarioExhausted:
+                return
+            started = time.perf_counter()
+            try:
+                response = await client.request(
+                    operation.method,
+                    operation.url,
+                    params=operation.params,
+                    json=operation.json,
+                )
+            except httpx.HTTPError:
+                if record:
+                    samples[operation.label].errors += 1
+                continue
+            latency = time.perf_counter() - started
+            if operation.on_response is not None:
+                operation.on_response(response)
+            if not record:
+                continue
+            if response.status_code == operation.expected_status:
+                samples[operation.label].add_response(latency, response)
+            elif response.status_code in REJECTED_STATUSES:
+                samples[operation.label].rejected.append(latency)
+            else:
+                samples[operation.label].errors += 1
+
+    workers = max(min(concurrency, requests), 1)
+    if warmup:
+        counter = itertools.count()
+        await asyncio.gather(*(worker(counter, warmup, False) for _ in range(workers)))
+    counter = itertools.count()
+    started = time.perf_counter()
+    cpu_started = time.process_time()
+    await asyncio.gather(*(worker(counter, requests, True) for _ in range(workers)))
+    duration = time.perf_counter() - started
+    cpu_time = time.process_time() - cpu_started
+
+    total = _Samples()
+    for operation_samples in samples.values():
+        total.merge(operation_samples)
+    completed = len(total.latencies) + len(total.rejected) + total.errors
+    return ScenarioResult(
+        name=scenario.name,
+        description=scenario.description,
+        concurrency=workers,
+        duration=round(duration, 3),
+        total=total.stats(duration),
+        operations=(
+            {label: s.stats(duration) for label, s in sorted(samples.items())}
+            if len(samples) > 1
+            else {}
+        ),
+        cpu_ms_per_request=(
+            _round_ms(cpu_time / completed) if measure_cpu and completed else None
+        ),
+    )
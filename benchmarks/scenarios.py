@@ -0,0 +1,386 @@
+import itertools
+import random
+from typing import Any, Callable, Dict, List, Optional
+
+import httpx
+import msgspec
+
+from benchmarks.seed import FIRST_NAMES, SURNAMES
+
+
+class ScenarioExhausted(Exception):
+    """Сценарию больше не из чего строить запросы (например, некого удалять)."""
+
+
+class Operation(msgspec.Struct):
+    """Один HTTP-запрос сценария.
+
+    Attributes:
+        label: Имя операции в отчете.
+        method: HTTP-метод.
+        url: Путь запроса.
+        params: Параметры строки запроса.
+        json: Тело запроса.
+        expected_status: Ожидаемый код ответа; остальные считаются ошибками.
+        on_response: Обработчик ответа (например, сохранение курсора).
+    """
+
+    label: str
+    method: str
+    url: str
+    params: Optional[Dict[str, Any]] = None
+    json: Any = None
+    expected_status: int = 200
+    on_response: Optional[Callable[[httpx.Response], None]] = None
+
+
+class ScenarioContext:
+    """Общее состояние сценариев одного прогона.
+
+    Attributes:
+        ids: Идентификаторы существующих пользователей.
+        rnd: Генератор случайных чисел с фиксированным зерном.
+        cursor: Последний полученный курсор списка.
+    """
+
+    def __init__(self, ids: List[int], seed: int = 42) -> None:
+        self.ids = ids
+        self.rnd = random.Random(seed)
+        self.cursor: Optional[str] = None
+        self._counter = itertools.count()
+        # Удаляемые пользователи берутся с конца, чтобы не пересекаться
+        # с чтением и обновлением случайных пользователей из начала
+        self._deletable = list(reversed(ids[len(ids) // 2 :]))
+        self._deleted = 0
+
+    def random_id(self) -> int:
+        """Случайный идентификатор из первой половины пользователей."""
+        return self.ids[self.rnd.randrange(max(len(self.ids) // 2, 1))]
+
+    def hot_id(self) -> int:
+        """Идентификатор из небольшого горячего набора (попадания в кэш)."""
+        return self.ids[self.rnd.randrange(min(len(self.ids), 100))]
+
+    def deletable_id(self) -> int:
+        """Следующий идентификатор для удаления.
+
+        Raises:
+            ScenarioExhausted: Если удалены все отведенные пользователи.
+        """
+        return self.deletable_ids(1)[0]
+
+    def deletable_ids(self, count: int) -> List[int]:
+        """Следующие идентификаторы для удаления (не больше ``count``).
+
+        Raises:
+            ScenarioExhausted: Если удалены все отведенные пользователи.
+        """
+        ids = self.upcoming_deletable_ids(count)
+        if not ids:
+            raise ScenarioExhausted("Закончились пользователи для удаления")
+        self._deleted += len(ids)
+        return ids
+
+    def upcoming_deletable_ids(self, count: int) -> List[int]:
+        """Идентификаторы, которые будут удалены следующими, без их выдачи."""
+        return self._deletable[self._deleted : self._deleted + count]
+
+    def reset_deletable(self) -> None:
+        """Снова выдает удаленные идентификаторы после восстановления строк."""
+        self._deleted = 0
+
+    def new_user(self) -> Dict[str, str]:
+        """Тело запроса создания пользователя с уникальной фамилией."""
+        return {
+            "name": self.rnd.choice(FIRST_NAMES),
+            "surname": f"{self.rnd.choice(SURNAMES)}-bench{next(self._counter)}",
+            "password": "benchmark-password",
+        }
+
+    def save_cursor(self, response: httpx.Response) -> None:
+        """Запоминает курсор следующей страницы (с начала после последней)."""
+        self.cursor = response.headers.get("x-next-cursor")
+
+
+class Scenario(msgspec.Struct):
+    """Сценарий нагрузки.
+
+    Attributes:
+        name: Имя сценария.
+        description: Что измеряет сценарий.
+        build: Функция, возвращающая очередную операцию.
+        max_requests: Ограничение количества запросов для тяжелых
+            сценариев (bcrypt, выгрузка всей таблицы).
+        mutates: Сценарий изменяет данные; такие сценарии выполняются
+            после сценариев чтения.
+        deletes: Пользователей, удаляемых одним запросом; удаленные
+            строки восстанавливаются в базе после сценария.
+    """
+
+    name: str
+    description: str
+    build: Callable[[ScenarioContext], Operation]
+    max_requests: Optional[int] = None
+    mutates: bool = False
+    deletes: int = 0
+
+
+def _list_users(label: str, **params: Any) -> Callable[[ScenarioContext], Operation]:
+    return lambda ctx: Operation(label, "GET", "/users", params=params)
+
+
+def _list_users_cursor(ctx: ScenarioContext) -> Operation:
+    params: Dict[str, Any] = {"page_size": 100, "order_by": "created_at"}
+    if ctx.cursor:
+        params["cursor"] = ctx.cursor
+    return Operation(
+        "list_cursor", "GET", "/users", params=params, on_response=ctx.save_cursor
+    )
+
+
+def _get_under_post_load(ctx: ScenarioContext) -> Operation:
+    # Каждый десятый запрос - создание пользователя (bcrypt в пуле воркеров)
+    if ctx.rnd.random() < 0.1:
+        return Operation(
+            "create_user", "POST", "/users", json=ctx.new_user(), expected_status=201
+        )
+    return Operation("get_user", "GET", f"/users/{ctx.random_id()}")
+
+
+def _overload(ctx: ScenarioContext) -> Operation:
+    # Треть запросов - создание пользователя: пул хеширования и пул
+    # соединений насыщаются, и запросы сверх них ждут в очередях
+    if ctx.rnd.random() < 0.3:
+        return Operation(
+            "create_user", "POST", "/users", json=ctx.new_user(), expected_status=201
+        )
+    return Operation("get_user", "GET", f"/users/{ctx.random_id()}")
+
+
+def _bulk_update(ctx: ScenarioContext) -> Operation:
+    items = [
+        {"id": ctx.random_id(), "surname": f"{ctx.rnd.choice(SURNAMES)}-upd"}
+        for _ in range(100)
+    ]
+    return Operation("bulk_update", "PATCH", "/users/bulk", json=items)
+
+
+def _bulk_delete(ctx: ScenarioContext) -> Operation:
+    return Operation(
+        "bulk_delete", "DELETE", "/users/bulk", json={"ids": ctx.deletable_ids(100)}
+    )
+
+
+SCENARIOS: List[Scenario] = [
+    Scenario(
+        "get_user",
+        "GET /users/{id} по случайным пользователям",
+        lambda ctx: Operation("get_user", "GET", f"/users/{ctx.random_id()}"),
+    ),
+    Scenario(
+        "get_user_hot",
+        "GET /users/{id} по 100 горячим пользователям (кэш чтения)",
+        lambda ctx: Operation("get_user_hot", "GET", f"/users/{ctx.hot_id()}"),
+    ),
+    Scenario(
+        "list_10", "GET /users, страница 10 строк", _list_users("list_10", page_size=10)
+    ),
+    Scenario(
+        "list_100",
+        "GET /users, страница 100 строк",
+        _list_users("list_100", page_size=100),
+    ),
+    Scenario(
+        "list_deep_page",
+        "GET /users, OFFSET-пагинация на 100-й странице",
+        _list_users("list_deep_page", page_size=100, page=100),
+    ),
+    Scenario(
+        "list_cursor", "GET /users, проход по курсору X-Next-Cursor", _list_users_cursor
+    ),
+    Scenario(
+        "search_name_exact",
+        "GET /users?name=..., точное совпадение (низкая селективность)",
+        lambda ctx: Operation(
+            "search_name_exact",
+            "GET",
+            "/users",
+            params={"name": ctx.rnd.choice(FIRST_NAMES)},
+        ),
+    ),
+    Scenario(
+        "search_surname_prefix",
+        "GET /users?surname=...&surname_match=prefix",
+        lambda ctx: Operation(
+            "search_surname_prefix",
+            "GET",
+            "/users",
+            params={
+                "surname": f"{ctx.rnd.choice(SURNAMES)}{ctx.rnd.randrange(10)}",
+                "surname_match": "prefix",
+            },
+        ),
+    ),
+    Scenario(
+        "search_surname_contains",
+        "GET /users?surname=...&surname_match=contains",
+        lambda ctx: Operation(
+            "search_surname_contains",
+            "GET",
+            "/users",
+            params={
+                "surname": f"ov{ctx.rnd.randrange(100):02d}",
+                "surname_match": "contains",
+            },
+        ),
+    ),
+    Scenario(
+        "count_exact",
+        "GET /users?count=exact",
+        _list_users("count_exact", count="exact"),
+    ),
+    Scenario(
+        "count_estimated",
+        "GET /users?count=estimated",
+        _list_users("count_estimated", count="estimated"),
+    ),
+    Scenario(
+        "count_cached",
+        "GET /users?count=cached",
+        _list_users("count_cached", count="cached"),
+    ),
+    Scenario(
+        "export_ndjson",
+        "GET /users/export, потоковая выгрузка всей таблицы",
+        lambda ctx: Operation("export_ndjson", "GET", "/users/export"),
+        max_requests=5,
+    ),
+    Scenario(
+        "create_user",
+        "POST /users (хеширование bcrypt)",
+        lambda ctx: Operation(
+            "create_user", "POST", "/users", json=ctx.new_user(), expected_status=201
+        ),
+        max_requests=200,
+        mutates=True,
+    ),
+    Scenario(
+        "signup_spike",
+        "POST /users с низкой стоимостью bcrypt: вставка и коммит на запрос",
+        lambda ctx: Operation(
+            "create_user", "POST", "/users", json=ctx.new_user(), expected_status=201
+        ),
+        max_requests=2000,
+        mutates=True,
+    ),
+    Scenario(
+        "get_under_post_load",
+        "GET /users/{id} при 10% параллельных POST /users",
+        _get_under_post_load,
+        max_requests=1000,
+        mutates=True,
+    ),
+    Scenario(
+        "overload",
+        "GET /users/{id} при 30% POST /users (запускать с большим --concurrency)",
+        _overload,
+        max_requests=1000,
+        mutates=True,
+    ),
+    Scenario(
+        "bulk_create",
+        "POST /users/bulk по 20 пользователей",
+        lambda ctx: Operation(
+            "bulk_create",
+            "POST",
+            "/users/bulk",
+            json=[ctx.new_user() for _ in range(20)],
+            expected_status=201,
+        ),
+        max_requests=10,
+        mutates=True,
+    ),
+    Scenario(
+        "update_user",
+        "PUT /users/{id} без смены пароля",
+        lambda ctx: Operation(
+            "update_user",
+            "PUT",
+            f"/users/{ctx.random_id()}",
+            json={
+                "name": ctx.rnd.choice(FIRST_NAMES),
+                "surname": None,
+                "password": None,
+            },
+        ),
+        mutates=True,
+    ),
+    Scenario(
+        "patch_user",
+        "PATCH /users/{id} с новой фамилией "
+        "(SELECT + UPDATE ... WHERE updated_at IN (...))",
+        lambda ctx: Operation(
+            "patch_user",
+            "PATCH",
+            f"/users/{ctx.random_id()}",
+            json={"surname": f"{ctx.rnd.choice(SURNAMES)}-patch{ctx.rnd.random()}"},
+        ),
+        mutates=True,
+    ),
+    Scenario(
+        "patch_user_noop",
+        "Повторный PATCH /users/{id} с теми же значениями (без UPDATE)",
+        lambda ctx: Operation(
+            "patch_user_noop",
+            "PATCH",
+            f"/users/{ctx.hot_id()}",
+            json={"surname": "unchanged"},
+        ),
+        mutates=True,
+    ),
+    Scenario(
+        "bulk_update",
+        "PATCH /users/bulk по 100 пользователей",
+        _bulk_update,
+        max_requests=100,
+        mutates=True,
+    ),
+    Scenario(
+        "delete_user",
+        "DELETE /users/{id}",
+        lambda ctx: Operation(
+            "delete_user", "DELETE", f"/users/{ctx.deletable_id()}", expected_status=204
+        ),
+        mutates=True,
+        deletes=1,
+    ),
+    Scenario(
+        "bulk_delete",
+        "DELETE /users/bulk по 100 пользователей",
+        _bulk_delete,
+        max_requests=100,
+        mutates=True,
+        deletes=100,
+    ),
+]
+
+
+def select_scenarios(names: Optional[List[str]]) -> List[Scenario]:
+    """Выбирает сценарии по именам, сохраняя порядок выполнения.
+
+    Args:
+        names: Имена сценариев или None для всех.
+
+    Returns:
+        List[Scenario]: Сценарии чтения, затем изменяющие данные.
+
+    Raises:
+        ValueError: Если указан неизвестный сценарий.
+    """
+    if names:
+        known = {scenario.name for scenario in SCENARIOS}
+        unknown = sorted(set(names) - known)
+        if unknown:
+            raise ValueError(f"Неизвестные сценарии: {', '.join(unknown)}")
+    selected = [s for s in SCENARIOS if not names or s.name in names]
+    return sorted(selected, key=lambda scenario: scenario.mutates)
@@ -0,0 +1,215 @@
+import random
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+from sqlalchemy import delete, insert, select, text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.core.security import password_hasher
+from src.db.models import User
+
+# Имена и фамилии латиницей: lower() в SQLite работает только с ASCII
+FIRST_NAMES = (
+    "Alexander",
+    "Anna",
+    "Boris",
+    "Daria",
+    "Dmitry",
+    "Elena",
+    "Fedor",
+    "Galina",
+    "Igor",
+    "Irina",
+    "Kirill",
+    "Ksenia",
+    "Leonid",
+    "Maria",
+    "Maxim",
+    "Natalia",
+    "Nikolai",
+    "Olga",
+    "Pavel",
+    "Polina",
+    "Roman",
+    "Sofia",
+    "Sergey",
+    "Tatiana",
+    "Timur",
+    "Ulyana",
+    "Vadim",
+    "Vera",
+    "Yuri",
+    "Zoya",
+)
+SURNAMES = (
+    "Ivanov",
+    "Smirnov",
+    "Kuznetsov",
+    "Popov",
+    "Vasiliev",
+    "Petrov",
+    "Sokolov",
+    "Mikhailov",
+    "Novikov",
+    "Fedorov",
+    "Morozov",
+    "Volkov",
+    "Alekseev",
+    "Lebedev",
+    "Semenov",
+    "Egorov",
+    "Pavlov",
+    "Kozlov",
+    "Stepanov",
+    "Nikolaev",
+)
+
+# Пароль всех сгенерированных пользователей
+SEED_PASSWORD = "benchmark-password"
+
+# Период регистрации сгенерированных пользователей до момента заполнения
+SEED_PERIOD = timedelta(days=365)
+
+
+def generate_users(
+    count: int,
+    password_hash: str,
+    seed: int = 42,
+    now: Optional[datetime] = None,
+    period: timedelta = SEED_PERIOD,
+) -> Iterator[Dict[str, Any]]:
+    """Генерирует строки пользователей с воспроизводимым распределением имен.
+
+    Имена берутся из небольшого словаря (низкая селективность точного
+    поиска), фамилии дополняются числовым суффиксом (высокая
+    селективность поиска по префиксу и подстроке). Даты создания
+    возрастают вместе с id и распределены по ``period`` до ``now``:
+    значение по умолчанию дало бы всем строкам одной вставки
+    одинаковый ``created_at``.
+
+    Args:
+        count: Количество пользователей.
+        password_hash: Хеш пароля, общий для всех строк.
+        seed: Зерно генератора случайных чисел.
+        now: Конец периода (UTC без часового пояса); по умолчанию
+            текущее время.
+        period: Длительность периода регистрации.
+
+    Yields:
+        Dict[str, Any]: Значения колонок для INSERT.
+    """
+    rnd = random.Random(seed)
+    if now is None:
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+    start = now - period
+    step = period / max(count, 1)
+    for index in range(count):
+        created_at = start + step * (index + rnd.random())
+        yield {
+            "name": rnd.choice(FIRST_NAMES),
+            "surname": f"{rnd.choice(SURNAMES)}{rnd.randrange(10000):04d}",
+            "password": password_hash,
+            "created_at": created_at,
+            "updated_at": created_at,
+        }
+
+
+async def create_schema(engine: AsyncEngine) -> None:
+    """Создает таблицы по моделям (для SQLite и пустых баз без миграций)."""
+    async with engine.begin() as connection:
+        await connection.run_sync(User.metadata.create_all)
+
+
+async def seed_users(engine: AsyncEngine, count: int, batch_size: int = 5000) -> None:
+    """Заполняет таблицу пользователей заново.
+
+    Существующие строки удаляются. Пароль хешируется один раз: bcrypt
+    на каждую строку сделал бы заполнение миллиона строк неприемлемо
+    долгим. В PostgreSQL после вставки обновляется статистика, чтобы
+    оценочный подсчет (``count=estimated``) работал сразу.
+
+    Args:
+        engine: Асинхронный движок SQLAlchemy.
+        count: Количество пользователей.
+        batch_size: Размер пачки строк одного INSERT.
+    """
+    password_hash = await password_hasher.hash(SEED_PASSWORD)
+    is_postgresql = engine.dialect.name == "postgresql"
+    async with engine.begin() as connection:
+        if is_postgresql:
+            await connection.execute(text('TRUNCATE "user" RESTART IDENTITY'))
+        else:
+            await connection.execute(delete(User))
+        batch: List[Dict[str, Any]] = []
+        for row in generate_users(count, password_hash):
+            batch.append(row)
+            if len(batch) >= batch_size:
+                await connection.execute(insert(User), batch)
+                batch = []
+        if batch:
+            await connection.execute(insert(User), batch)
+    if is_postgresql:
+        async with engine.connect() as connection:
+            await connection.execute(text('ANALYZE "user"'))
+            await connection.commit()
+
+
+async def load_user_ids(engine: AsyncEngine) -> List[int]:
+    """Идентификаторы существующих пользователей по возрастанию."""
+    async with engine.connect() as connection:
+        result = await connection.execute(select(User.id).order_by(User.id))
+        return list(result.scalars())
+
+
+async def load_users(
+    engine: AsyncEngine, ids: Sequence[int], batch_size: int = 5000
+) -> List[Dict[str, Any]]:
+    """Строки пользователей для восстановления после сценариев удаления.
+
+    Args:
+        engine: Асинхронный движок SQLAlchemy.
+        ids: Идентификаторы пользователей.
+        batch_size: Количество идентификаторов в одном условии IN.
+
+    Returns:
+        List[Dict[str, Any]]: Значения всех колонок найденных строк.
+    """
+    columns = list(User.__table__.columns)
+    rows: List[Dict[str, Any]] = []
+    async with engine.connect() as connection:
+        for start in range(0, len(ids), batch_size):
+            result = await connection.execute(
+                select(*columns).where(User.id.in_(ids[start : start + batch_size]))
+            )
+            rows.extend(dict(row) for row in result.mappings())
+    return rows
+
+
+async def restore_users(
+    engine: AsyncEngine, rows: Sequence[Dict[str, Any]], batch_size: int = 5000
+) -> int:
+    """Вставляет заново удаленные строки с прежними идентификаторами.
+
+    Строки, которые еще есть в таблице, пропускаются.
+
+    Args:
+        engine: Асинхронный движок SQLAlchemy.
+        rows: Строки, сохраненные :func:`load_users`.
+        batch_size: Размер пачки строк одного INSERT.
+
+    Returns:
+        int: Количество восстановленных строк.
+    """
+    restored = 0
+    async with engine.begin() as connection:
+        for start in range(0, len(rows), batch_size):
+            batch = rows[start : start + batch_size]
+            result = await connection.execute(
+                select(User.id).where(User.id.in_([row["id"] for row in batch]))
+            )
+            existing = set(result.scalars())
+            missing = [row for row in batch if row["id"] not in existing]
+            if missing:
+                await connection.execute(insert(User), missing)
+                restored += len(missing)
+    return restored
@@ -0,0 +1,193 @@
+"""Сравнение страницы пользователей через ORM-объекты и строки Core.
+
+Для каждого размера страницы измеряются два пути построения ответа
+``GET /users``:
+
+- ``orm`` - ``select(User)``, ORM-объекты и ``user_to_schema`` (путь
+  списка до перехода на строки Core);
+- ``core`` - ``select(*USER_SCHEMA_COLUMNS)`` и ``rows_to_schemas``.
+
+Функции вызываются напрямую, без HTTP и параметра ``page_size``. Время
+включает запрос к базе, построение схем и кодирование JSON общим
+кодировщиком ответов. Каждая итерация открывает новую сессию, чтобы ORM
+не брал объекты из identity map::
+
+    python -m benchmarks.serialization --database-url sqlite+aiosqlite:///b.sqlite3 \\
+        --create-schema --users 1000 --sizes 10 100 1000 --repeat 200
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from typing import Awaitable, Callable, Dict, List, Optional
+
+import msgspec
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import (AsyncSession, async_sessionmaker,
+                                    create_async_engine)
+
+from benchmarks.seed import create_schema, seed_users
+from src.core.config import settings
+from src.db.models import User
+from src.domain.users.controllers import (USER_SCHEMA_COLUMNS, rows_to_schemas,
+                                          user_to_schema)
+from src.lib.serialization import json_encoder
+
+PATHS = ("orm", "core")
+
+
+class SerializationResult(msgspec.Struct):
+    """Результат одного пути для одного размера страницы.
+
+    Attributes:
+        path: Путь построения ответа (``orm`` или ``core``).
+        rows: Строк на странице.
+        median_ms: Медианное время страницы.
+        p95_ms: 95-й перцентиль времени страницы.
+        rows_per_second: Строк в секунду по медианному времени.
+    """
+
+    path: str
+    rows: int
+    median_ms: float
+    p95_ms: float
+    rows_per_second: float
+
+
+async def orm_page(session: AsyncSession, rows: int) -> bytes:
+    """Страница через ORM-объекты и ``user_to_schema``."""
+    result = await session.execute(select(User).order_by(User.id).limit(rows))
+    return json_encoder.encode([user_to_schema(user) for user in result.scalars()])
+
+
+async def core_page(session: AsyncSession, rows: int) -> bytes:
+    """Страница через строки Core и ``rows_to_schemas``."""
+    result = await session.execute(
+        select(*USER_SCHEMA_COLUMNS).order_by(User.id).limit(rows)
+    )
+    return json_encoder.encode(rows_to_schemas(result.all()))
+
+
+PAGE_FUNCTIONS: Dict[str, Callable[[AsyncSession, int], Awaitable[bytes]]] = {
+    "orm": orm_page,
+    "core": core_page,
+}
+
+
+async def measure(
+    session_maker: async_sessionmaker[AsyncSession],
+    path: str,
+    rows: int,
+    repeat: int,
+    warmup: int,
+) -> SerializationResult:
+    """Измеряет время страницы одного пути."""
+    page = PAGE_FUNCTIONS[path]
+    timings = []
+    for iteration in range(warmup + repeat):
+        async with session_maker() as session:
+            started = time.perf_counter()
+            await page(session, rows)
+            elapsed = time.perf_counter() - started
+        if iteration >= warmup:
+            timings.append(elapsed)
+    median = statistics.median(timings)
+    p95 = statistics.quantiles(timings, n=20)[-1] if len(timings) > 1 else median
+    return SerializationResult(
+        path=path,
+        rows=rows,
+        median_ms=round(median * 1000, 3),
+        p95_ms=round(p95 * 1000, 3),
+        rows_per_second=round(rows / median, 1),
+    )
+
+
+def format_results(results: List[SerializationResult]) -> str:
+    """Таблица результатов с ускорением пути core относительно orm."""
+    medians = {(result.path, result.rows): result.median_ms for result in results}
+    lines = [
+        f"{'path':<6}{'rows':>6}{'median ms':>11}{'p95 ms':>10}"
+        f"{'rows/s':>12}{'speedup':>9}"
+    ]
+    for result in results:
+        baseline = medians.get(("orm", result.rows))
+        speedup = (
+            f"{baseline / result.median_ms:.2f}x"
+            if baseline and result.median_ms
+            else "-"
+        )
+        lines.append(
+            f"{result.path:<6}{result.rows:>6}{result.median_ms:>11.3f}"
+            f"{result.p95_ms:>10.3f}{result.rows_per_second:>12.1f}{speedup:>9}"
+        )
+    return "\n".join(lines)
+
+
+async def run(args: argparse.Namespace) -> List[SerializationResult]:
+    engine = create_async_engine(args.database_url)
+    try:
+        if args.create_schema:
+            await create_schema(engine)
+        if not args.no_seed:
+            await seed_users(engine, args.users)
+        session_maker = async_sessionmaker(engine, expire_on_commit=False)
+        results = []
+        for rows in args.sizes:
+            for path in PATHS:
+                results.append(
+                    await measure(session_maker, path, rows, args.repeat, args.warmup)
+                )
+        return results
+    finally:
+        await engine.dispose()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.serialization",
+        description=__doc__.splitlines()[0],
+    )
+    parser.add_argument(
+        "--database-url",
+        default=settings.DATABASE_URL,
+        help="Строка подключения к базе данных",
+    )
+    parser.add_argument(
+        "--create-schema",
+        action="store_true",
+        help="Создать таблицы по моделям (для SQLite и пустых баз)",
+    )
+    parser.add_argument(
+        "--users", type=int, default=1000, help="Количество пользователей в базе"
+    )
+    parser.add_argument(
+        "--no-seed", action="store_true", help="Не заполнять таблицу заново"
+    )
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[10, 100, 1000],
+        help="Размеры страницы",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=200, help="Измерений на путь и размер"
+    )
+    parser.add_argument(
+        "--warmup", type=int, default=20, help="Итераций прогрева без измерения"
+    )
+    parser.add_argument("--output", help="Файл для JSON-отчета")
+    args = parser.parse_args(argv)
+
+    results = asyncio.run(run(args))
+    print(format_results(results))
+    if args.output:
+        with open(args.output, "wb") as file:
+            file.write(msgspec.json.format(msgspec.json.encode(results)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,128 @@
+"""Сравнение серверов: uvicorn с одним и несколькими воркерами и Granian.
+
+Каждая конфигурация запускается отдельным процессом на свободном порту,
+после чего по ней прогоняются сценарии ``python -m benchmarks``
+с ``--base-url``. Пользователи создаются один раз перед первым прогоном::
+
+    python -m benchmarks.servers --workers 4 --users 100000 \\
+        --scenario get_user --scenario get_under_post_load --output-dir bench
+
+Остальные аргументы передаются ``python -m benchmarks`` без изменений.
+"""
+
+import argparse
+import os
+import socket
+import subprocess
+import sys
+import time
+from typing import Dict, List, Optional
+
+import httpx
+
+
+def free_port() -> int:
+    """Свободный TCP-порт на localhost."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def server_commands(workers: int, port: int) -> Dict[str, List[str]]:
+    """Команды запуска сравниваемых серверов.
+
+    Args:
+        workers: Количество воркеров многопроцессных конфигураций.
+        port: Порт сервера.
+
+    Returns:
+        Dict[str, List[str]]: Имя конфигурации и команда запуска.
+    """
+    uvicorn = [sys.executable, "-m", "uvicorn", "src.app:app", "--port", str(port)]
+    return {
+        "uvicorn-1": uvicorn,
+        f"uvicorn-{workers}": uvicorn + ["--workers", str(workers)],
+        f"granian-{workers}": [sys.executable, "-m", "src.server"],
+    }
+
+
+def wait_until_ready(
+    url: str,
+    process: subprocess.Popen,
+    timeout: float = 60,
+    poll_interval: float = 0.2,
+) -> None:
+    """Ожидает, пока сервер не ответит 200 на /health/ready.
+
+    Raises:
+        RuntimeError: Если процесс завершился или не ответил за ``timeout``.
+    """
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"Сервер завершился с кодом {process.returncode}")
+        try:
+            if httpx.get(f"{url}/health/ready", timeout=1).status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(poll_interval)
+    raise RuntimeError(f"Сервер не ответил за {timeout} с")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.servers", description=__doc__.splitlines()[0]
+    )
+    parser.add_argument(
+        "--workers", type=int, default=os.cpu_count() or 1, help="Воркеров"
+    )
+    parser.add_argument(
+        "--output-dir", default=".", help="Каталог для отчетов <конфигурация>.json"
+    )
+    parser.add_argument(
+        "--no-seed", action="store_true", help="Не пересоздавать пользователей"
+    )
+    parser.add_argument(
+        "--database-url", help="Строка подключения к базе (по умолчанию DATABASE_URL)"
+    )
+    args, benchmark_args = parser.parse_known_args(argv)
+    if args.database_url:
+        # Серверы и заполнение базы должны использовать одну базу
+        os.environ["DATABASE_URL"] = args.database_url
+
+    # Модуль benchmarks.__main__ импортирует приложение только внутри run()
+    from benchmarks.__main__ import main as run_benchmarks
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    port = free_port()
+    url = f"http://127.0.0.1:{port}"
+    env = {
+        **os.environ,
+        "SERVER_HOST": "127.0.0.1",
+        "SERVER_PORT": str(port),
+        "SERVER_WORKERS": str(args.workers),
+    }
+    seeded = args.no_seed
+    exit_code = 0
+    for name, command in server_commands(args.workers, port).items():
+        print(f"== {name}: {' '.join(command)}", file=sys.stderr)
+        process = subprocess.Popen(command, env=env)
+        try:
+            wait_until_ready(url, process)
+            output = os.path.join(args.output_dir, f"{name}.json")
+            code = run_benchmarks(
+                ["--base-url", url, "--output", output]
+                + (["--no-seed"] if seeded else [])
+                + benchmark_args
+            )
+            seeded = True
+            exit_code = max(exit_code, code)
+        finally:
+            process.terminate()
+            process.wait(timeout=30)
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
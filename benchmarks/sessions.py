@@ -0,0 +1,196 @@
+"""Накладные расходы провайдера сессии БД на запрос.
+
+Один и тот же обработчик (``SELECT 1`` в сессии из внедрения
+зависимостей) вызывается через Litestar с разными провайдерами
+``db_session``:
+
+- ``none`` - обработчик без сессии и запроса к базе: базовая
+  стоимость маршрутизации и DI;
+- ``per-request`` - путь до переиспользования сессии плагина: на каждый
+  запрос создаются фабрика сессий и вместе с ней новый движок с
+  собственным пулом, поэтому каждый запрос открывает новое соединение;
+- ``plugin`` - :func:`src.db.session.provide_db_session`: сессия запроса
+  из общей фабрики ``SQLAlchemyInitPlugin`` и общий пул соединений.
+
+Запросы выполняются последовательно через ASGI-транспорт httpx, без
+сети; накладные расходы считаются относительно ``none``::
+
+    python -m benchmarks.sessions --database-url sqlite+aiosqlite:///bench.sqlite3 \\
+        --requests 2000
+
+Движок ``per-request`` закрывается после запроса, чтобы не исчерпать
+лимит соединений базы; исходный путь оставлял его сборщику мусора.
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from typing import Any, AsyncGenerator, List, Optional, cast
+
+import msgspec
+
+PROVIDERS = ("none", "per-request", "plugin")
+
+
+class SessionResult(msgspec.Struct):
+    """Результат одного провайдера сессии.
+
+    Attributes:
+        provider: Провайдер сессии (``none``, ``per-request``, ``plugin``).
+        requests: Измеренных запросов.
+        median_ms: Медианное время запроса.
+        p95_ms: 95-й перцентиль времени запроса.
+        rps: Запросов в секунду при последовательном выполнении.
+        overhead_ms: Разница медиан с провайдером ``none``.
+    """
+
+    provider: str
+    requests: int
+    median_ms: float
+    p95_ms: float
+    rps: float
+    overhead_ms: float = 0.0
+
+
+def build_app(provider: str) -> Any:
+    """Приложение с одним маршрутом ``GET /ping`` и заданным провайдером."""
+    from litestar import Litestar, get
+    from litestar.di import Provide
+    from sqlalchemy import text
+    from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+    from src.db.session import (engine_config, provide_db_session,
+                                sqlalchemy_plugin)
+
+    if provider == "none":
+
+        @get("/ping", sync_to_thread=False)
+        def ping_without_session() -> None:
+            return None
+
+        return Litestar(route_handlers=[ping_without_session])
+
+    session_dependency = Provide(provide_db_session, sync_to_thread=False)
+    if provider == "per-request":
+        from advanced_alchemy.extensions.litestar import SQLAlchemyAsyncConfig
+
+        from src.core.config import settings
+
+        # Конфигурация без engine_instance и session_maker: движок и
+        # фабрика создаются при каждом вызове
+        config = SQLAlchemyAsyncConfig(
+            connection_string=settings.DATABASE_URL,
+            engine_config=engine_config,
+            create_all=False,
+        )
+
+        async def provide_per_request_session() -> AsyncGenerator[AsyncSession, None]:
+            async with config.create_session_maker()() as session:
+                yield session
+            await cast(AsyncEngine, session.bind).dispose()
+
+        session_dependency = Provide(provide_per_request_session)
+
+    # Зависимость уровня приложения заменяется провайдером плагина,
+    # поэтому провайдер задается на маршруте
+    @get("/ping", dependencies={"db_session": session_dependency})
+    async def ping(db_session: AsyncSession) -> None:
+        await db_session.execute(text("SELECT 1"))
+
+    return Litestar(route_handlers=[ping], plugins=[sqlalchemy_plugin])
+
+
+async def measure(provider: str, requests: int, warmup: int) -> SessionResult:
+    """Измеряет время запроса с одним провайдером сессии."""
+    import httpx
+
+    app = build_app(provider)
+    client = httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://testserver.local"
+    )
+    timings = []
+    async with app.lifespan(), client:
+        for iteration in range(warmup + requests):
+            started = time.perf_counter()
+            response = await client.get("/ping")
+            elapsed = time.perf_counter() - started
+            response.raise_for_status()
+            if iteration >= warmup:
+                timings.append(elapsed)
+    median = statistics.median(timings)
+    p95 = statistics.quantiles(timings, n=20)[-1] if len(timings) > 1 else median
+    return SessionResult(
+        provider=provider,
+        requests=requests,
+        median_ms=round(median * 1000, 3),
+        p95_ms=round(p95 * 1000, 3),
+        rps=round(len(timings) / sum(timings), 1),
+    )
+
+
+def format_results(results: List[SessionResult]) -> str:
+    """Таблица результатов с накладными расходами относительно ``none``."""
+    lines = [
+        f"{'provider':<13}{'median ms':>11}{'p95 ms':>10}{'rps':>10}{'overhead ms':>13}"
+    ]
+    for result in results:
+        lines.append(
+            f"{result.provider:<13}{result.median_ms:>11.3f}{result.p95_ms:>10.3f}"
+            f"{result.rps:>10.1f}{result.overhead_ms:>13.3f}"
+        )
+    return "\n".join(lines)
+
+
+async def run(args: argparse.Namespace) -> List[SessionResult]:
+    results = [
+        await measure(provider, args.requests, args.warmup)
+        for provider in args.providers
+    ]
+    baseline = next(
+        (result.median_ms for result in results if result.provider == "none"), 0.0
+    )
+    for result in results:
+        result.overhead_ms = round(result.median_ms - baseline, 3)
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.sessions", description=__doc__.splitlines()[0]
+    )
+    parser.add_argument(
+        "--database-url", help="Строка подключения к базе (по умолчанию DATABASE_URL)"
+    )
+    parser.add_argument(
+        "--provider",
+        action="append",
+        dest="providers",
+        choices=PROVIDERS,
+        help="Провайдер сессии (можно повторять; по умолчанию все)",
+    )
+    parser.add_argument(
+        "--requests", type=int, default=2000, help="Измеряемых запросов на провайдер"
+    )
+    parser.add_argument(
+        "--warmup", type=int, default=100, help="Прогревочных запросов"
+    )
+    parser.add_argument("--output", help="Файл для JSON-отчета")
+    args = parser.parse_args(argv)
+    args.providers = args.providers or list(PROVIDERS)
+    # Модули приложения импортируются после установки DATABASE_URL
+    if args.database_url:
+        os.environ["DATABASE_URL"] = args.database_url
+
+    results = asyncio.run(run(args))
+    print(format_results(results))
+    if args.output:
+        with open(args.output, "wb") as file:
+            file.write(msgspec.json.format(msgspec.json.encode(results)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,211 @@
+"""Время холодного старта: профиль импорта и время до первого ответа.
+
+Импорт приложения профилируется через ``python -X importtime`` в отдельных
+процессах; время готовности измеряется от запуска ``python -m src.server``
+с одним воркером до первого успешного ответа::
+
+    python -m benchmarks.startup --runs 5 --top 15 --output startup.json
+
+Время импорта зависит от наличия скомпилированного байт-кода: запуск
+с ``--no-bytecode`` показывает старт в контейнере без файлов .pyc.
+"""
+
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+import msgspec
+
+# Строка отчета -X importtime: собственное и накопленное время в мкс, модуль
+IMPORTTIME_RE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)$")
+
+
+class ModuleImport(msgspec.Struct):
+    """Время импорта модуля в миллисекундах."""
+
+    module: str
+    self_ms: float
+    cumulative_ms: float
+
+
+class StartupReport(msgspec.Struct):
+    """Отчет о времени старта (медианы по прогонам).
+
+    Attributes:
+        runs: Количество прогонов.
+        bytecode: Использовался ли скомпилированный байт-код.
+        import_ms: Время импорта ``src.app``.
+        packages_ms: Собственное время импорта по пакетам верхнего уровня.
+        slowest_modules: Модули с наибольшим собственным временем импорта.
+        ready_ms: Время от запуска сервера до первого ответа (None, если
+            не измерялось).
+    """
+
+    runs: int
+    bytecode: bool
+    import_ms: float
+    packages_ms: Dict[str, float]
+    slowest_modules: List[ModuleImport]
+    ready_ms: Optional[float] = None
+
+
+def parse_importtime(output: str) -> List[ModuleImport]:
+    """Разбирает вывод ``-X importtime``.
+
+    Args:
+        output: Содержимое stderr процесса.
+
+    Returns:
+        List[ModuleImport]: Модули в порядке завершения импорта.
+    """
+    modules = []
+    for line in output.splitlines():
+        match = IMPORTTIME_RE.match(line)
+        if match:
+            self_us, cumulative_us, _, module = match.groups()
+            modules.append(
+                ModuleImport(module, int(self_us) / 1000, int(cumulative_us) / 1000)
+            )
+    return modules
+
+
+def profile_import(env: Dict[str, str]) -> List[ModuleImport]:
+    """Импортирует приложение в отдельном процессе с ``-X importtime``."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import src.app"],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return parse_importtime(result.stderr)
+
+
+def measure_ready(env: Dict[str, str]) -> float:
+    """Время от запуска сервера с одним воркером до первого ответа в мс."""
+    from benchmarks.servers import free_port, wait_until_ready
+
+    port = free_port()
+    env = {**env, "SERVER_HOST": "127.0.0.1", "SERVER_PORT": str(port)}
+    env["SERVER_WORKERS"] = "1"
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "src.server"],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        wait_until_ready(f"http://127.0.0.1:{port}", process, poll_interval=0.01)
+        return (time.perf_counter() - started) * 1000
+    finally:
+        process.terminate()
+        process.wait(timeout=30)
+
+
+def build_report(
+    profiles: List[List[ModuleImport]],
+    ready: List[float],
+    top: int,
+    bytecode: bool,
+) -> StartupReport:
+    """Сводит прогоны в отчет (медианы по прогонам)."""
+    totals: List[float] = []
+    packages: Dict[str, List[float]] = defaultdict(list)
+    modules: Dict[str, List[ModuleImport]] = defaultdict(list)
+    for profile in profiles:
+        per_package: Dict[str, float] = defaultdict(float)
+        for item in profile:
+            per_package[item.module.split(".")[0]] += item.self_ms
+            modules[item.module].append(item)
+            if item.module == "src.app":
+                totals.append(item.cumulative_ms)
+        for package, value in per_package.items():
+            packages[package].append(value)
+
+    median_packages = {
+        package: round(statistics.median(values), 1)
+        for package, values in packages.items()
+    }
+    slowest = sorted(
+        (
+            ModuleImport(
+                module,
+                round(statistics.median(i.self_ms for i in items), 1),
+                round(statistics.median(i.cumulative_ms for i in items), 1),
+            )
+            for module, items in modules.items()
+        ),
+        key=lambda item: item.self_ms,
+        reverse=True,
+    )
+    return StartupReport(
+        runs=len(profiles),
+        bytecode=bytecode,
+        import_ms=round(statistics.median(totals), 1) if totals else 0.0,
+        packages_ms=dict(
+            sorted(median_packages.items(), key=lambda item: item[1], reverse=True)[
+                :top
+            ]
+        ),
+        slowest_modules=slowest[:top],
+        ready_ms=round(statistics.median(ready), 1) if ready else None,
+    )
+
+
+def format_report(report: StartupReport) -> str:
+    """Текстовая сводка отчета."""
+    lines = [f"import src.app: {report.import_ms} мс"]
+    if report.ready_ms is not None:
+        lines.append(f"первый ответ сервера: {report.ready_ms} мс")
+    lines.append("пакеты (собственное время импорта, мс):")
+    lines += [f"  {name:<30}{value:>10}" for name, value in report.packages_ms.items()]
+    lines.append("модули (собственное / накопленное время, мс):")
+    lines += [
+        f"  {item.module:<50}{item.self_ms:>10}{item.cumulative_ms:>10}"
+        for item in report.slowest_modules
+    ]
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.startup", description=__doc__.splitlines()[0]
+    )
+    parser.add_argument("--runs", type=int, default=5, help="Количество прогонов")
+    parser.add_argument("--top", type=int, default=15, help="Строк в сводке")
+    parser.add_argument(
+        "--no-server", action="store_true", help="Не измерять время до первого ответа"
+    )
+    parser.add_argument(
+        "--no-bytecode",
+        action="store_true",
+        help="Импорт без готовых .pyc (как в образе без скомпилированного байт-кода)",
+    )
+    parser.add_argument("--output", help="Файл для JSON-отчета")
+    args = parser.parse_args(argv)
+
+    env = dict(os.environ)
+    with tempfile.TemporaryDirectory() as cache_dir:
+        if args.no_bytecode:
+            # Пустой каталог кэша без записи: каждый прогон компилирует модули
+            env.update(PYTHONPYCACHEPREFIX=cache_dir, PYTHONDONTWRITEBYTECODE="1")
+        profiles = [profile_import(env) for _ in range(args.runs)]
+        ready = [] if args.no_server else [measure_ready(env) for _ in range(args.runs)]
+    report = build_report(profiles, ready, args.top, bytecode=not args.no_bytecode)
+    print(format_report(report))
+    if args.output:
+        with open(args.output, "wb") as file:
+            file.write(msgspec.json.format(msgspec.json.encode(report)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
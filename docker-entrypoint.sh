@@ -1,12 +1,10 @@
 #!/bin/bash
 set -e
 
-# Ожидание готовности базы данных
+# Ожидание готовности базы данных: повторные подключения с экспоненциальной
+# задержкой вместо запуска alembic раз в секунду
 echo "Waiting for database..."
-until alembic current > /dev/null 2>&1; do
-  echo "Database is unavailable - sleeping"
-  sleep 1
-done
+python -m src.db.wait --timeout "${DB_WAIT_TIMEOUT:-60}"
 
 echo "Database is up - executing command"
 
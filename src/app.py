@@ -1,21 +1,62 @@
 from litestar import Litestar
-from litestar.di import Provide
 from litestar.openapi import OpenAPIConfig
 from litestar.openapi.plugins import SwaggerRenderPlugin
+from src.core.compression import build_compression_config
 from src.core.config import settings
-from src.db.session import provide_db_session, sqlalchemy_plugin
+from src.core.limits import close_rate_limiter
+from src.core.profiling import (ProfiledProvide, ProfilingMiddleware,
+                                profile_after_request, profile_before_request)
+from src.core.security import password_hasher
+from src.db.batching import close_user_inserter, start_user_inserter
+from src.db.session import (provide_db_session, provide_read_db_session,
+                            replica_router, sqlalchemy_plugin)
+from src.domain.system.controllers import (HealthController, MetricsController,
+                                           SystemController)
+from src.domain.users.cache import user_cache, warn_if_user_cache_disabled
 from src.domain.users.controllers import UserController
+from src.lib.serialization import JSONResponse
 
 # Инициализация приложения LiteStar
 app = Litestar(
-    route_handlers=[UserController],
-    openapi_config=OpenAPIConfig(
-        title=settings.APP_TITLE,
-        version=settings.APP_VERSION,
-        description=settings.APP_DESCRIPTION,
-        render_plugins=[SwaggerRenderPlugin()],
+    route_handlers=[
+        UserController,
+        SystemController,
+        MetricsController,
+        HealthController,
+    ],
+    openapi_config=(
+        OpenAPIConfig(
+            title=settings.APP_TITLE,
+            version=settings.APP_VERSION,
+            description=settings.APP_DESCRIPTION,
+            render_plugins=[SwaggerRenderPlugin()],
+        )
+        if settings.OPENAPI_ENABLED
+        else None
     ),
     debug=settings.DEBUG,
-    dependencies={"db_session": Provide(provide_db_session)},
+    compression_config=build_compression_config(),
+    response_class=JSONResponse,
+    dependencies={
+        "db_session": ProfiledProvide(provide_db_session, sync_to_thread=False),
+        "read_db_session": ProfiledProvide(provide_read_db_session),
+    },
+    middleware=[ProfilingMiddleware()] if settings.PROFILING_ENABLED else [],
+    before_request=profile_before_request if settings.PROFILING_ENABLED else None,
+    after_request=profile_after_request if settings.PROFILING_ENABLED else None,
     plugins=[sqlalchemy_plugin],
+    on_startup=[
+        password_hasher.start,
+        replica_router.start,
+        start_user_inserter,
+        warn_if_user_cache_disabled,
+    ],
+    on_shutdown=[
+        # Оставшиеся в очереди вставки записываются до закрытия пула
+        close_user_inserter,
+        password_hasher.shutdown,
+        user_cache.close,
+        close_rate_limiter,
+        replica_router.close,
+    ],
 )
@@ -0,0 +1,158 @@
+"""Подбор стоимости хеширования паролей под целевое время на этом железе.
+
+    python -m src.core.calibrate --target-ms 250 --scheme bcrypt --scheme argon2
+
+Для каждой схемы выбирается максимальная стоимость, при которой один
+хеш вычисляется не дольше ``--target-ms``, и печатаются строки для
+``.env``. Запускать на том же железе (и с теми же ограничениями CPU
+контейнера), где работает сервис.
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
+
+from passlib.exc import MissingBackendError
+
+from src.core.config import settings
+from src.core.security import build_crypt_context
+
+# Границы поиска: ниже минимумов OWASP стоимость не опускается
+BCRYPT_MIN_ROUNDS = 10
+BCRYPT_MAX_ROUNDS = 16
+ARGON2_MIN_MEMORY_COST = 19456
+ARGON2_MAX_TIME_COST = 10
+
+
+def measure_hash_ms(scheme: str, samples: int = 3, **cost: int) -> float:
+    """Медианное время одного хеша в миллисекундах.
+
+    Args:
+        scheme: Схема хеширования.
+        samples: Количество измерений.
+        cost: Параметры стоимости для :func:`build_crypt_context`.
+
+    Returns:
+        float: Время хеширования в мс.
+    """
+    context = build_crypt_context([scheme], **cost)
+    context.hash("calibration")  # Прогрев бэкенда
+    timings = []
+    for _ in range(samples):
+        started = time.perf_counter()
+        context.hash("calibration")
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def calibrate_bcrypt(target_ms: float) -> Tuple[Dict[str, int], float]:
+    """Максимальное количество раундов bcrypt в пределах ``target_ms``.
+
+    Время bcrypt удваивается с каждым раундом, поэтому стоимость
+    оценивается по одному измерению и уточняется соседними значениями.
+
+    Returns:
+        Tuple[Dict[str, int], float]: Параметры и измеренное время в мс.
+    """
+    base = measure_hash_ms("bcrypt", bcrypt_rounds=BCRYPT_MIN_ROUNDS)
+    rounds = BCRYPT_MIN_ROUNDS
+    while (
+        rounds < BCRYPT_MAX_ROUNDS
+        and base * 2 ** (rounds + 1 - BCRYPT_MIN_ROUNDS) <= target_ms
+    ):
+        rounds += 1
+    elapsed = measure_hash_ms("bcrypt", bcrypt_rounds=rounds)
+    while elapsed > target_ms and rounds > BCRYPT_MIN_ROUNDS:
+        rounds -= 1
+        elapsed = measure_hash_ms("bcrypt", bcrypt_rounds=rounds)
+    return {"bcrypt_rounds": rounds}, elapsed
+
+
+def calibrate_argon2(
+    target_ms: float, memory_cost: int, parallelism: int
+) -> Tuple[Dict[str, int], float]:
+    """Максимальное количество проходов argon2id в пределах ``target_ms``.
+
+    Память фиксирована (``memory_cost``): она дороже для перебора, чем
+    проходы. Если даже один проход не укладывается в целевое время,
+    память уменьшается вдвое, но не ниже минимума OWASP.
+
+    Returns:
+        Tuple[Dict[str, int], float]: Параметры и измеренное время в мс.
+    """
+    while True:
+        cost = {"argon2_memory_cost": memory_cost, "argon2_parallelism": parallelism}
+        best: Optional[Tuple[Dict[str, int], float]] = None
+        for time_cost in range(1, ARGON2_MAX_TIME_COST + 1):
+            elapsed = measure_hash_ms("argon2", argon2_time_cost=time_cost, **cost)
+            if elapsed > target_ms:
+                break
+            best = ({"argon2_time_cost": time_cost, **cost}, elapsed)
+        if best is not None:
+            return best
+        if memory_cost // 2 < ARGON2_MIN_MEMORY_COST:
+            return {"argon2_time_cost": 1, **cost}, elapsed
+        memory_cost //= 2
+
+
+# Параметр build_crypt_context и переменная окружения
+ENV_NAMES = {
+    "bcrypt_rounds": "PASSWORD_BCRYPT_ROUNDS",
+    "argon2_time_cost": "PASSWORD_ARGON2_TIME_COST",
+    "argon2_memory_cost": "PASSWORD_ARGON2_MEMORY_COST",
+    "argon2_parallelism": "PASSWORD_ARGON2_PARALLELISM",
+}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m src.core.calibrate", description=__doc__.splitlines()[0]
+    )
+    parser.add_argument(
+        "--target-ms", type=float, default=250.0, help="Целевое время хеша в мс"
+    )
+    parser.add_argument(
+        "--scheme",
+        action="append",
+        dest="schemes",
+        choices=("bcrypt", "argon2"),
+        help="Схема (можно повторять; по умолчанию из PASSWORD_HASH_SCHEMES)",
+    )
+    parser.add_argument(
+        "--argon2-memory-cost",
+        type=int,
+        default=settings.PASSWORD_ARGON2_MEMORY_COST,
+        help="Начальная память argon2id в КиБ",
+    )
+    parser.add_argument(
+        "--argon2-parallelism",
+        type=int,
+        default=settings.PASSWORD_ARGON2_PARALLELISM,
+        help="Параллелизм argon2id",
+    )
+    args = parser.parse_args(argv)
+
+    for scheme in args.schemes or settings.password_hash_schemes:
+        if scheme == "bcrypt":
+            cost, elapsed = calibrate_bcrypt(args.target_ms)
+        elif scheme == "argon2":
+            try:
+                cost, elapsed = calibrate_argon2(
+                    args.target_ms, args.argon2_memory_cost, args.argon2_parallelism
+                )
+            except MissingBackendError:
+                print("# argon2: пропущено, нужен пакет argon2-cffi", file=sys.stderr)
+                continue
+        else:
+            print(f"# {scheme}: калибровка не поддерживается", file=sys.stderr)
+            continue
+        print(f"# {scheme}: {elapsed:.1f} мс на хеш")
+        for name, value in cost.items():
+            print(f"{ENV_NAMES[name]}={value}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
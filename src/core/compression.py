@@ -0,0 +1,28 @@
+from typing import Optional
+
+from litestar.config.compression import CompressionConfig
+
+from src.core.config import settings
+
+
+def build_compression_config() -> Optional[CompressionConfig]:
+    """Создает настройки сжатия ответов по настройкам приложения.
+
+    Ответы меньше ``COMPRESSION_MINIMUM_SIZE`` байт (например, один
+    пользователь) отправляются без сжатия: выигрыш в размере не окупает
+    затраты CPU. Бэкенд brotli требует пакет ``brotli``
+    (``litestar[brotli]``); клиентам без его поддержки ответ сжимается gzip.
+
+    Returns:
+        Optional[CompressionConfig]: Настройки сжатия или None, если
+            сжатие отключено.
+    """
+    if settings.COMPRESSION_BACKEND == "none":
+        return None
+    return CompressionConfig(
+        backend=settings.COMPRESSION_BACKEND,
+        minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+        gzip_compress_level=settings.COMPRESSION_GZIP_LEVEL,
+        brotli_quality=settings.COMPRESSION_BROTLI_QUALITY,
+        brotli_gzip_fallback=True,
+    )
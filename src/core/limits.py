@@ -0,0 +1,210 @@
+import logging
+import math
+from ipaddress import IPv4Network, IPv6Network, ip_address, ip_network
+from typing import List, Optional, Sequence, Union, cast
+
+from litestar.constants import HTTP_RESPONSE_START
+from litestar.datastructures import Headers, MutableScopeHeaders
+from litestar.enums import ScopeType
+from litestar.exceptions import (ServiceUnavailableException,
+                                 TooManyRequestsException)
+from litestar.middleware import ASGIMiddleware
+from litestar.types import (ASGIApp, HTTPScope, Message, Receive, Scope,
+                            Send)
+
+from src.core.config import settings
+from src.core.profiling import metrics
+from src.lib.cache import LRUMemoryStore
+from src.lib.ratelimit import (InFlightLimiter, RateLimiter,
+                               RedisTokenBucketLimiter, TokenBucketLimiter)
+
+logger = logging.getLogger(__name__)
+
+http_requests_rejected_total = metrics.counter(
+    "http_requests_rejected_total",
+    "Запросы, отклоненные ограничением частоты или одновременных запросов",
+    ("route", "reason"),
+)
+
+
+class RateLimitExceededError(TooManyRequestsException):
+    """Клиент превысил лимит запросов к маршруту."""
+
+
+class ServerOverloadedError(ServiceUnavailableException):
+    """Превышен лимит одновременно обрабатываемых запросов."""
+
+
+def create_rate_limiter() -> Optional[RateLimiter]:
+    """Создает ограничитель частоты запросов по настройкам.
+
+    Returns:
+        Optional[RateLimiter]: Ограничитель или None, если
+            ограничение отключено.
+    """
+    if settings.RATE_LIMIT_BACKEND == "memory":
+        return TokenBucketLimiter(
+            LRUMemoryStore(max_size=settings.RATE_LIMIT_MAX_CLIENTS),
+            settings.RATE_LIMIT_RATE,
+            settings.RATE_LIMIT_BURST,
+        )
+    if settings.RATE_LIMIT_BACKEND == "redis":
+        # Импорт по требованию: пакет redis нужен только для этого бэкенда
+        from redis.asyncio import Redis
+
+        return RedisTokenBucketLimiter(
+            Redis.from_url(settings.RATE_LIMIT_REDIS_URL),
+            settings.RATE_LIMIT_RATE,
+            settings.RATE_LIMIT_BURST,
+        )
+    return None
+
+
+def _route(scope: Scope) -> str:
+    return scope.get("path_template") or scope["path"]
+
+
+Network = Union[IPv4Network, IPv6Network]
+
+
+def _is_trusted(address: str, trusted_proxies: Sequence[Network]) -> bool:
+    try:
+        parsed = ip_address(address)
+    except ValueError:
+        return False
+    return any(parsed in network for network in trusted_proxies)
+
+
+def client_address(scope: Scope, trusted_proxies: Sequence[Network] = ()) -> str:
+    """Адрес клиента запроса с учетом доверенных обратных прокси.
+
+    Если соединение пришло от доверенного прокси, адреса из
+    ``X-Forwarded-For`` просматриваются справа налево: клиент - первый
+    адрес, не принадлежащий доверенным прокси. Адреса левее него
+    добавил сам клиент, и им нельзя доверять.
+
+    Args:
+        scope: ASGI-scope запроса.
+        trusted_proxies: Подсети доверенных прокси.
+
+    Returns:
+        str: Адрес клиента или ``-``, если он неизвестен.
+    """
+    client = scope.get("client")
+    address = client[0] if client else "-"
+    if not _is_trusted(address, trusted_proxies):
+        return address
+    hops = [
+        hop.strip()
+        for value in Headers.from_scope(scope).getall("x-forwarded-for", [])
+        for hop in value.split(",")
+        if hop.strip()
+    ]
+    for hop in reversed(hops):
+        address = hop
+        if not _is_trusted(hop, trusted_proxies):
+            break
+    return address
+
+
+class RateLimitMiddleware(ASGIMiddleware):
+    """Ограничение частоты запросов клиента к маршруту (token bucket).
+
+    Подключается к изменяющим обработчикам; чтения не ограничиваются.
+    Корзина отдельная для каждой пары «адрес клиента, метод и шаблон
+    пути», адрес клиента за доверенным прокси берется из
+    ``X-Forwarded-For`` (см. :func:`client_address`). Запрос сверх лимита
+    сразу получает 429 с заголовком Retry-After, принятые ответы содержат
+    заголовки ``RateLimit-Limit`` и ``RateLimit-Remaining``. Ошибка
+    хранилища не блокирует запросы.
+
+    Args:
+        trusted_proxies: Адреса или подсети доверенных прокси; по
+            умолчанию - из RATE_LIMIT_TRUSTED_PROXIES.
+    """
+
+    scopes = (ScopeType.HTTP,)
+    # Обработчики с opt={"skip_rate_limit": True} не ограничиваются
+    exclude_opt_key = "skip_rate_limit"
+
+    def __init__(self, trusted_proxies: Optional[Sequence[str]] = None) -> None:
+        if trusted_proxies is None:
+            trusted_proxies = settings.rate_limit_trusted_proxies
+        self.trusted_proxies: List[Network] = [
+            ip_network(proxy, strict=False) for proxy in trusted_proxies
+        ]
+
+    async def handle(
+        self, scope: Scope, receive: Receive, send: Send, next_app: ASGIApp
+    ) -> None:
+        if rate_limiter is None:
+            await next_app(scope, receive, send)
+            return
+
+        route = _route(scope)
+        client = client_address(scope, self.trusted_proxies)
+        method = cast(HTTPScope, scope)["method"]
+        key = f"{client}:{method}:{route}"
+        try:
+            decision = await rate_limiter.acquire(key)
+        except Exception:
+            logger.warning("Ошибка хранилища ограничения частоты", exc_info=True)
+            await next_app(scope, receive, send)
+            return
+
+        if not decision.allowed:
+            http_requests_rejected_total.inc(route, "rate_limit")
+            raise RateLimitExceededError(
+                detail="Слишком много запросов, повторите запрос позже",
+                headers={
+                    "Retry-After": str(math.ceil(decision.retry_after)),
+                    "RateLimit-Limit": str(rate_limiter.burst),
+                    "RateLimit-Remaining": "0",
+                },
+            )
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == HTTP_RESPONSE_START:
+                headers = MutableScopeHeaders.from_message(message)
+                headers.add("RateLimit-Limit", str(rate_limiter.burst))
+                headers.add("RateLimit-Remaining", str(decision.remaining))
+            await send(message)
+
+        await next_app(scope, receive, send_wrapper)
+
+
+class ConcurrencyLimitMiddleware(ASGIMiddleware):
+    """Сброс нагрузки при превышении лимита одновременных запросов.
+
+    Запрос сверх ``MAX_IN_FLIGHT_REQUESTS`` сразу получает 503 с
+    заголовком Retry-After вместо ожидания соединения из пула, поэтому
+    задержка принятых запросов не растет вместе с очередью.
+    """
+
+    scopes = (ScopeType.HTTP,)
+    exclude_opt_key = "skip_load_shedding"
+
+    async def handle(
+        self, scope: Scope, receive: Receive, send: Send, next_app: ASGIApp
+    ) -> None:
+        if not in_flight_limiter.try_acquire():
+            http_requests_rejected_total.inc(_route(scope), "overload")
+            raise ServerOverloadedError(
+                detail="Сервис перегружен, повторите запрос позже",
+                headers={"Retry-After": str(settings.SHED_RETRY_AFTER)},
+            )
+        try:
+            await next_app(scope, receive, send)
+        finally:
+            in_flight_limiter.release()
+
+
+# Ограничители процесса-воркера для использования в приложении
+rate_limiter = create_rate_limiter()
+in_flight_limiter = InFlightLimiter(settings.MAX_IN_FLIGHT_REQUESTS)
+
+
+async def close_rate_limiter() -> None:
+    """Закрывает хранилище ограничителя частоты при завершении приложения."""
+    if rate_limiter is not None:
+        await rate_limiter.close()
@@ -0,0 +1,227 @@
+import time
+from contextvars import ContextVar
+from typing import Any, List, Optional, Tuple, cast
+
+from litestar import Request, Response
+from litestar.constants import HTTP_RESPONSE_START
+from litestar.datastructures import MutableScopeHeaders
+from litestar.di import Provide
+from litestar.enums import ScopeType
+from litestar.middleware import ASGIMiddleware
+from litestar.types import ASGIApp, HTTPScope, Message, Receive, Scope, Send
+
+from src.core.config import settings
+from src.lib.metrics import MetricsRegistry
+
+# Метрики процесса, отдаваемые эндпоинтом /metrics
+metrics = MetricsRegistry()
+
+http_requests_total = metrics.counter(
+    "http_requests_total",
+    "Количество обработанных HTTP-запросов",
+    ("method", "route", "status"),
+)
+http_request_duration = metrics.histogram(
+    "http_request_duration_seconds",
+    "Полное время обработки HTTP-запроса",
+    ("method", "route"),
+)
+http_request_phase_duration = metrics.histogram(
+    "http_request_phase_duration_seconds",
+    "Время этапов обработки запроса: зависимости, обработчик, сериализация",
+    ("route", "phase"),
+)
+http_request_db_statements = metrics.histogram(
+    "http_request_db_statements",
+    "Количество SQL-запросов на один HTTP-запрос",
+    ("route",),
+    buckets=(0, 1, 2, 3, 5, 10, 20, 50, 100),
+)
+db_statement_duration = metrics.histogram(
+    "db_statement_duration_seconds", "Время выполнения SQL-запросов"
+)
+db_slow_statements_total = metrics.counter(
+    "db_slow_statements_total",
+    "Количество SQL-запросов медленнее DB_SLOW_QUERY_THRESHOLD",
+)
+
+
+class RequestProfile:
+    """Отметки времени и SQL-статистика одного запроса.
+
+    Отметки берутся из ``time.perf_counter()``. Этапы запроса:
+    разбор параметров и зависимости (от ``before_request`` до выхода
+    последнего провайдера), обработчик (до ``after_request``) и
+    сериализация ответа (до отправки ``http.response.start``).
+
+    Attributes:
+        started: Начало обработки в middleware.
+        dependencies_started: Начало разбора параметров и зависимостей.
+        dependencies_finished: Завершение последнего провайдера зависимости.
+        handler_finished: Возврат из обработчика.
+        response_started: Отправка заголовков ответа.
+        sql_count: Количество выполненных SQL-запросов.
+        sql_time: Суммарное время SQL-запросов в секундах.
+    """
+
+    __slots__ = (
+        "started",
+        "dependencies_started",
+        "dependencies_finished",
+        "handler_finished",
+        "response_started",
+        "sql_count",
+        "sql_time",
+    )
+
+    def __init__(self) -> None:
+        self.started = time.perf_counter()
+        self.dependencies_started: Optional[float] = None
+        self.dependencies_finished: Optional[float] = None
+        self.handler_finished: Optional[float] = None
+        self.response_started: Optional[float] = None
+        self.sql_count = 0
+        self.sql_time = 0.0
+
+    def add_statement(self, duration: float) -> None:
+        """Учитывает выполненный SQL-запрос.
+
+        Args:
+            duration: Время выполнения в секундах.
+        """
+        self.sql_count += 1
+        self.sql_time += duration
+
+    def phases(self) -> List[Tuple[str, float]]:
+        """Длительности пройденных этапов запроса в секундах.
+
+        Returns:
+            List[Tuple[str, float]]: Пары (этап, длительность) для этапов
+                ``di``, ``handler`` и ``serialize``.
+        """
+        result: List[Tuple[str, float]] = []
+        handler_started = self.dependencies_finished or self.dependencies_started
+        if self.dependencies_started is not None and handler_started is not None:
+            result.append(("di", handler_started - self.dependencies_started))
+        if handler_started is not None and self.handler_finished is not None:
+            result.append(("handler", self.handler_finished - handler_started))
+            if self.response_started is not None:
+                result.append(
+                    ("serialize", self.response_started - self.handler_finished)
+                )
+        return result
+
+    def server_timing(self) -> str:
+        """Значение заголовка ``Server-Timing`` (длительности в миллисекундах)."""
+        now = self.response_started or time.perf_counter()
+        entries = [
+            f"{name};dur={duration * 1000:.2f}" for name, duration in self.phases()
+        ]
+        entries.append(
+            f'db;dur={self.sql_time * 1000:.2f};desc="{self.sql_count} queries"'
+        )
+        entries.append(f"total;dur={(now - self.started) * 1000:.2f}")
+        return ", ".join(entries)
+
+
+_current_profile: ContextVar[Optional[RequestProfile]] = ContextVar(
+    "request_profile", default=None
+)
+
+
+def get_request_profile() -> Optional[RequestProfile]:
+    """Профиль текущего запроса или None вне запроса и без профилирования."""
+    return _current_profile.get()
+
+
+class ProfiledProvide(Provide):
+    """``Provide``, отмечающий в профиле запроса завершение провайдера.
+
+    Независимые зависимости разрешаются параллельно, поэтому этап
+    внедрения зависимостей считается до выхода последнего провайдера.
+    """
+
+    __slots__ = ()
+
+    async def __call__(self, **kwargs: Any) -> Any:
+        value = await super().__call__(**kwargs)
+        profile = _current_profile.get()
+        if profile is not None:
+            profile.dependencies_finished = time.perf_counter()
+        return value
+
+
+async def profile_before_request(request: Request) -> None:
+    """Хук ``before_request``: начало разбора параметров и зависимостей."""
+    profile = _current_profile.get()
+    if profile is not None:
+        profile.dependencies_started = time.perf_counter()
+
+
+async def profile_after_request(response: Response) -> Response:
+    """Хук ``after_request``: обработчик вернул результат."""
+    profile = _current_profile.get()
+    if profile is not None:
+        profile.handler_finished = time.perf_counter()
+    return response
+
+
+class ProfilingMiddleware(ASGIMiddleware):
+    """Middleware профилирования HTTP-запросов.
+
+    Создает :class:`RequestProfile` для запроса, добавляет в ответ
+    заголовок ``Server-Timing`` и по завершении запроса обновляет
+    метрики Prometheus. SQL-запросы коммита, который выполняется уже
+    после отправки заголовков, попадают только в метрики.
+    """
+
+    scopes = (ScopeType.HTTP,)
+    # Обработчики с opt={"skip_profiling": True} (пробы /health) не
+    # профилируются и не попадают в метрики
+    exclude_opt_key = "skip_profiling"
+
+    async def handle(
+        self, scope: Scope, receive: Receive, send: Send, next_app: ASGIApp
+    ) -> None:
+        profile = RequestProfile()
+        token = _current_profile.set(profile)
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == HTTP_RESPONSE_START:
+                profile.response_started = time.perf_counter()
+                status_code = message["status"]
+                if settings.SERVER_TIMING_ENABLED:
+                    headers = MutableScopeHeaders.from_message(message)
+                    headers.add("Server-Timing", profile.server_timing())
+            await send(message)
+
+        try:
+            await next_app(scope, receive, send_wrapper)
+        except Exception as e:
+            # Ответ на исключение формирует обработчик исключений Litestar
+            status_code = getattr(e, "status_code", 500)
+            raise
+        finally:
+            _current_profile.reset(token)
+            record_request_metrics(scope, profile, status_code)
+
+
+def record_request_metrics(
+    scope: Scope, profile: RequestProfile, status_code: int
+) -> None:
+    """Обновляет метрики по профилю завершенного запроса.
+
+    Args:
+        scope: ASGI-scope запроса.
+        profile: Профиль запроса.
+        status_code: Код ответа.
+    """
+    route = scope.get("path_template") or scope["path"]
+    method = cast(HTTPScope, scope)["method"]
+    http_requests_total.inc(method, route, str(status_code))
+    http_request_duration.observe(time.perf_counter() - profile.started, method, route)
+    for phase, duration in profile.phases():
+        http_request_phase_duration.observe(duration, route, phase)
+    http_request_db_statements.observe(profile.sql_count, route)
@@ -0,0 +1,314 @@
+import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import (TYPE_CHECKING, Any, Callable, List, Literal, Optional,
+                    Sequence, Tuple, TypeVar)
+
+from litestar.exceptions import (ImproperlyConfiguredException,
+                                 ServiceUnavailableException)
+
+from src.core.config import settings
+
+if TYPE_CHECKING:
+    from passlib.context import CryptContext
+
+T = TypeVar("T")
+
+
+class PasswordHasherBusyError(ServiceUnavailableException):
+    """Очередь хеширования паролей переполнена."""
+
+
+def build_crypt_context(
+    schemes: Sequence[str],
+    bcrypt_rounds: int = 12,
+    argon2_time_cost: int = 2,
+    argon2_memory_cost: int = 19456,
+    argon2_parallelism: int = 1,
+) -> "CryptContext":
+    """Создает политику хеширования паролей passlib.
+
+    Новые пароли хешируются первой схемой из ``schemes``, остальные
+    только проверяются. Хеш устаревшей схемы или с другой стоимостью
+    (например, после изменения ``PASSWORD_BCRYPT_ROUNDS``) считается
+    требующим обновления.
+
+    Args:
+        schemes: Схемы хеширования (``bcrypt``, ``argon2``, ...).
+        bcrypt_rounds: Логарифм количества раундов bcrypt.
+        argon2_time_cost: Количество проходов argon2id.
+        argon2_memory_cost: Память argon2id в КиБ.
+        argon2_parallelism: Параллелизм argon2id.
+
+    Returns:
+        CryptContext: Политика хеширования.
+
+    Raises:
+        ValueError: Если схемы не заданы.
+        KeyError: Если схема неизвестна passlib.
+        passlib.exc.MissingBackendError: Если для схемы не установлен
+            пакет (например, ``argon2-cffi``).
+    """
+    if not schemes:
+        raise ValueError("Не заданы схемы хеширования паролей")
+    # passlib импортируется при первом хешировании, а не при старте
+    # приложения: вместе с модулем crypt это заметная часть времени импорта
+    from passlib.context import CryptContext
+
+    options: dict = {}
+    if "bcrypt" in schemes:
+        # Одинаковые границы: хеши с другим количеством раундов обновляются
+        options.update(
+            bcrypt__default_rounds=bcrypt_rounds,
+            bcrypt__min_rounds=bcrypt_rounds,
+            bcrypt__max_rounds=bcrypt_rounds,
+        )
+    if "argon2" in schemes:
+        # Параметры argon2 сравниваются с хешем при проверке needs_update
+        options.update(
+            argon2__type="ID",
+            argon2__time_cost=argon2_time_cost,
+            argon2__memory_cost=argon2_memory_cost,
+            argon2__parallelism=argon2_parallelism,
+        )
+    context = CryptContext(schemes=list(schemes), deprecated="auto", **options)
+    # Бэкенды схем загружаются при первом хешировании; загрузка из
+    # нескольких потоков пула одновременно завершается ошибкой импорта
+    for scheme in context.schemes():
+        handler = context.handler(scheme)
+        if hasattr(handler, "get_backend"):
+            handler.get_backend()
+    return context
+
+
+_crypt_context: Optional["CryptContext"] = None
+
+
+def get_crypt_context() -> "CryptContext":
+    """Политика хеширования из настроек приложения (создается один раз)."""
+    global _crypt_context
+    if _crypt_context is None:
+        _crypt_context = build_crypt_context(
+            settings.password_hash_schemes,
+            bcrypt_rounds=settings.PASSWORD_BCRYPT_ROUNDS,
+            argon2_time_cost=settings.PASSWORD_ARGON2_TIME_COST,
+            argon2_memory_cost=settings.PASSWORD_ARGON2_MEMORY_COST,
+            argon2_parallelism=settings.PASSWORD_ARGON2_PARALLELISM,
+        )
+    return _crypt_context
+
+
+def _hash_password(password: str) -> str:
+    """Хеширует пароль (выполняется в пуле воркеров)."""
+    return get_crypt_context().hash(password)
+
+
+def _verify_password(password: str, password_hash: str) -> bool:
+    """Проверяет пароль по хешу (выполняется в пуле воркеров)."""
+    return get_crypt_context().verify(password, password_hash)
+
+
+def _verify_and_update_password(
+    password: str, password_hash: str
+) -> Tuple[bool, Optional[str]]:
+    """Проверяет пароль и пересчитывает устаревший хеш (в пуле воркеров)."""
+    return get_crypt_context().verify_and_update(password, password_hash)
+
+
+class PasswordHasher:
+    """Сервис хеширования паролей в ограниченном пуле воркеров.
+
+    Хеширование (bcrypt, argon2id) занимает сотни миллисекунд CPU,
+    поэтому вызовы выносятся из цикла событий в пул потоков или
+    процессов. Схема и стоимость задаются политикой
+    :func:`get_crypt_context`. Количество ожидающих
+    задач ограничено: при переполнении очереди запрос сразу получает
+    503 с заголовком Retry-After вместо бесконечного ожидания.
+
+    Attributes:
+        executor_type: Тип пула (``thread`` или ``process``).
+        max_workers: Количество воркеров пула.
+        max_pending: Максимум задач в работе и в очереди.
+        retry_after: Значение заголовка Retry-After в секундах.
+    """
+
+    def __init__(
+        self,
+        executor_type: Literal["thread", "process"] = "thread",
+        max_workers: int = 4,
+        max_pending: int = 64,
+        retry_after: int = 1,
+    ) -> None:
+        self.executor_type = executor_type
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.retry_after = retry_after
+        self._executor: Optional[Executor] = None
+        self._pending = 0
+
+    @property
+    def pending(self) -> int:
+        """Количество задач в работе и в очереди."""
+        return self._pending
+
+    def _get_executor(self) -> Executor:
+        """Создает пул воркеров при первом обращении."""
+        if self._executor is None:
+            if self.executor_type == "process":
+                # Каждый процесс пула создает политику сам при первом вызове
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                # Потоки пула используют общую политику, созданную заранее
+                get_crypt_context()
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="password-hasher",
+                )
+        return self._executor
+
+    def _reserve(self, slots: int) -> None:
+        """Занимает места в очереди хеширования.
+
+        Raises:
+            PasswordHasherBusyError: Если очередь заполнена.
+        """
+        if self._pending + slots > self.max_pending:
+            raise PasswordHasherBusyError(
+                detail="Сервис хеширования паролей перегружен, повторите запрос позже",
+                headers={"Retry-After": str(self.retry_after)},
+            )
+        self._pending += slots
+
+    async def _run(self, fn: Callable[..., T], *args: Any) -> T:
+        """Выполняет функцию в пуле с учетом ограничения очереди.
+
+        Raises:
+            PasswordHasherBusyError: Если очередь заполнена.
+        """
+        self._reserve(1)
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), fn, *args)
+        finally:
+            self._pending -= 1
+
+    async def hash(self, password: str) -> str:
+        """Хеширует пароль, не блокируя цикл событий.
+
+        Args:
+            password: Пароль в открытом виде.
+
+        Returns:
+            str: Хеш пароля.
+        """
+        return await self._run(_hash_password, password)
+
+    async def hash_many(self, passwords: Sequence[str]) -> List[str]:
+        """Хеширует набор паролей параллельно на всех воркерах пула.
+
+        Пакет занимает в очереди столько мест, сколько воркеров он
+        может задействовать одновременно, и передает в пул не больше
+        этого количества задач за раз. Поэтому большой импорт
+        не отклоняется целиком, но и не выстраивает перед одиночными
+        запросами очередь из тысяч задач.
+
+        Args:
+            passwords: Пароли в открытом виде.
+
+        Returns:
+            List[str]: Хеши паролей в исходном порядке.
+        """
+        if not passwords:
+            return []
+        slots = min(len(passwords), self.max_workers)
+        self._reserve(slots)
+        try:
+            loop = asyncio.get_running_loop()
+            executor = self._get_executor()
+            semaphore = asyncio.Semaphore(slots)
+
+            async def hash_one(password: str) -> str:
+                async with semaphore:
+                    return await loop.run_in_executor(
+                        executor, _hash_password, password
+                    )
+
+            return list(
+                await asyncio.gather(*(hash_one(password) for password in passwords))
+            )
+        finally:
+            self._pending -= slots
+
+    async def verify(self, password: str, password_hash: str) -> bool:
+        """Проверяет пароль по хешу, не блокируя цикл событий.
+
+        Args:
+            password: Пароль в открытом виде.
+            password_hash: Сохраненный хеш пароля.
+
+        Returns:
+            bool: True, если пароль соответствует хешу.
+        """
+        return await self._run(_verify_password, password, password_hash)
+
+    async def verify_and_update(
+        self, password: str, password_hash: str
+    ) -> Tuple[bool, Optional[str]]:
+        """Проверяет пароль и при необходимости пересчитывает хеш.
+
+        Если хеш создан устаревшей схемой или с другой стоимостью, а
+        пароль верен, возвращается новый хеш по текущей политике: его
+        нужно сохранить вместо старого.
+
+        Args:
+            password: Пароль в открытом виде.
+            password_hash: Сохраненный хеш пароля.
+
+        Returns:
+            Tuple[bool, Optional[str]]: Результат проверки и новый хеш
+                или None, если обновление не требуется.
+        """
+        return await self._run(_verify_and_update_password, password, password_hash)
+
+    def needs_update(self, password_hash: str) -> bool:
+        """Требует ли хеш пересчета по текущей политике (без хеширования).
+
+        Args:
+            password_hash: Сохраненный хеш пароля.
+
+        Returns:
+            bool: True для устаревшей схемы или другой стоимости.
+        """
+        return get_crypt_context().needs_update(password_hash)
+
+    def start(self) -> None:
+        """Проверяет политику хеширования при старте приложения.
+
+        Ошибка настройки (неизвестная схема, не установленный пакет
+        argon2-cffi) останавливает запуск, а не проявляется ответом 500
+        на первый запрос с паролем.
+
+        Raises:
+            ImproperlyConfiguredException: Если политику нельзя создать.
+        """
+        try:
+            get_crypt_context()
+        except Exception as e:
+            raise ImproperlyConfiguredException(
+                "Некорректная политика хеширования паролей "
+                f"PASSWORD_HASH_SCHEMES={settings.PASSWORD_HASH_SCHEMES!r}: {e}"
+            ) from e
+
+    def shutdown(self) -> None:
+        """Останавливает пул воркеров при завершении приложения."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+# Экземпляр сервиса хеширования для использования в приложении
+password_hasher = PasswordHasher(
+    executor_type=settings.PASSWORD_HASH_EXECUTOR,
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING,
+    retry_after=settings.PASSWORD_HASH_RETRY_AFTER,
+)
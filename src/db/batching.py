@@ -0,0 +1,181 @@
+import asyncio
+import logging
+from typing import Callable, Generic, List, Optional, Tuple, TypeVar
+
+from advanced_alchemy.base import ModelProtocol
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.config import settings
+from src.core.profiling import metrics
+from src.db.session import sqlalchemy_config
+
+logger = logging.getLogger(__name__)
+
+ModelT = TypeVar("ModelT", bound=ModelProtocol)
+
+db_insert_batch_size = metrics.histogram(
+    "db_insert_batch_size",
+    "Количество строк в объединенном INSERT",
+    buckets=(1, 2, 5, 10, 20, 50, 100, 200, 500),
+)
+
+
+class BatchInserter(Generic[ModelT]):
+    """Объединение параллельных вставок в один многострочный INSERT.
+
+    Вызовы :meth:`insert` попадают в очередь процесса. Фоновая задача
+    забирает накопленные объекты, как только их набралось ``max_size``
+    или с первого прошло ``window`` секунд, и вставляет их одним
+    ``INSERT ... RETURNING`` в отдельной транзакции: стоимость коммита
+    (fsync WAL) делится на всю пачку. Пока пачка записывается, следующая
+    накапливается. Каждый вызывающий получает свой объект с заполненными
+    первичным ключом и серверными значениями после коммита пачки.
+
+    Если пачка не записалась, объекты вставляются по одному, чтобы
+    ошибка одной строки не отклоняла остальные.
+
+    Attributes:
+        session_maker: Фабрика сессий для транзакций пачек.
+        max_size: Максимальное количество строк в пачке.
+        window: Максимальное ожидание пачки в секундах.
+    """
+
+    def __init__(
+        self,
+        session_maker: Callable[[], AsyncSession],
+        max_size: int = 100,
+        window: float = 0.005,
+    ) -> None:
+        self.session_maker = session_maker
+        self.max_size = max_size
+        self.window = window
+        self._pending: List[Tuple[ModelT, asyncio.Future]] = []
+        self._has_items = asyncio.Event()
+        self._full = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._closing = False
+
+    async def insert(self, instance: ModelT) -> ModelT:
+        """Вставляет объект в составе ближайшей пачки.
+
+        Args:
+            instance: Новый объект модели.
+
+        Returns:
+            ModelT: Тот же объект после коммита пачки.
+
+        Raises:
+            RuntimeError: Если фоновая задача не запущена, завершается
+                или завершилась: объект уже некому записать.
+            Exception: Ошибка вставки этого объекта.
+        """
+        if self._task is None or self._closing or self._task.done():
+            raise RuntimeError("BatchInserter не запущен")
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((instance, future))
+        self._has_items.set()
+        if len(self._pending) >= self.max_size:
+            self._full.set()
+        return await future
+
+    def _take_batch(self) -> List[Tuple[ModelT, asyncio.Future]]:
+        batch = self._pending[: self.max_size]
+        self._pending = self._pending[self.max_size :]
+        if not self._pending:
+            self._has_items.clear()
+        if len(self._pending) < self.max_size:
+            self._full.clear()
+        return batch
+
+    def _take_all(self) -> List[Tuple[ModelT, asyncio.Future]]:
+        batch, self._pending = self._pending, []
+        self._has_items.clear()
+        self._full.clear()
+        return batch
+
+    async def _write(self, instances: List[ModelT]) -> None:
+        async with self.session_maker() as session:
+            session.add_all(instances)
+            await session.commit()
+
+    async def _flush(self, batch: List[Tuple[ModelT, asyncio.Future]]) -> None:
+        db_insert_batch_size.observe(len(batch))
+        try:
+            await self._write([instance for instance, _ in batch])
+        except Exception as e:
+            if len(batch) == 1:
+                _, future = batch[0]
+                if not future.done():
+                    future.set_exception(e)
+                return
+            logger.warning(
+                "Ошибка вставки пачки из %d строк, вставка по одной",
+                len(batch),
+                exc_info=True,
+            )
+            for item in batch:
+                await self._flush([item])
+            return
+        for instance, future in batch:
+            # Вызывающий мог быть отменен (клиент отключился), строка
+            # при этом уже записана
+            if not future.done():
+                future.set_result(instance)
+
+    async def _run(self) -> None:
+        try:
+            while not self._closing or self._pending:
+                await self._has_items.wait()
+                try:
+                    await asyncio.wait_for(self._full.wait(), self.window)
+                except asyncio.TimeoutError:
+                    pass
+                if self._pending:
+                    await self._flush(self._take_batch())
+        finally:
+            # Задача завершилась с ошибкой или отменена: ожидающие
+            # вызывающие получают ошибку, а не ждут бесконечно
+            for _, future in self._take_all():
+                if not future.done():
+                    future.set_exception(RuntimeError("BatchInserter остановлен"))
+
+    async def start(self) -> None:
+        """Запускает фоновую запись пачек."""
+        self._closing = False
+        self._task = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        """Записывает оставшиеся объекты и останавливает фоновую задачу."""
+        if self._task is None:
+            return
+        self._closing = True
+        # Пробуждает задачу без ожидания окна накопления
+        self._has_items.set()
+        self._full.set()
+        await self._task
+        self._task = None
+
+
+# Объединение вставок пользователей (None - каждая вставка в транзакции
+# своего запроса)
+user_inserter: Optional[BatchInserter] = (
+    BatchInserter(
+        sqlalchemy_config.create_session_maker(),
+        max_size=settings.USER_INSERT_BATCH_SIZE,
+        window=settings.USER_INSERT_BATCH_WINDOW,
+    )
+    if settings.USER_INSERT_BATCHING
+    else None
+)
+
+
+async def start_user_inserter() -> None:
+    """Запускает объединение вставок пользователей при старте приложения."""
+    if user_inserter is not None:
+        await user_inserter.start()
+
+
+async def close_user_inserter() -> None:
+    """Записывает оставшиеся вставки при завершении приложения."""
+    if user_inserter is not None:
+        await user_inserter.close()
@@ -0,0 +1,22 @@
+from typing import Any
+
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement, Executable
+
+
+class Explain(Executable, ClauseElement):
+    """Конструкция ``EXPLAIN (FORMAT JSON)`` для произвольного запроса.
+
+    Параметры исходного запроса остаются связанными переменными,
+    поэтому пользовательский ввод не подставляется в текст SQL.
+    """
+
+    inherit_cache = False
+
+    def __init__(self, statement: Any) -> None:
+        self.statement = statement
+
+
+@compiles(Explain, "postgresql")
+def _compile_explain(element: Explain, compiler: Any, **kw: Any) -> str:
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
@@ -0,0 +1,35 @@
+from typing import Any
+
+from sqlalchemy import DateTime
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import FunctionElement
+
+
+class utcnow(FunctionElement):
+    """Текущее время UTC без часового пояса для значений по умолчанию.
+
+    В PostgreSQL компилируется в ``NOW() AT TIME ZONE 'UTC'``, как в
+    миграциях; в остальных СУБД - в ``CURRENT_TIMESTAMP``, который там
+    уже в UTC. В SQLite (локальные прогоны бенчмарков и тесты) время
+    записывается строкой в формате, в котором SQLAlchemy хранит
+    ``DateTime``, с микросекундами: иначе прочитанное значение не равно
+    самому себе в условии ``updated_at = :value``.
+    """
+
+    type = DateTime(timezone=False)
+    inherit_cache = True
+
+
+@compiles(utcnow)
+def _compile_utcnow(element: utcnow, compiler: Any, **kw: Any) -> str:
+    return "CURRENT_TIMESTAMP"
+
+
+@compiles(utcnow, "sqlite")
+def _compile_utcnow_sqlite(element: utcnow, compiler: Any, **kw: Any) -> str:
+    return "(STRFTIME('%Y-%m-%d %H:%M:%f', 'now') || '000')"
+
+
+@compiles(utcnow, "postgresql")
+def _compile_utcnow_postgresql(element: utcnow, compiler: Any, **kw: Any) -> str:
+    return "(NOW() AT TIME ZONE 'UTC')"
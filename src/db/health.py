@@ -0,0 +1,79 @@
+import asyncio
+import logging
+import time
+from typing import Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+
+async def ping_engine(engine: AsyncEngine, timeout: float) -> bool:
+    """Проверяет, что движок выдает соединение и база отвечает на ``SELECT 1``.
+
+    Соединение берется из пула движка, поэтому исчерпанный пул, не
+    освободившийся за ``timeout``, тоже считается недоступностью.
+
+    Args:
+        engine: Асинхронный движок SQLAlchemy.
+        timeout: Таймаут проверки в секундах.
+
+    Returns:
+        bool: True, если база ответила вовремя.
+    """
+    try:
+        async with asyncio.timeout(timeout):
+            async with engine.connect() as connection:
+                await connection.execute(text("SELECT 1"))
+        return True
+    except Exception as e:
+        logger.debug("Проверка базы данных %s: %r", engine.url, e)
+        return False
+
+
+class DatabaseHealthCheck:
+    """Проверка готовности базы данных с кэшированием результата.
+
+    Результат ``SELECT 1`` переиспользуется ``interval`` секунд, а
+    одновременные запросы ждут одну общую проверку, поэтому частые
+    пробы оркестратора не создают нагрузку на пул соединений.
+
+    Attributes:
+        engine: Проверяемый движок.
+        interval: Время жизни результата проверки в секундах.
+        timeout: Таймаут одной проверки в секундах.
+        healthy: Результат последней проверки.
+        checked_at: Время последней проверки (``time.monotonic``).
+    """
+
+    def __init__(
+        self, engine: AsyncEngine, interval: float = 5.0, timeout: float = 2.0
+    ) -> None:
+        self.engine = engine
+        self.interval = interval
+        self.timeout = timeout
+        self.healthy = False
+        self.checked_at: Optional[float] = None
+        self._lock = asyncio.Lock()
+
+    def _is_fresh(self) -> bool:
+        return (
+            self.checked_at is not None
+            and time.monotonic() - self.checked_at < self.interval
+        )
+
+    async def check(self) -> bool:
+        """Возвращает готовность базы, проверяя ее не чаще раза в ``interval``.
+
+        Returns:
+            bool: True, если база доступна.
+        """
+        if self._is_fresh():
+            return self.healthy
+        async with self._lock:
+            # Пока ожидали блокировку, проверку мог выполнить другой запрос
+            if not self._is_fresh():
+                self.healthy = await ping_engine(self.engine, self.timeout)
+                self.checked_at = time.monotonic()
+        return self.healthy
@@ -1,9 +1,11 @@
 from datetime import datetime
 
 from advanced_alchemy.base import BigIntBase
-from sqlalchemy import Column, DateTime, String, func, text
+from sqlalchemy import Column, DateTime, Index, String
 from sqlalchemy.orm import Mapped
 
+from src.db.functions import utcnow
+
 
 class User(BigIntBase):
     """Модель пользователя.
@@ -17,6 +19,29 @@ class User(BigIntBase):
     """
 
     __tablename__ = "user"
+    __table_args__ = (
+        # Составной индекс для keyset-пагинации по (created_at, id)
+        Index("ix_user_created_at_id", "created_at", "id"),
+        # Индексы для точного поиска и сортировки по имени и фамилии
+        Index("ix_user_name_id", "name", "id"),
+        Index("ix_user_surname_id", "surname", "id"),
+        # Триграммные индексы (pg_trgm) для поиска по префиксу и подстроке
+        Index(
+            "ix_user_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_user_surname_trgm",
+            "surname",
+            postgresql_using="gin",
+            postgresql_ops={"surname": "gin_trgm_ops"},
+        ),
+    )
+    # Серверные значения created_at/updated_at возвращаются через RETURNING
+    # в том же INSERT/UPDATE, без отдельного SELECT на каждую запись
+    __mapper_args__ = {"eager_defaults": True}
 
     name: Mapped[str] = Column(String, nullable=False)
     surname: Mapped[str] = Column(String, nullable=False)
@@ -24,14 +49,15 @@ class User(BigIntBase):
     
     # Сохраняем timezone=False для соответствия требованию UTC-0
     # Используем NOW() AT TIME ZONE 'UTC' для явного указания UTC
+    # (см. utcnow: в SQLite - CURRENT_TIMESTAMP)
     created_at: Mapped[datetime] = Column(
         DateTime(timezone=False), 
-        server_default=text("(NOW() AT TIME ZONE 'UTC')"), 
+        server_default=utcnow(), 
         nullable=False
     )
     updated_at: Mapped[datetime] = Column(
         DateTime(timezone=False),
-        server_default=text("(NOW() AT TIME ZONE 'UTC')"),
-        onupdate=text("(NOW() AT TIME ZONE 'UTC')"),
+        server_default=utcnow(),
+        onupdate=utcnow(),
         nullable=False,
     )
@@ -0,0 +1,51 @@
+import time
+from typing import Any, cast
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """Пул соединений, учитывающий время ожидания свободного соединения.
+
+    Помимо стандартных показателей ``QueuePool`` (занятые соединения,
+    переполнение) накапливает количество и суммарное время выдачи
+    соединений из пула, а также число таймаутов ожидания. Время выдачи
+    включает ожидание свободного соединения, открытие нового и pre-ping.
+
+    Attributes:
+        checkouts: Количество выданных соединений.
+        wait_time_total: Суммарное время ожидания соединения в секундах.
+        wait_time_max: Максимальное время ожидания соединения в секундах.
+        timeouts: Количество таймаутов ожидания соединения.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.checkouts = 0
+        self.wait_time_total = 0.0
+        self.wait_time_max = 0.0
+        self.timeouts = 0
+
+    def connect(self) -> Any:
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            self.timeouts += 1
+            raise
+        elapsed = time.perf_counter() - started
+        self.checkouts += 1
+        self.wait_time_total += elapsed
+        if elapsed > self.wait_time_max:
+            self.wait_time_max = elapsed
+        return connection
+
+    def recreate(self) -> "InstrumentedAsyncQueuePool":
+        # Счетчики переносятся в новый пул, чтобы не обнуляться при dispose()
+        pool = cast("InstrumentedAsyncQueuePool", super().recreate())
+        pool.checkouts = self.checkouts
+        pool.wait_time_total = self.wait_time_total
+        pool.wait_time_max = self.wait_time_max
+        pool.timeouts = self.timeouts
+        return pool
@@ -0,0 +1,64 @@
+import logging
+import time
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, ExecutionContext
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.core.config import settings
+from src.core.profiling import (db_slow_statements_total, db_statement_duration,
+                                get_request_profile)
+
+logger = logging.getLogger(__name__)
+
+# Атрибут контекста выполнения с отметкой начала запроса
+_STARTED_ATTR = "_profiling_started"
+
+
+def _before_cursor_execute(
+    conn: Connection,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: ExecutionContext,
+    executemany: bool,
+) -> None:
+    setattr(context, _STARTED_ATTR, time.perf_counter())
+
+
+def _after_cursor_execute(
+    conn: Connection,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: ExecutionContext,
+    executemany: bool,
+) -> None:
+    started = getattr(context, _STARTED_ATTR, None)
+    if started is None:
+        return
+    duration = time.perf_counter() - started
+    db_statement_duration.observe(duration)
+    profile = get_request_profile()
+    if profile is not None:
+        profile.add_statement(duration)
+    threshold = settings.DB_SLOW_QUERY_THRESHOLD
+    if threshold and duration >= threshold:
+        db_slow_statements_total.inc()
+        # Параметры не пишем в журнал: в них могут быть хеши паролей
+        logger.warning("Медленный SQL-запрос (%.3f с): %s", duration, statement)
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """Подключает учет SQL-запросов к движку.
+
+    Для каждого запроса обновляются метрики, статистика текущего
+    HTTP-запроса (для ``Server-Timing``), а запросы дольше
+    ``DB_SLOW_QUERY_THRESHOLD`` пишутся в журнал.
+
+    Args:
+        engine: Асинхронный движок SQLAlchemy.
+    """
+    event.listen(engine.sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine.sync_engine, "after_cursor_execute", _after_cursor_execute)
@@ -0,0 +1,138 @@
+import asyncio
+import itertools
+import logging
+import time
+from typing import Mapping, Optional, Sequence
+
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.db.health import ping_engine
+
+logger = logging.getLogger(__name__)
+
+# Cookie с временем последнего изменения данных клиентом
+LAST_WRITE_COOKIE = "db_last_write"
+
+
+class ReplicaRouter:
+    """Выбор реплики для чтения по кругу среди доступных.
+
+    Доступность реплик проверяется фоновой задачей запросом ``SELECT 1``
+    с таймаутом. Если доступных реплик нет, :meth:`choose` возвращает
+    None и чтение выполняется в основной базе.
+
+    Attributes:
+        engines: Движки реплик.
+        healthy: Результат последней проверки каждой реплики.
+        check_interval: Интервал проверки в секундах.
+        check_timeout: Таймаут проверки одной реплики в секундах.
+    """
+
+    def __init__(
+        self,
+        engines: Sequence[AsyncEngine],
+        check_interval: float = 5.0,
+        check_timeout: float = 2.0,
+    ) -> None:
+        self.engines = list(engines)
+        # До первой проверки реплики считаются доступными
+        self.healthy = [True] * len(self.engines)
+        self.check_interval = check_interval
+        self.check_timeout = check_timeout
+        self._counter = itertools.count()
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def enabled(self) -> bool:
+        """Настроены ли реплики."""
+        return bool(self.engines)
+
+    def choose(self) -> Optional[AsyncEngine]:
+        """Следующая доступная реплика.
+
+        Returns:
+            Optional[AsyncEngine]: Движок реплики или None, если доступных нет.
+        """
+        available = [
+            engine for engine, healthy in zip(self.engines, self.healthy) if healthy
+        ]
+        if not available:
+            return None
+        return available[next(self._counter) % len(available)]
+
+    async def check(self) -> None:
+        """Проверяет доступность всех реплик."""
+        results = await asyncio.gather(
+            *(ping_engine(engine, self.check_timeout) for engine in self.engines)
+        )
+        for index, healthy in enumerate(results):
+            if healthy != self.healthy[index]:
+                logger.warning(
+                    "Реплика %s %s",
+                    self.engines[index].url.render_as_string(hide_password=True),
+                    "снова доступна" if healthy else "недоступна",
+                )
+            self.healthy[index] = healthy
+
+    async def _run_checks(self) -> None:
+        while True:
+            await asyncio.sleep(self.check_interval)
+            await self.check()
+
+    async def start(self) -> None:
+        """Проверяет реплики и запускает периодическую проверку."""
+        if not self.enabled:
+            return
+        await self.check()
+        self._task = asyncio.create_task(self._run_checks())
+
+    async def close(self) -> None:
+        """Останавливает проверку и закрывает пулы соединений реплик."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        for engine in self.engines:
+            await engine.dispose()
+
+
+def reads_from_primary(cookies: Mapping[str, str], window: float) -> bool:
+    """Должно ли чтение идти в основную базу (read-your-writes).
+
+    Клиент, изменивший данные не более ``window`` секунд назад, читает
+    из основной базы, чтобы не получить устаревшие данные с реплики,
+    отстающей от нее.
+
+    Args:
+        cookies: Cookie запроса.
+        window: Длительность привязки к основной базе в секундах.
+
+    Returns:
+        bool: True, если клиент недавно изменял данные.
+    """
+    value = cookies.get(LAST_WRITE_COOKIE)
+    if value is None:
+        return False
+    try:
+        return time.time() - float(value) < window
+    except ValueError:
+        return False
+
+
+def last_write_cookie(window: float) -> str:
+    """Значение заголовка Set-Cookie после изменения данных.
+
+    Args:
+        window: Длительность привязки к основной базе в секундах.
+
+    Returns:
+        str: Cookie с текущим временем, истекающий через ``window`` секунд.
+    """
+    return (
+        f"{LAST_WRITE_COOKIE}={time.time():.3f}; Max-Age={max(int(window), 1)}; "
+        "Path=/; HttpOnly; SameSite=Lax"
+    )
+
@@ -1,9 +1,419 @@
+import json
+from datetime import datetime, timezone
+from typing import (Any, AsyncIterator, Dict, List, Literal, Optional, Sequence,
+                    Set, Tuple)
+
 from advanced_alchemy.repository import SQLAlchemyAsyncRepository
+from sqlalchemy import (ColumnElement, Row, Select, delete, func, select, text,
+                        tuple_, update)
+from sqlalchemy.ext.asyncio import AsyncEngine
 
+from src.db.explain import Explain
 from src.db.models import User
 
+# Допустимые ключи сортировки для keyset-пагинации
+UserOrderBy = Literal["id", "created_at", "name", "surname"]
+
+# Режимы поиска по строковым полям
+MatchMode = Literal["exact", "prefix", "contains"]
+
+
+def escape_like(value: str) -> str:
+    """Экранирует спецсимволы шаблона LIKE (``%``, ``_`` и ``\\``)."""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def match_condition(column: Any, value: str, mode: MatchMode) -> ColumnElement[bool]:
+    """Условие поиска по строковой колонке.
+
+    Точное совпадение обслуживается B-tree индексом, поиск по префиксу
+    и подстроке (без учета регистра) - GIN-индексом pg_trgm.
+
+    Args:
+        column: Колонка модели.
+        value: Искомое значение.
+        mode: Режим поиска.
+
+    Returns:
+        ColumnElement[bool]: Условие для WHERE.
+    """
+    if mode == "prefix":
+        return column.ilike(f"{escape_like(value)}%", escape="\\")
+    if mode == "contains":
+        return column.ilike(f"%{escape_like(value)}%", escape="\\")
+    return column == value
+
+
+def to_naive_utc(value: datetime) -> datetime:
+    """Приводит дату к UTC без часового пояса, как в колонках модели.
+
+    Дата без часового пояса считается датой в UTC. Сравнение колонки
+    ``timestamp without time zone`` с датой с часовым поясом asyncpg
+    не кодирует.
+    """
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+async def stream_user_rows(
+    engine: AsyncEngine, columns: Sequence[Any], batch_size: int = 1000
+) -> AsyncIterator[Sequence[Row[Any]]]:
+    """Потоковое чтение всей таблицы пользователей пачками.
+
+    Использует серверный курсор на отдельном соединении: в памяти
+    находится не больше ``batch_size`` строк, независимо от размера
+    таблицы. Соединение не связано с сессией запроса, поэтому чтение
+    может продолжаться после отправки заголовков ответа.
+
+    Args:
+        engine: Асинхронный движок SQLAlchemy.
+        columns: Выбираемые колонки модели.
+        batch_size: Количество строк, получаемых за одно обращение к курсору.
+
+    Yields:
+        Sequence[Row[Any]]: Очередная пачка строк в порядке ``id``.
+    """
+    statement = (
+        select(*columns)
+        .order_by(User.id)
+        .execution_options(yield_per=batch_size)
+    )
+    async with engine.connect() as connection:
+        result = await connection.stream(statement)
+        async for partition in result.partitions():
+            yield partition
+
 
 class UserRepository(SQLAlchemyAsyncRepository[User]):
     """Репозиторий для работы с пользователями на основе Advanced-SQLAlchemy."""
 
     model_type = User
+
+    @staticmethod
+    def keyset_columns(order_by: UserOrderBy) -> Tuple[Any, ...]:
+        """Возвращает колонки ключа сортировки.
+
+        Каждый ключ заканчивается первичным ключом, чтобы порядок был
+        однозначным и совпадал с индексом.
+
+        Args:
+            order_by: Ключ сортировки.
+
+        Returns:
+            Tuple[Any, ...]: Колонки модели в порядке сортировки.
+        """
+        if order_by == "created_at":
+            return (User.created_at, User.id)
+        if order_by == "name":
+            return (User.name, User.id)
+        if order_by == "surname":
+            return (User.surname, User.id)
+        return (User.id,)
+
+    @staticmethod
+    def search_filters(
+        name: Optional[str] = None,
+        name_match: MatchMode = "exact",
+        surname: Optional[str] = None,
+        surname_match: MatchMode = "exact",
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+    ) -> List[ColumnElement[bool]]:
+        """Условия поиска пользователей.
+
+        Args:
+            name: Значение для поиска по имени.
+            name_match: Режим поиска по имени.
+            surname: Значение для поиска по фамилии.
+            surname_match: Режим поиска по фамилии.
+            created_after: Нижняя граница даты создания (включительно);
+                дата с часовым поясом приводится к UTC.
+            created_before: Верхняя граница даты создания (не включительно).
+
+        Returns:
+            List[ColumnElement[bool]]: Условия для WHERE.
+        """
+        filters: List[ColumnElement[bool]] = []
+        if name is not None:
+            filters.append(match_condition(User.name, name, name_match))
+        if surname is not None:
+            filters.append(match_condition(User.surname, surname, surname_match))
+        if created_after is not None:
+            filters.append(User.created_at >= to_naive_utc(created_after))
+        if created_before is not None:
+            filters.append(User.created_at < to_naive_utc(created_before))
+        return filters
+
+    @classmethod
+    def list_statement(
+        cls,
+        columns: Sequence[Any],
+        limit: int,
+        order_by: UserOrderBy = "id",
+        descending: bool = False,
+        offset: int = 0,
+        after: Optional[Tuple[Any, ...]] = None,
+        filters: Sequence[ColumnElement[bool]] = (),
+        with_total: bool = False,
+    ) -> Select[Any]:
+        """Запрос страницы пользователей (см. :meth:`list_rows`).
+
+        Returns:
+            Select[Any]: Запрос ``SELECT`` с сортировкой и ограничением.
+        """
+        keys = cls.keyset_columns(order_by)
+        if with_total:
+            columns = (*columns, func.count().over())
+        statement = (
+            select(*columns)
+            .where(*filters)
+            .order_by(*(key.desc() if descending else key for key in keys))
+            .limit(limit)
+        )
+        if offset:
+            statement = statement.offset(offset)
+        if after is not None:
+            position = keys[0] if len(keys) == 1 else tuple_(*keys)
+            bound = after[0] if len(keys) == 1 else tuple_(*after)
+            statement = statement.where(
+                position < bound if descending else position > bound
+            )
+        return statement
+
+    async def list_rows(
+        self,
+        columns: Sequence[Any],
+        limit: int,
+        order_by: UserOrderBy = "id",
+        descending: bool = False,
+        offset: int = 0,
+        after: Optional[Tuple[Any, ...]] = None,
+        filters: Sequence[ColumnElement[bool]] = (),
+        with_total: bool = False,
+    ) -> Sequence[Row[Any]]:
+        """Получение страницы пользователей в виде строк Core.
+
+        Выбираются только переданные колонки, без создания ORM-объектов
+        и регистрации их в identity map. Поддерживается как пагинация
+        LIMIT/OFFSET, так и keyset-пагинация: при передаче ``after`` база
+        данных не просматривает пропущенные строки, а начинает страницу
+        сразу с позиции в индексе.
+
+        Args:
+            columns: Выбираемые колонки модели.
+            limit: Максимальное количество записей.
+            order_by: Ключ сортировки.
+            descending: Сортировка по убыванию.
+            offset: Количество пропускаемых записей.
+            after: Значения ключа последней записи предыдущей страницы.
+            filters: Условия поиска (см. :meth:`search_filters`).
+            with_total: Добавить последней колонкой общее количество строк,
+                удовлетворяющих фильтрам (``COUNT(*) OVER ()``), чтобы получить
+                страницу и количество за одно обращение к базе данных.
+
+        Returns:
+            Sequence[Row[Any]]: Строки с колонками в порядке ``columns``.
+        """
+        result = await self.session.execute(
+            self.list_statement(
+                columns,
+                limit,
+                order_by=order_by,
+                descending=descending,
+                offset=offset,
+                after=after,
+                filters=filters,
+                with_total=with_total,
+            )
+        )
+        return result.all()
+
+    @staticmethod
+    def count_statement(filters: Sequence[ColumnElement[bool]] = ()) -> Select[Any]:
+        """Запрос точного количества пользователей, удовлетворяющих фильтрам.
+
+        Args:
+            filters: Условия поиска (см. :meth:`search_filters`).
+
+        Returns:
+            Select[Any]: Запрос ``SELECT count(*)``.
+        """
+        return select(func.count()).select_from(User).where(*filters)
+
+    async def count_rows(self, filters: Sequence[ColumnElement[bool]] = ()) -> int:
+        """Точное количество пользователей, удовлетворяющих фильтрам.
+
+        Args:
+            filters: Условия поиска.
+
+        Returns:
+            int: Количество пользователей.
+        """
+        result = await self.session.execute(self.count_statement(filters))
+        return result.scalar_one()
+
+    async def estimate_count(
+        self, filters: Sequence[ColumnElement[bool]] = ()
+    ) -> int:
+        """Оценка количества пользователей по статистике планировщика.
+
+        Без фильтров используется ``pg_class.reltuples``, с фильтрами -
+        оценка строк из плана ``EXPLAIN``. Оба варианта не читают таблицу.
+        Для других СУБД, а также если статистика еще не собрана,
+        выполняется точный подсчет.
+
+        Args:
+            filters: Условия поиска.
+
+        Returns:
+            int: Приблизительное количество пользователей.
+        """
+        if self.session.bind.dialect.name != "postgresql":
+            return await self.count_rows(filters)
+        if not filters:
+            result = await self.session.execute(
+                text(
+                    "SELECT CAST(reltuples AS bigint) FROM pg_class "
+                    "WHERE oid = CAST(:table AS regclass)"
+                ),
+                {"table": f'"{User.__tablename__}"'},
+            )
+            estimate = result.scalar_one_or_none()
+        else:
+            result = await self.session.execute(
+                Explain(select(User.id).where(*filters))
+            )
+            plan = result.scalar_one()
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            estimate = plan[0]["Plan"]["Plan Rows"]
+        # reltuples = -1, если таблица еще не анализировалась
+        if estimate is None or estimate < 0:
+            return await self.count_rows(filters)
+        return int(estimate)
+
+    async def get_row(
+        self, user_id: int, columns: Sequence[Any]
+    ) -> Optional[Row[Any]]:
+        """Получение одного пользователя в виде строки Core.
+
+        Args:
+            user_id: Идентификатор пользователя.
+            columns: Выбираемые колонки модели.
+
+        Returns:
+            Optional[Row[Any]]: Строка с колонками в порядке ``columns``
+                или None, если пользователя нет.
+        """
+        result = await self.session.execute(select(*columns).where(User.id == user_id))
+        return result.first()
+
+    async def get_updated_at(self, user_id: int) -> Optional[datetime]:
+        """Дата последнего обновления пользователя без чтения всей записи.
+
+        Используется для условных запросов (ETag, If-Modified-Since).
+
+        Args:
+            user_id: Идентификатор пользователя.
+
+        Returns:
+            Optional[datetime]: Значение updated_at или None, если
+                пользователя нет.
+        """
+        result = await self.session.execute(
+            select(User.updated_at).where(User.id == user_id)
+        )
+        return result.scalar_one_or_none()
+
+    async def existing_ids(self, ids: Sequence[int]) -> Set[int]:
+        """Возвращает идентификаторы пользователей, существующих в базе.
+
+        Выбирается только первичный ключ, без загрузки ORM-объектов.
+
+        Args:
+            ids: Проверяемые идентификаторы.
+
+        Returns:
+            Set[int]: Существующие идентификаторы из переданных.
+        """
+        if not ids:
+            return set()
+        result = await self.session.execute(
+            select(User.id).where(User.id.in_(ids))
+        )
+        return set(result.scalars())
+
+    async def update_many_by_id(self, values: Sequence[Dict[str, Any]]) -> None:
+        """Пакетное обновление пользователей по первичному ключу.
+
+        Выполняется как executemany ``UPDATE ... WHERE id = ...`` без
+        загрузки ORM-объектов. Элементы с разным набором колонок
+        отправляются отдельными пакетами.
+
+        Args:
+            values: Словари с ``id`` и новыми значениями колонок.
+        """
+        if values:
+            await self.session.execute(update(User), list(values))
+
+    async def update_by_id(
+        self,
+        user_id: int,
+        values: Dict[str, Any],
+        expected_updated_at: Optional[Sequence[datetime]] = None,
+    ) -> Optional[User]:
+        """Обновление пользователя одним запросом UPDATE ... RETURNING.
+
+        Запись не читается заранее: отсутствие возвращенной строки
+        означает, что пользователя нет или его версия не совпала
+        с ожидаемой.
+
+        Args:
+            user_id: Идентификатор пользователя.
+            values: Новые значения колонок.
+            expected_updated_at: Допустимые значения updated_at
+                (оптимистическая блокировка по If-Match); None - без проверки.
+
+        Returns:
+            Optional[User]: Обновленный пользователь или None, если его нет
+                или он был изменен после ожидаемой версии.
+        """
+        statement = update(User).where(User.id == user_id)
+        if expected_updated_at is not None:
+            statement = statement.where(User.updated_at.in_(expected_updated_at))
+        result = await self.session.execute(
+            statement.values(**values).returning(User)
+        )
+        return result.scalar_one_or_none()
+
+    async def delete_by_id(self, user_id: int) -> Optional[int]:
+        """Удаление пользователя одним запросом DELETE ... RETURNING id.
+
+        Args:
+            user_id: Идентификатор пользователя.
+
+        Returns:
+            Optional[int]: Идентификатор удаленного пользователя или None,
+                если его нет.
+        """
+        result = await self.session.execute(
+            delete(User).where(User.id == user_id).returning(User.id)
+        )
+        return result.scalar_one_or_none()
+
+    async def delete_many_by_id(self, ids: Sequence[int]) -> Set[int]:
+        """Пакетное удаление одним запросом DELETE ... RETURNING id.
+
+        Args:
+            ids: Идентификаторы удаляемых пользователей.
+
+        Returns:
+            Set[int]: Идентификаторы удаленных пользователей.
+        """
+        if not ids:
+            return set()
+        result = await self.session.execute(
+            delete(User).where(User.id.in_(ids)).returning(User.id)
+        )
+        return set(result.scalars())
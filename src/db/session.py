@@ -1,28 +1,237 @@
-from typing import AsyncGenerator
+from typing import (Any, AsyncGenerator, Awaitable, Callable, Dict, List, Tuple,
+                    Union, cast)
 
 from advanced_alchemy.config import EngineConfig
-from advanced_alchemy.extensions.litestar import (SQLAlchemyAsyncConfig,
+from advanced_alchemy.extensions.litestar._utils import get_aa_scope_state
+from advanced_alchemy.extensions.litestar import (AsyncSessionConfig,
+                                                  SQLAlchemyAsyncConfig,
                                                   SQLAlchemyInitPlugin)
-from sqlalchemy.ext.asyncio import AsyncSession
+from advanced_alchemy.extensions.litestar.plugins.init.config.asyncio import \
+    autocommit_handler_maker
+from litestar import Request
+from litestar.constants import HTTP_RESPONSE_START
+from litestar.datastructures import MutableScopeHeaders, State
+from litestar.types import HTTPResponseStartEvent, HTTPScope, Message, Scope
+from sqlalchemy.ext.asyncio import (AsyncEngine, AsyncSession,
+                                    async_scoped_session, create_async_engine)
 
 from src.core.config import settings
+from src.db.pool import InstrumentedAsyncQueuePool
+from src.db.health import DatabaseHealthCheck
+from src.db.profiling import instrument_engine
+from src.db.replicas import ReplicaRouter, last_write_cookie, reads_from_primary
+
+# Методы, не изменяющие данные: после них клиент не привязывается
+# к основной базе
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+def build_connect_args(url: str = settings.DATABASE_URL) -> Dict[str, Any]:
+    """Параметры подключения драйвера базы данных.
+
+    Размеры кэшей подготовленных выражений передаются только asyncpg.
+
+    Args:
+        url: Строка подключения.
+
+    Returns:
+        Dict[str, Any]: Аргументы для ``connect_args`` движка.
+    """
+    if not url.startswith("postgresql+asyncpg"):
+        return {}
+    return {
+        "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+        "prepared_statement_cache_size": settings.DB_PREPARED_STATEMENT_CACHE_SIZE,
+    }
+
+
+def build_pool_limits() -> Tuple[int, int]:
+    """Размер пула и допустимое переполнение для одного воркера.
+
+    Каждый процесс-воркер создает собственный пул. Лимит
+    ``DB_MAX_CONNECTIONS`` делится поровну между воркерами, чтобы
+    суммарное число соединений не превышало лимит базы данных; пул
+    воркера при этом не больше ``DB_POOL_SIZE + DB_MAX_OVERFLOW``.
+
+    Returns:
+        Tuple[int, int]: ``pool_size`` и ``max_overflow``.
+    """
+    if not settings.DB_MAX_CONNECTIONS:
+        return settings.DB_POOL_SIZE, settings.DB_MAX_OVERFLOW
+    per_worker = min(
+        max(settings.DB_MAX_CONNECTIONS // settings.server_workers, 1),
+        settings.DB_POOL_SIZE + settings.DB_MAX_OVERFLOW,
+    )
+    pool_size = min(settings.DB_POOL_SIZE, per_worker)
+    return pool_size, per_worker - pool_size
+
+
+_pool_size, _max_overflow = build_pool_limits()
 
 # Конфигурация для движка SQLAlchemy
-engine_config = EngineConfig(echo=settings.DEBUG)
+engine_config = EngineConfig(
+    echo=settings.DEBUG,
+    poolclass=InstrumentedAsyncQueuePool,
+    pool_size=_pool_size,
+    max_overflow=_max_overflow,
+    # SQLAlchemy принимает дробный таймаут, аннотация EngineConfig - int
+    pool_timeout=settings.DB_POOL_TIMEOUT,  # type: ignore[arg-type]
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+    connect_args=build_connect_args(),
+)
+
+# Ключ Session.info со списком действий после успешного коммита
+AFTER_COMMIT_INFO_KEY = "after_commit"
+
+_autocommit_handler = autocommit_handler_maker()
+
+
+# Сессия запроса, как ее типизирует репозиторий advanced-alchemy
+RequestSession = Union[AsyncSession, async_scoped_session[AsyncSession]]
+
+
+def after_commit(
+    session: RequestSession, callback: Callable[[], Awaitable[Any]]
+) -> None:
+    """Регистрирует действие, выполняемое после коммита транзакции запроса.
+
+    Используется для побочных эффектов, которые нельзя выполнять до
+    фиксации изменений (например, инвалидации кэша). При откате
+    транзакции действия отбрасываются.
+
+    Args:
+        session: Сессия текущего запроса.
+        callback: Асинхронная функция без аргументов.
+    """
+    session.info.setdefault(AFTER_COMMIT_INFO_KEY, []).append(callback)
+
+
+async def autocommit_before_send_handler(message: Message, scope: Scope) -> None:
+    """Фиксирует транзакцию запроса перед отправкой ответа.
+
+    При успешном ответе (2xx) транзакция коммитится, иначе
+    откатывается; затем сессия закрывается. После коммита выполняются
+    действия, зарегистрированные через :func:`after_commit`. Если
+    настроены реплики, успешный изменяющий запрос получает cookie,
+    привязывающий чтения клиента к основной базе (read-your-writes).
+
+    Args:
+        message: ASGI-сообщение.
+        scope: ASGI-scope запроса.
+    """
+    callbacks: List[Callable[[], Awaitable[Any]]] = []
+    status = 0
+    if message["type"] == HTTP_RESPONSE_START:
+        status = cast(HTTPResponseStartEvent, message)["status"]
+        session = get_aa_scope_state(scope, sqlalchemy_config.session_scope_key)
+        if session is not None:
+            callbacks = session.info.pop(AFTER_COMMIT_INFO_KEY, [])
+            if (
+                replica_router.enabled
+                and cast(HTTPScope, scope)["method"] not in SAFE_METHODS
+                and 200 <= status < 300
+            ):
+                MutableScopeHeaders.from_message(message).add(
+                    "set-cookie", last_write_cookie(settings.DB_READ_YOUR_WRITES_WINDOW)
+                )
+    await _autocommit_handler(message, scope)
+    if callbacks and 200 <= status < 300:
+        for callback in callbacks:
+            await callback()
+
 
 # Конфигурация SQLAlchemy для асинхронного подключения
 sqlalchemy_config = SQLAlchemyAsyncConfig(
     connection_string=settings.DATABASE_URL,
     engine_config=engine_config,
+    # Объекты остаются доступными после коммита, который выполняется
+    # уже после формирования ответа
+    session_config=AsyncSessionConfig(expire_on_commit=False),
+    before_send_handler=autocommit_before_send_handler,
     create_all=False,  # Полагаемся только на миграции для управления схемой
 )
+# Движок создается один раз: состояние приложения и фабрика сессий
+# используют общий пул соединений
+sqlalchemy_config.engine_instance = sqlalchemy_config.get_engine()
+if settings.PROFILING_ENABLED:
+    instrument_engine(sqlalchemy_config.engine_instance)
 
 # Инициализация плагина SQLAlchemy для Litestar
 sqlalchemy_plugin = SQLAlchemyInitPlugin(config=sqlalchemy_config)
 
+# Проверка готовности основной базы для /health/ready
+db_health_check = DatabaseHealthCheck(
+    sqlalchemy_config.engine_instance,
+    interval=settings.HEALTH_CHECK_INTERVAL,
+    timeout=settings.HEALTH_CHECK_TIMEOUT,
+)
+
+
+def create_replica_engine(url: str) -> AsyncEngine:
+    """Создает движок реплики с настройками пула основной базы.
+
+    Args:
+        url: Строка подключения реплики.
+
+    Returns:
+        AsyncEngine: Движок реплики.
+    """
+    engine = create_async_engine(
+        url,
+        **{**sqlalchemy_config.engine_config_dict, "connect_args": build_connect_args(url)},
+    )
+    if settings.PROFILING_ENABLED:
+        instrument_engine(engine)
+    return engine
+
+
+# Маршрутизация чтений по репликам (без реплик все запросы идут
+# в основную базу)
+replica_router = ReplicaRouter(
+    [create_replica_engine(url) for url in settings.database_replica_urls],
+    check_interval=settings.DB_REPLICA_CHECK_INTERVAL,
+    check_timeout=settings.DB_REPLICA_CHECK_TIMEOUT,
+)
+
 
 # Провайдер сессии для внедрения зависимостей
-async def provide_db_session() -> AsyncGenerator[AsyncSession, None]:
-    """Провайдер сессии БД для внедрения зависимостей."""
-    async with sqlalchemy_config.create_session_factory()() as session:
+def provide_db_session(state: State, scope: Scope) -> AsyncSession:
+    """Провайдер сессии БД для внедрения зависимостей.
+
+    Возвращает сессию, которой управляет ``SQLAlchemyInitPlugin``: одна
+    сессия на запрос из общей фабрики, созданной при старте приложения.
+    Коммит или откат выполняет :func:`autocommit_before_send_handler`.
+    """
+    return sqlalchemy_config.provide_session(state, scope)
+
+
+async def provide_read_db_session(
+    state: State, scope: Scope, request: Request
+) -> AsyncGenerator[AsyncSession, None]:
+    """Провайдер сессии БД для обработчиков, только читающих данные.
+
+    Сессия открывается на очередной доступной реплике. В основную базу
+    чтение направляется, если реплики не настроены или недоступны, а
+    также если клиент недавно изменял данные (cookie ``db_last_write``),
+    чтобы он сразу видел свои изменения. Сессия реплики закрывается
+    после обработки запроса без коммита.
+    """
+    engine = None
+    if not reads_from_primary(request.cookies, settings.DB_READ_YOUR_WRITES_WINDOW):
+        engine = replica_router.choose()
+    if engine is None:
+        yield provide_db_session(state, scope)
+        return
+    async with AsyncSession(
+        bind=engine, expire_on_commit=False, info={"replica": True}
+    ) as session:
         yield session
+
+
+def is_replica_session(session: RequestSession) -> bool:
+    """Открыта ли сессия на реплике (см. :func:`provide_read_db_session`).
+
+    Данные, прочитанные с реплики, могут отставать от основной базы.
+    """
+    return bool(session.info.get("replica"))
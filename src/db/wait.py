@@ -0,0 +1,81 @@
+"""Ожидание готовности базы данных перед миграциями и запуском сервера.
+
+    python -m src.db.wait --timeout 60
+
+Подключение повторяется с экспоненциальной задержкой (от 0.1 до 2 с), поэтому
+доступная база обнаруживается почти сразу, без запуска alembic на каждую
+попытку. Код выхода 1, если база не ответила за ``--timeout`` секунд.
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from typing import List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
+
+
+async def wait_for_database(
+    url: str,
+    timeout: float = 60.0,
+    initial_delay: float = 0.1,
+    max_delay: float = 2.0,
+) -> bool:
+    """Ждет, пока база данных начнет принимать подключения.
+
+    Args:
+        url: Строка подключения SQLAlchemy.
+        timeout: Максимальное время ожидания в секундах.
+        initial_delay: Задержка перед второй попыткой в секундах.
+        max_delay: Максимальная задержка между попытками в секундах.
+
+    Returns:
+        bool: True, если база ответила на ``SELECT 1`` до истечения таймаута.
+    """
+    engine = create_async_engine(url, poolclass=NullPool)
+    deadline = time.monotonic() + timeout
+    delay = initial_delay
+    attempt = 1
+    try:
+        while True:
+            try:
+                async with engine.connect() as connection:
+                    await connection.execute(text("SELECT 1"))
+                return True
+            except Exception as e:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    print(f"База данных недоступна: {e!r}", file=sys.stderr)
+                    return False
+                print(
+                    f"База данных недоступна (попытка {attempt}), "
+                    f"повтор через {delay:.1f} с",
+                    file=sys.stderr,
+                )
+                await asyncio.sleep(min(delay, remaining))
+                delay = min(delay * 2, max_delay)
+                attempt += 1
+    finally:
+        await engine.dispose()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m src.db.wait", description="Ожидание готовности базы данных"
+    )
+    parser.add_argument(
+        "--timeout", type=float, default=60.0, help="Максимальное время ожидания, с"
+    )
+    args = parser.parse_args(argv)
+
+    from src.core.config import settings
+
+    ready = asyncio.run(wait_for_database(settings.DATABASE_URL, args.timeout))
+    return 0 if ready else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,230 @@
+from typing import List, cast
+
+from litestar import Controller, Response, get
+from litestar.status_codes import HTTP_200_OK, HTTP_503_SERVICE_UNAVAILABLE
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import QueuePool
+
+from src.core.limits import in_flight_limiter
+from src.core.profiling import metrics
+from src.db.pool import InstrumentedAsyncQueuePool
+from src.db.session import db_health_check, replica_router
+from src.domain.system.schemas import HealthSchema, PoolStatsSchema
+from src.domain.users.cache import user_cache
+from src.lib.metrics import (format_labels, format_value, metric_header,
+                             single_metric)
+
+# Тип содержимого текстового формата Prometheus
+PROMETHEUS_MEDIA_TYPE = "text/plain; version=0.0.4"
+
+
+def pool_stats(engine: AsyncEngine) -> PoolStatsSchema:
+    """Собирает показатели пула соединений движка.
+
+    Args:
+        engine: Асинхронный движок SQLAlchemy.
+
+    Returns:
+        PoolStatsSchema: Показатели пула.
+    """
+    # Движки приложения и реплик создаются с InstrumentedAsyncQueuePool
+    pool = cast(QueuePool, engine.sync_engine.pool)
+    checkouts = timeouts = 0
+    wait_time_total = wait_time_max = 0.0
+    if isinstance(pool, InstrumentedAsyncQueuePool):
+        checkouts = pool.checkouts
+        wait_time_total = pool.wait_time_total
+        wait_time_max = pool.wait_time_max
+        timeouts = pool.timeouts
+    return PoolStatsSchema(
+        size=pool.size(),
+        checked_in=pool.checkedin(),
+        checked_out=pool.checkedout(),
+        overflow=max(pool.overflow(), 0),
+        max_overflow=pool._max_overflow,
+        checkouts=checkouts,
+        timeouts=timeouts,
+        wait_time_total=wait_time_total,
+        wait_time_avg=wait_time_total / checkouts if checkouts else 0.0,
+        wait_time_max=wait_time_max,
+    )
+
+
+def pool_metrics(engine: AsyncEngine) -> List[str]:
+    """Показатели пула соединений в текстовом формате Prometheus.
+
+    Args:
+        engine: Асинхронный движок SQLAlchemy.
+
+    Returns:
+        List[str]: Строки метрик.
+    """
+    stats = pool_stats(engine)
+    return [
+        *single_metric("db_pool_size", "Размер пула соединений", stats.size),
+        *single_metric(
+            "db_pool_checked_out", "Соединения, выданные запросам", stats.checked_out
+        ),
+        *single_metric(
+            "db_pool_overflow", "Соединения сверх размера пула", stats.overflow
+        ),
+        *single_metric(
+            "db_pool_checkouts_total",
+            "Всего выдано соединений",
+            stats.checkouts,
+            "counter",
+        ),
+        *single_metric(
+            "db_pool_timeouts_total",
+            "Таймауты ожидания соединения",
+            stats.timeouts,
+            "counter",
+        ),
+        *single_metric(
+            "db_pool_wait_seconds_total",
+            "Суммарное время получения соединения",
+            stats.wait_time_total,
+            "counter",
+        ),
+        *single_metric(
+            "db_pool_wait_seconds_max",
+            "Максимальное время получения соединения",
+            stats.wait_time_max,
+        ),
+    ]
+
+
+def user_cache_metrics() -> List[str]:
+    """Счетчики кэша пользователей в текстовом формате Prometheus.
+
+    Returns:
+        List[str]: Строки метрик.
+    """
+    lines: List[str] = []
+    for name, value in user_cache.stats().items():
+        lines.extend(
+            single_metric(
+                f"user_cache_{name}_total",
+                f"Кэш пользователей: {name}",
+                value,
+                "counter",
+            )
+        )
+    return lines
+
+
+def replica_metrics() -> List[str]:
+    """Доступность реплик для чтения в текстовом формате Prometheus.
+
+    Returns:
+        List[str]: Строки метрик или пустой список, если реплик нет.
+    """
+    if not replica_router.enabled:
+        return []
+    lines = metric_header(
+        "db_replica_healthy", "Реплика прошла последнюю проверку доступности", "gauge"
+    )
+    for index, healthy in enumerate(replica_router.healthy):
+        labels = format_labels(["replica"], [str(index)])
+        lines.append(f"db_replica_healthy{labels} {format_value(healthy)}")
+    return lines
+
+
+def load_shedding_metrics() -> List[str]:
+    """Текущие запросы к /users в текстовом формате Prometheus.
+
+    Returns:
+        List[str]: Строки метрик.
+    """
+    return single_metric(
+        "http_requests_in_flight",
+        "Запросы к /users, обрабатываемые воркером",
+        in_flight_limiter.in_flight,
+    )
+
+
+class MetricsController(Controller):
+    """Метрики приложения для Prometheus."""
+
+    path = "/metrics"
+    tags = ["system"]
+
+    @get("/", media_type=PROMETHEUS_MEDIA_TYPE)
+    async def get_metrics(self, db_engine: AsyncEngine) -> str:
+        """Метрики в текстовом формате Prometheus.
+
+        Включает время обработки запросов по этапам, количество и время
+        SQL-запросов, показатели пула соединений, кэша пользователей,
+        доступность реплик и отклоненные при перегрузке запросы.
+
+        Args:
+            db_engine: Движок SQLAlchemy, созданный плагином.
+
+        Returns:
+            str: Текст метрик.
+        """
+        lines = (
+            metrics.collect()
+            + pool_metrics(db_engine)
+            + user_cache_metrics()
+            + replica_metrics()
+            + load_shedding_metrics()
+        )
+        return "\n".join(lines) + "\n"
+
+
+class SystemController(Controller):
+    """Служебные эндпоинты для мониторинга приложения."""
+
+    path = "/system"
+    tags = ["system"]
+
+    @get("/db-pool")
+    async def get_db_pool_stats(self, db_engine: AsyncEngine) -> PoolStatsSchema:
+        """Показатели пула соединений с базой данных.
+
+        Args:
+            db_engine: Движок SQLAlchemy, созданный плагином.
+
+        Returns:
+            PoolStatsSchema: Занятые и свободные соединения, переполнение
+                и время ожидания соединения.
+        """
+        return pool_stats(db_engine)
+
+
+class HealthController(Controller):
+    """Пробы живости и готовности для Docker и оркестратора.
+
+    Пробы не профилируются и не попадают в метрики запросов.
+    """
+
+    path = "/health"
+    tags = ["system"]
+    opt = {"skip_profiling": True}
+
+    @get("/live")
+    async def live(self) -> HealthSchema:
+        """Процесс жив и обрабатывает запросы (без обращения к базе).
+
+        Returns:
+            HealthSchema: Всегда ``ok``.
+        """
+        return HealthSchema(status="ok")
+
+    @get("/ready")
+    async def ready(self) -> Response[HealthSchema]:
+        """Сервис готов принимать запросы: пул выдает соединение с базой.
+
+        Результат ``SELECT 1`` кэшируется на ``HEALTH_CHECK_INTERVAL``
+        секунд.
+
+        Returns:
+            Response[HealthSchema]: ``ok`` (200) или ``unavailable`` (503).
+        """
+        if await db_health_check.check():
+            return Response(HealthSchema(status="ok"), status_code=HTTP_200_OK)
+        return Response(
+            HealthSchema(status="unavailable"),
+            status_code=HTTP_503_SERVICE_UNAVAILABLE,
+        )
@@ -0,0 +1,41 @@
+from typing import Literal
+
+import msgspec
+
+
+class PoolStatsSchema(msgspec.Struct):
+    """Состояние пула соединений с базой данных.
+
+    Attributes:
+        size: Размер пула (постоянные соединения).
+        checked_in: Свободные соединения в пуле.
+        checked_out: Соединения, выданные запросам.
+        overflow: Текущее количество соединений сверх размера пула.
+        max_overflow: Допустимое количество соединений сверх размера пула.
+        checkouts: Всего выдано соединений с момента запуска.
+        timeouts: Количество таймаутов ожидания соединения.
+        wait_time_total: Суммарное время получения соединения (секунды).
+        wait_time_avg: Среднее время получения соединения (секунды).
+        wait_time_max: Максимальное время получения соединения (секунды).
+    """
+
+    size: int
+    checked_in: int
+    checked_out: int
+    overflow: int
+    max_overflow: int
+    checkouts: int
+    timeouts: int
+    wait_time_total: float
+    wait_time_avg: float
+    wait_time_max: float
+
+
+class HealthSchema(msgspec.Struct):
+    """Результат проверки состояния сервиса.
+
+    Attributes:
+        status: ``ok`` или ``unavailable``.
+    """
+
+    status: Literal["ok", "unavailable"]
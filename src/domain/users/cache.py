@@ -0,0 +1,202 @@
+import logging
+import uuid
+from typing import Dict, Optional
+
+import msgspec
+from litestar.stores.base import Store
+
+from src.core.config import settings
+from src.domain.users.schemas import UserSchema
+from src.lib.cache import LRUMemoryStore
+
+logger = logging.getLogger(__name__)
+
+
+class UserCache:
+    """Кэш чтения пользователей перед ``UserRepository``.
+
+    Хранит сериализованные ``UserSchema`` в любом хранилище Litestar
+    (:class:`LRUMemoryStore` в памяти процесса или ``RedisStore``).
+    Ошибки хранилища не ломают запрос: чтение считается промахом,
+    а запрос уходит в базу данных.
+
+    Инвалидация записывает для пользователя новую метку версии. Значение,
+    прочитанное из базы при промахе, сохраняется, только если метка не
+    изменилась с начала чтения (см. :meth:`version` и :meth:`set`):
+    иначе изменение, зафиксированное во время чтения, оставило бы в кэше
+    прежнюю версию на весь TTL.
+
+    Attributes:
+        store: Хранилище значений или None, если кэш отключен.
+        ttl: Время жизни записи в секундах.
+        hits: Количество попаданий.
+        misses: Количество промахов.
+        stale_fills: Пропущенные записи значений, устаревших за время
+            чтения из базы.
+    """
+
+    def __init__(self, store: Optional[Store], ttl: int = 30) -> None:
+        self.store = store
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.stale_fills = 0
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder(UserSchema)
+
+    @property
+    def enabled(self) -> bool:
+        """Включен ли кэш."""
+        return self.store is not None
+
+    @staticmethod
+    def _key(user_id: int) -> str:
+        return f"user:{user_id}"
+
+    @staticmethod
+    def _version_key(user_id: int) -> str:
+        return f"user-version:{user_id}"
+
+    async def version(self, user_id: int) -> Optional[bytes]:
+        """Метка последней инвалидации пользователя.
+
+        Читается до запроса к базе и передается в :meth:`set`.
+
+        Args:
+            user_id: Идентификатор пользователя.
+
+        Returns:
+            Optional[bytes]: Метка или None, если пользователь недавно
+                не изменялся.
+        """
+        if self.store is None:
+            return None
+        try:
+            return await self.store.get(self._version_key(user_id))
+        except Exception:
+            logger.warning("Ошибка чтения кэша пользователей", exc_info=True)
+            return None
+
+    async def get(self, user_id: int) -> Optional[UserSchema]:
+        """Возвращает пользователя из кэша.
+
+        Args:
+            user_id: Идентификатор пользователя.
+
+        Returns:
+            Optional[UserSchema]: Данные пользователя или None при промахе.
+        """
+        if self.store is None:
+            return None
+        try:
+            raw = await self.store.get(self._key(user_id))
+        except Exception:
+            logger.warning("Ошибка чтения кэша пользователей", exc_info=True)
+            raw = None
+        if raw is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return self._decoder.decode(raw)
+
+    async def set(self, user: UserSchema, version: Optional[bytes] = None) -> None:
+        """Сохраняет пользователя в кэш.
+
+        Запись пропускается, если пользователь был изменен после чтения
+        метки ``version``. В хранилище в памяти проверка и запись
+        выполняются без переключения задач; с Redis между ними остается
+        одно обращение к хранилищу вместо всего запроса к базе.
+
+        Args:
+            user: Данные пользователя.
+            version: Метка :meth:`version`, прочитанная до запроса к базе.
+        """
+        if self.store is None:
+            return
+        try:
+            if await self.store.get(self._version_key(user.id)) != version:
+                self.stale_fills += 1
+                return
+            await self.store.set(
+                self._key(user.id), self._encoder.encode(user), expires_in=self.ttl
+            )
+        except Exception:
+            logger.warning("Ошибка записи в кэш пользователей", exc_info=True)
+
+    async def invalidate(self, *user_ids: int) -> None:
+        """Удаляет пользователей из кэша после изменения или удаления.
+
+        Args:
+            user_ids: Идентификаторы пользователей.
+        """
+        if self.store is None:
+            return
+        try:
+            for user_id in user_ids:
+                # Метка живет не меньше записи: чтение, начатое до
+                # изменения, не должно сохранить прежнюю версию
+                await self.store.set(
+                    self._version_key(user_id), uuid.uuid4().bytes, expires_in=self.ttl
+                )
+                await self.store.delete(self._key(user_id))
+        except Exception:
+            logger.warning("Ошибка инвалидации кэша пользователей", exc_info=True)
+
+    def stats(self) -> Dict[str, int]:
+        """Счетчики кэша.
+
+        Returns:
+            Dict[str, int]: Попадания, промахи, пропущенные устаревшие
+                записи, вытеснения по LRU и по TTL.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "stale_fills": self.stale_fills,
+            "evictions": getattr(self.store, "evictions", 0),
+            "expirations": getattr(self.store, "expirations", 0),
+        }
+
+    async def close(self) -> None:
+        """Закрывает соединение хранилища при завершении приложения."""
+        if self.store is not None:
+            await self.store.__aexit__(None, None, None)
+
+
+def create_user_cache_store() -> Optional[Store]:
+    """Создает хранилище кэша пользователей по настройкам приложения.
+
+    Returns:
+        Optional[Store]: Хранилище или None, если кэш отключен.
+    """
+    if settings.user_cache_backend == "memory":
+        return LRUMemoryStore(max_size=settings.USER_CACHE_MAX_SIZE)
+    if settings.user_cache_backend == "redis":
+        # Импорт по требованию: пакет redis нужен только для этого бэкенда
+        from litestar.stores.redis import RedisStore
+
+        return RedisStore.with_client(
+            url=settings.USER_CACHE_REDIS_URL, namespace="users"
+        )
+    return None
+
+
+def warn_if_user_cache_disabled() -> None:
+    """Хук ``on_startup``: предупреждает, что кэш выключен по умолчанию.
+
+    Без явного USER_CACHE_BACKEND кэш в памяти включается только при
+    одном воркере, поэтому при нескольких воркерах (в том числе при
+    SERVER_WORKERS=0 на многоядерной машине) GET /users/{id} всегда
+    читает из базы.
+    """
+    if settings.USER_CACHE_BACKEND is None and settings.user_cache_backend == "none":
+        logger.warning(
+            "Кэш пользователей отключен: воркеров %d, а кэш в памяти не видит "
+            "инвалидаций других воркеров. Задайте USER_CACHE_BACKEND=redis "
+            "или USER_CACHE_BACKEND=none, чтобы убрать предупреждение",
+            settings.server_workers,
+        )
+
+
+# Экземпляр кэша пользователей для использования в приложении
+user_cache = UserCache(store=create_user_cache_store(), ttl=settings.USER_CACHE_TTL)
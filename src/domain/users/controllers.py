@@ -1,17 +1,46 @@
-from typing import List, Optional
-
-from litestar import Controller, delete, get, post, put
-from litestar.di import Provide
+from datetime import datetime
+from functools import partial
+from typing import Any, Dict, List, Literal, Optional, Sequence, cast
+
+import msgspec
+from advanced_alchemy.filters import CollectionFilter
+from litestar import (Controller, Request, Response, delete, get, patch, post,
+                      put)
+from litestar.datastructures import ResponseHeader
 from litestar.exceptions import HTTPException
 from litestar.params import Parameter
-from litestar.status_codes import HTTP_201_CREATED, HTTP_204_NO_CONTENT
-from passlib.hash import bcrypt
-from sqlalchemy.ext.asyncio import AsyncSession
-
+from litestar.response import Stream
+from litestar.status_codes import (HTTP_200_OK, HTTP_201_CREATED,
+                                   HTTP_204_NO_CONTENT, HTTP_304_NOT_MODIFIED,
+                                   HTTP_404_NOT_FOUND,
+                                   HTTP_412_PRECONDITION_FAILED)
+from sqlalchemy import ColumnElement
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from src.core.config import settings
+from src.core.limits import ConcurrencyLimitMiddleware, RateLimitMiddleware
+from src.core.profiling import ProfiledProvide
+from src.core.security import password_hasher
+from src.db.batching import user_inserter
 from src.db.models import User
-from src.db.repositories import UserRepository
-from src.domain.users.schemas import (UserCreateSchema, UserSchema,
-                                      UserUpdateSchema)
+from src.db.repositories import MatchMode, UserOrderBy, UserRepository
+from src.db.replicas import reads_from_primary
+from src.db.session import after_commit, is_replica_session
+from src.domain.users.cache import user_cache
+from src.domain.users.counts import (count_cache_key, count_users,
+                                     user_count_cache)
+from src.domain.users.etags import (parse_user_etags, user_etag,
+                                    user_validators, users_list_etag)
+from src.domain.users.export import (EXPORT_MEDIA_TYPES, ExportFormat,
+                                     export_users)
+from src.domain.users.schemas import (UserBulkDeleteSchema,
+                                      UserBulkResultSchema,
+                                      UserBulkUpdateSchema, UserCreateSchema,
+                                      UserCursorSchema, UserPatchSchema,
+                                      UserSchema, UserUpdateSchema)
+from src.lib.conditional import etag_matches, is_not_modified
+from src.lib.pagination import decode_cursor, encode_cursor
+from src.lib.serialization import JSONResponse
 
 
 async def provide_user_repo(db_session: AsyncSession) -> UserRepository:
@@ -26,6 +55,21 @@ async def provide_user_repo(db_session: AsyncSession) -> UserRepository:
     return UserRepository(session=db_session)
 
 
+async def provide_read_user_repo(read_db_session: AsyncSession) -> UserRepository:
+    """Провайдер репозитория пользователей для обработчиков чтения.
+
+    Запросы выполняются на реплике, если она настроена и доступна
+    (см. ``provide_read_db_session``).
+
+    Args:
+        read_db_session: Сессия SQLAlchemy для чтения.
+
+    Returns:
+        UserRepository: Репозиторий для работы с пользователями.
+    """
+    return UserRepository(session=read_db_session)
+
+
 def user_to_schema(user: User) -> UserSchema:
     """Преобразует модель пользователя в схему DTO.
 
@@ -44,18 +88,126 @@ def user_to_schema(user: User) -> UserSchema:
     )
 
 
+# Колонки таблицы в порядке полей UserSchema: строки Core с этими колонками
+# передаются в конструктор схемы позиционно, минуя ORM-объекты
+USER_SCHEMA_COLUMNS = tuple(getattr(User, field) for field in UserSchema.__struct_fields__)
+
+
+# Стратегии подсчета общего количества пользователей в списке
+CountStrategy = Literal["none", "exact", "estimated", "cached"]
+
+
+def rows_to_schemas(rows: Sequence[Sequence[Any]]) -> List[UserSchema]:
+    """Преобразует строки Core с колонками USER_SCHEMA_COLUMNS в схемы DTO.
+
+    Args:
+        rows: Строки результата запроса.
+
+    Returns:
+        List[UserSchema]: Схемы DTO с данными пользователей.
+    """
+    return [UserSchema(*row) for row in rows]
+
+
+def not_modified_response(headers: Dict[str, str]) -> Response[Any]:
+    """Ответ 304 Not Modified без тела.
+
+    Args:
+        headers: Валидаторы текущей версии (ETag, Last-Modified).
+
+    Returns:
+        Response[Any]: Ответ с кодом 304.
+    """
+    return JSONResponse(
+        content=None, status_code=HTTP_304_NOT_MODIFIED, headers=headers
+    )
+
+
+async def provide_user_filters(
+    name: Optional[str] = Parameter(
+        default=None, min_length=1, title="Имя пользователя"
+    ),
+    name_match: MatchMode = Parameter(
+        default="exact", title="Режим поиска по имени"
+    ),
+    surname: Optional[str] = Parameter(
+        default=None, min_length=1, title="Фамилия пользователя"
+    ),
+    surname_match: MatchMode = Parameter(
+        default="exact", title="Режим поиска по фамилии"
+    ),
+    created_after: Optional[datetime] = Parameter(
+        default=None, title="Создан не раньше"
+    ),
+    created_before: Optional[datetime] = Parameter(
+        default=None, title="Создан раньше"
+    ),
+) -> List[ColumnElement[bool]]:
+    """Провайдер условий поиска пользователей из параметров запроса.
+
+    Args:
+        name: Значение для поиска по имени.
+        name_match: Режим поиска по имени (``exact``, ``prefix``, ``contains``).
+        surname: Значение для поиска по фамилии.
+        surname_match: Режим поиска по фамилии.
+        created_after: Нижняя граница даты создания (включительно).
+        created_before: Верхняя граница даты создания (не включительно).
+
+    Returns:
+        List[ColumnElement[bool]]: Условия для WHERE.
+    """
+    return UserRepository.search_filters(
+        name=name,
+        name_match=name_match,
+        surname=surname,
+        surname_match=surname_match,
+        created_after=created_after,
+        created_before=created_before,
+    )
+
+
+def check_bulk_size(size: int) -> None:
+    """Проверяет размер пакетной операции.
+
+    Args:
+        size: Количество элементов в запросе.
+
+    Raises:
+        HTTPException: Если элементов больше, чем BULK_MAX_ITEMS.
+    """
+    if size > settings.BULK_MAX_ITEMS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Слишком много элементов в запросе: {size} "
+            f"(максимум {settings.BULK_MAX_ITEMS})",
+        )
+
+
 class UserController(Controller):
-    """Контроллер для управления пользователями через REST API."""
+    """Контроллер для управления пользователями через REST API.
+
+    Запросы проходят сброс нагрузки (лимит одновременных запросов,
+    503). Изменяющие запросы также ограничиваются по частоте для клиента
+    и маршрута (429); чтения и выгрузка не ограничиваются.
+    """
 
     path = "/users"
-    dependencies = {"user_repo": Provide(provide_user_repo)}
+    dependencies = {
+        "user_repo": ProfiledProvide(provide_user_repo),
+        "user_filters": ProfiledProvide(provide_user_filters),
+    }
+    middleware = [ConcurrencyLimitMiddleware()]
 
-    @post(status_code=HTTP_201_CREATED)
+    @post(status_code=HTTP_201_CREATED, middleware=[RateLimitMiddleware()])
     async def create_user(
         self, user_repo: UserRepository, data: UserCreateSchema
     ) -> UserSchema:
         """Создание нового пользователя.
 
+        При ``USER_INSERT_BATCHING`` вставка выполняется в составе пачки
+        параллельных созданий (отдельная транзакция, зафиксированная до
+        ответа), а не в транзакции запроса.
+
         Args:
             user_repo: Репозиторий пользователей.
             data: Данные для создания пользователя.
@@ -64,81 +216,471 @@ class UserController(Controller):
             UserSchema: Данные созданного пользователя.
 
         Raises:
-            HTTPException: При ошибке создания пользователя.
+            HTTPException: При ошибке создания пользователя или перегрузке
+                сервиса хеширования паролей (503).
         """
         try:
             user = User(
                 name=data.name,
                 surname=data.surname,
-                password=bcrypt.hash(data.password),  # Хеширование пароля
+                password=await password_hasher.hash(data.password),  # Хеширование пароля
             )
 
-            async with user_repo.session.begin():
-                await user_repo.add(user)
-
+            if user_inserter is not None:
+                await user_inserter.insert(user)
+            else:
+                # Серверные значения уже заполнены INSERT ... RETURNING
+                # (eager_defaults модели), повторный SELECT не нужен
+                await user_repo.add(user, auto_refresh=False)
             return user_to_schema(user)
+        except HTTPException:
+            raise
         except Exception as e:
             raise HTTPException(
                 status_code=500,
                 detail=f"Ошибка при создании пользователя: {str(e)}"
             )
 
-    @get()
+    @post("/bulk", status_code=HTTP_201_CREATED, middleware=[RateLimitMiddleware()])
+    async def bulk_create_users(
+        self, user_repo: UserRepository, data: List[UserCreateSchema]
+    ) -> List[UserBulkResultSchema]:
+        """Пакетное создание пользователей.
+
+        Пароли хешируются параллельно, все записи вставляются в транзакции
+        запроса многострочным INSERT ... RETURNING.
+
+        Args:
+            user_repo: Репозиторий пользователей.
+            data: Данные создаваемых пользователей.
+
+        Returns:
+            List[UserBulkResultSchema]: Результат по каждому элементу.
+
+        Raises:
+            HTTPException: При превышении размера пакета, ошибке создания
+                или перегрузке сервиса хеширования паролей (503).
+        """
+        check_bulk_size(len(data))
+        try:
+            hashes = await password_hasher.hash_many([item.password for item in data])
+            users = [
+                User(name=item.name, surname=item.surname, password=password_hash)
+                for item, password_hash in zip(data, hashes)
+            ]
+
+            await user_repo.add_many(users)
+            return [
+                UserBulkResultSchema(
+                    index=index,
+                    status_code=HTTP_201_CREATED,
+                    id=user.id,
+                    user=user_to_schema(user),
+                )
+                for index, user in enumerate(users)
+            ]
+        except HTTPException:
+            raise
+        except Exception as e:
+            raise HTTPException(
+                status_code=500,
+                detail=f"Ошибка при пакетном создании пользователей: {str(e)}"
+            )
+
+    @patch("/bulk", middleware=[RateLimitMiddleware()])
+    async def bulk_update_users(
+        self, user_repo: UserRepository, data: List[UserBulkUpdateSchema]
+    ) -> List[UserBulkResultSchema]:
+        """Пакетное обновление пользователей.
+
+        Существующие записи обновляются одним пакетом UPDATE по первичному
+        ключу; для отсутствующих идентификаторов возвращается 404.
+
+        Args:
+            user_repo: Репозиторий пользователей.
+            data: Идентификаторы и новые значения полей.
+
+        Returns:
+            List[UserBulkResultSchema]: Результат по каждому элементу.
+
+        Raises:
+            HTTPException: При превышении размера пакета, ошибке обновления
+                или перегрузке сервиса хеширования паролей (503).
+        """
+        check_bulk_size(len(data))
+        try:
+            existing = await user_repo.existing_ids([item.id for item in data])
+            # Пароли отсутствующих пользователей не хешируются;
+            # хеши сопоставляются элементам по позиции в запросе
+            passwords = {
+                index: item.password
+                for index, item in enumerate(data)
+                if item.password is not None and item.id in existing
+            }
+            hashes = dict(
+                zip(
+                    passwords,
+                    await password_hasher.hash_many(list(passwords.values())),
+                )
+            )
+
+            values: List[Dict[str, Any]] = []
+            for index, item in enumerate(data):
+                if item.id not in existing:
+                    continue
+                changes = {
+                    field: getattr(item, field)
+                    for field in ("name", "surname")
+                    if getattr(item, field) is not None
+                }
+                if index in hashes:
+                    changes["password"] = hashes[index]
+                if changes:
+                    values.append({"id": item.id, **changes})
+            await user_repo.update_many_by_id(values)
+            users = {
+                user.id: user_to_schema(user)
+                for user in await user_repo.list(
+                    CollectionFilter(field_name="id", values=list(existing))
+                )
+            }
+            after_commit(user_repo.session, partial(user_cache.invalidate, *existing))
+
+            return [
+                UserBulkResultSchema(
+                    index=index,
+                    status_code=HTTP_200_OK,
+                    id=item.id,
+                    user=users[item.id],
+                )
+                if item.id in users
+                else UserBulkResultSchema(
+                    index=index,
+                    status_code=HTTP_404_NOT_FOUND,
+                    id=item.id,
+                    detail=f"Пользователь с ID {item.id} не найден",
+                )
+                for index, item in enumerate(data)
+            ]
+        except HTTPException:
+            raise
+        except Exception as e:
+            raise HTTPException(
+                status_code=500,
+                detail=f"Ошибка при пакетном обновлении пользователей: {str(e)}"
+            )
+
+    @delete("/bulk", status_code=HTTP_200_OK, middleware=[RateLimitMiddleware()])
+    async def bulk_delete_users(
+        self, user_repo: UserRepository, data: UserBulkDeleteSchema
+    ) -> List[UserBulkResultSchema]:
+        """Пакетное удаление пользователей.
+
+        Args:
+            user_repo: Репозиторий пользователей.
+            data: Идентификаторы удаляемых пользователей.
+
+        Returns:
+            List[UserBulkResultSchema]: Результат по каждому идентификатору.
+
+        Raises:
+            HTTPException: При превышении размера пакета или ошибке удаления.
+        """
+        check_bulk_size(len(data.ids))
+        try:
+            deleted = await user_repo.delete_many_by_id(data.ids)
+            after_commit(user_repo.session, partial(user_cache.invalidate, *deleted))
+
+            return [
+                UserBulkResultSchema(
+                    index=index, status_code=HTTP_204_NO_CONTENT, id=user_id
+                )
+                if user_id in deleted
+                else UserBulkResultSchema(
+                    index=index,
+                    status_code=HTTP_404_NOT_FOUND,
+                    id=user_id,
+                    detail=f"Пользователь с ID {user_id} не найден",
+                )
+                for index, user_id in enumerate(data.ids)
+            ]
+        except HTTPException:
+            raise
+        except Exception as e:
+            raise HTTPException(
+                status_code=500,
+                detail=f"Ошибка при пакетном удалении пользователей: {str(e)}"
+            )
+
+    @get(
+        response_headers=[
+            ResponseHeader(
+                name="X-Next-Cursor",
+                description="Курсор следующей страницы (отсутствует на последней странице)",
+                documentation_only=True,
+            ),
+            ResponseHeader(
+                name="X-Total-Count",
+                description="Общее количество пользователей, удовлетворяющих фильтрам "
+                "(только при count != none)",
+                documentation_only=True,
+            ),
+        ],
+        dependencies={"user_repo": ProfiledProvide(provide_read_user_repo)},
+    )
     async def list_users(
         self,
         user_repo: UserRepository,
+        user_filters: List[ColumnElement[bool]],
         page: int = Parameter(default=1, ge=1, title="Номер страницы"),
-        page_size: int = Parameter(default=10, ge=1, le=100, title="Размер страницы")
-    ) -> List[UserSchema]:
+        page_size: int = Parameter(default=10, ge=1, le=100, title="Размер страницы"),
+        order_by: UserOrderBy = Parameter(default="id", title="Ключ сортировки"),
+        sort_order: Literal["asc", "desc"] = Parameter(
+            default="asc", title="Направление сортировки"
+        ),
+        cursor: Optional[str] = Parameter(
+            default=None,
+            title="Курсор страницы",
+            description="Значение заголовка X-Next-Cursor предыдущего ответа. "
+            "При передаче курсора параметр page игнорируется.",
+        ),
+        count: CountStrategy = Parameter(
+            default="none",
+            title="Подсчет общего количества",
+            description="exact - точный подсчет, estimated - оценка по статистике "
+            "PostgreSQL, cached - значение из кэша с фоновым обновлением.",
+        ),
+        if_none_match: Optional[str] = Parameter(header="If-None-Match", default=None),
+    ) -> Response[List[UserSchema]]:
         """Получение списка пользователей с пагинацией.
 
+        Поддерживаются два режима: классический по номеру страницы
+        (LIMIT/OFFSET) и keyset-пагинация по курсору, время ответа которой
+        не зависит от глубины страницы. Курсор следующей страницы
+        возвращается в заголовке ``X-Next-Cursor`` в обоих режимах.
+        Выбираются только колонки ``UserSchema``, без загрузки ORM-объектов.
+
+        Список фильтруется по имени и фамилии (точное совпадение, префикс
+        или подстрока) и диапазону даты создания.
+
+        Страница отдается с ETag по (id, updated_at) ее записей; при
+        совпадении с If-None-Match возвращается 304 без тела. Last-Modified
+        для списка не отдается: удаление записи не меняет максимальную
+        дату обновления оставшихся.
+
         Args:
             user_repo: Репозиторий пользователей.
+            user_filters: Условия поиска из параметров запроса.
             page: Номер страницы.
             page_size: Количество записей на странице.
+            order_by: Ключ сортировки (``id``, ``created_at``, ``name``, ``surname``).
+            sort_order: Направление сортировки (``asc`` или ``desc``).
+            cursor: Курсор, полученный с предыдущей страницей.
+            count: Стратегия подсчета общего количества для заголовка
+                ``X-Total-Count`` (``none``, ``exact``, ``estimated``, ``cached``).
+            if_none_match: ETag страницы, сохраненной клиентом.
 
         Returns:
-            List[UserSchema]: Список пользователей.
+            Response[List[UserSchema]]: Список пользователей или 304.
 
         Raises:
-            HTTPException: При ошибке получения списка пользователей.
+            HTTPException: При некорректном курсоре или ошибке получения списка.
         """
         try:
-            offset = (page - 1) * page_size
-            users = await user_repo.list(limit=page_size, offset=offset)
-            return [user_to_schema(user) for user in users]
+            keys = user_repo.keyset_columns(order_by)
+            descending = sort_order == "desc"
+            if cursor is not None:
+                try:
+                    position = decode_cursor(cursor, UserCursorSchema)
+                except ValueError as e:
+                    raise HTTPException(status_code=400, detail=str(e))
+                if position.order_by != order_by or position.descending != descending:
+                    raise HTTPException(
+                        status_code=400,
+                        detail="Курсор построен для другого порядка сортировки",
+                    )
+                after = tuple(getattr(position, key.key) for key in keys)
+                if None in after:
+                    raise HTTPException(
+                        status_code=400, detail="Некорректный курсор пагинации"
+                    )
+                offset = 0
+            else:
+                after = None
+                offset = (page - 1) * page_size
+
+            # Точный подсчет в режиме страниц выполняется тем же запросом
+            # через COUNT(*) OVER (); для курсора он был бы неверным,
+            # так как учитывал бы только строки после курсора
+            with_total = count == "exact" and after is None
+            # Запрашиваем на одну запись больше, чтобы узнать о следующей странице
+            rows: Sequence[Sequence[Any]] = await user_repo.list_rows(
+                USER_SCHEMA_COLUMNS,
+                limit=page_size + 1,
+                order_by=order_by,
+                descending=descending,
+                offset=offset,
+                after=after,
+                filters=user_filters,
+                with_total=with_total,
+            )
+
+            headers = {}
+            total: Optional[int] = None
+            if with_total:
+                total = rows[0][-1] if rows else None
+                rows = [row[:-1] for row in rows]
+            if count == "exact" and total is None:
+                total = await user_repo.count_rows(user_filters)
+            elif count == "estimated":
+                total = await user_repo.estimate_count(user_filters)
+            elif count == "cached":
+                total = await user_count_cache.get(
+                    count_cache_key(user_filters),
+                    partial(
+                        count_users,
+                        cast(AsyncEngine, user_repo.session.bind),
+                        user_filters,
+                    ),
+                )
+            if total is not None:
+                headers["X-Total-Count"] = str(total)
+
+            users = rows_to_schemas(rows)
+            if len(users) > page_size:
+                users = users[:page_size]
+                last = users[-1]
+                headers["X-Next-Cursor"] = encode_cursor(
+                    UserCursorSchema(
+                        order_by=order_by,
+                        descending=descending,
+                        **{key.key: getattr(last, key.key) for key in keys},
+                    )
+                )
+            headers["ETag"] = users_list_etag(
+                users, headers.get("X-Next-Cursor", ""), headers.get("X-Total-Count", "")
+            )
+            headers["Cache-Control"] = "no-cache"
+            if if_none_match is not None and etag_matches(
+                if_none_match, headers["ETag"], weak=True
+            ):
+                return not_modified_response(headers)
+            return JSONResponse(content=users, headers=headers)
+        except HTTPException:
+            raise
         except Exception as e:
             raise HTTPException(
                 status_code=500,
                 detail=f"Ошибка при получении списка пользователей: {str(e)}"
             )
 
-    @get("/{user_id:int}")
+    @get("/export")
+    async def export_users(
+        self,
+        db_engine: AsyncEngine,
+        export_format: ExportFormat = Parameter(
+            query="format", default="ndjson", title="Формат выгрузки"
+        ),
+    ) -> Stream:
+        """Потоковая выгрузка всех пользователей в NDJSON или CSV.
+
+        Таблица читается серверным курсором пачками по EXPORT_BATCH_SIZE
+        строк, и каждая пачка сразу отправляется клиенту.
+
+        Args:
+            db_engine: Движок SQLAlchemy, созданный плагином.
+            export_format: Формат выгрузки (``ndjson`` или ``csv``).
+
+        Returns:
+            Stream: Потоковый ответ с данными пользователей.
+        """
+        return Stream(
+            export_users(
+                db_engine,
+                USER_SCHEMA_COLUMNS,
+                export_format,
+                settings.EXPORT_BATCH_SIZE,
+            ),
+            media_type=EXPORT_MEDIA_TYPES[export_format],
+            headers={
+                "Content-Disposition": f'attachment; filename="users.{export_format}"'
+            },
+        )
+
+    @get(
+        "/{user_id:int}",
+        dependencies={"user_repo": ProfiledProvide(provide_read_user_repo)},
+    )
     async def get_user(
         self,
+        request: Request,
         user_repo: UserRepository,
         user_id: int = Parameter(title="ID пользователя"),
-    ) -> UserSchema:
+        if_none_match: Optional[str] = Parameter(header="If-None-Match", default=None),
+        if_modified_since: Optional[str] = Parameter(
+            header="If-Modified-Since", default=None
+        ),
+    ) -> Response[UserSchema]:
         """Получение данных одного пользователя.
 
+        Сначала проверяется кэш пользователей; при промахе запись читается
+        из базы данных и сохраняется в кэш. Клиент, недавно изменявший
+        данные (read-your-writes), читает из основной базы мимо кэша:
+        кэш другого процесса может хранить прежнюю версию. В кэш
+        сохраняются только записи из основной базы, не с реплики,
+        отстающей от нее. Ответ содержит ETag
+        и Last-Modified. Для условного запроса при промахе кэша сначала
+        выбирается только updated_at, и при актуальной версии у клиента
+        возвращается 304 без чтения всей записи.
+
         Args:
+            request: Запрос (cookie последнего изменения данных).
             user_repo: Репозиторий пользователей.
             user_id: Идентификатор пользователя.
+            if_none_match: ETag версии, сохраненной клиентом.
+            if_modified_since: Дата версии, сохраненной клиентом.
 
         Returns:
-            UserSchema: Данные пользователя.
+            Response[UserSchema]: Данные пользователя или 304.
 
         Raises:
             HTTPException: При отсутствии пользователя или ошибке получения данных.
         """
         try:
-            user = await user_repo.get(user_id)
-            if not user:
-                raise HTTPException(
-                    status_code=404,
-                    detail=f"Пользователь с ID {user_id} не найден"
-                )
-            return user_to_schema(user)
+            user = None
+            if not reads_from_primary(
+                request.cookies, settings.DB_READ_YOUR_WRITES_WINDOW
+            ):
+                user = await user_cache.get(user_id)
+            updated_at: Optional[datetime] = None
+            if user is not None:
+                updated_at = user.updated_at
+            elif if_none_match is not None or if_modified_since is not None:
+                updated_at = await user_repo.get_updated_at(user_id)
+
+            if updated_at is not None and is_not_modified(
+                user_etag(user_id, updated_at),
+                updated_at,
+                if_none_match,
+                if_modified_since,
+            ):
+                return not_modified_response(user_validators(user_id, updated_at))
+
+            if user is None:
+                # Метка читается до запроса к базе, см. UserCache.set
+                version = await user_cache.version(user_id)
+                row = await user_repo.get_row(user_id, USER_SCHEMA_COLUMNS)
+                if row is None:
+                    raise HTTPException(
+                        status_code=404,
+                        detail=f"Пользователь с ID {user_id} не найден"
+                    )
+                user = UserSchema(*row)
+                if not is_replica_session(user_repo.session):
+                    await user_cache.set(user, version)
+            return JSONResponse(
+                content=user, headers=user_validators(user.id, user.updated_at)
+            )
         except HTTPException:
             raise
         except Exception as e:
@@ -147,45 +689,174 @@ class UserController(Controller):
                 detail=f"Ошибка при получении пользователя: {str(e)}"
             )
 
-    @put("/{user_id:int}")
+    @put("/{user_id:int}", middleware=[RateLimitMiddleware()])
     async def update_user(
         self,
         user_repo: UserRepository,
         data: UserUpdateSchema,
         user_id: int = Parameter(title="ID пользователя"),
-    ) -> UserSchema:
+        if_match: Optional[str] = Parameter(header="If-Match", default=None),
+    ) -> Response[UserSchema]:
         """Обновление данных пользователя.
 
+        Изменения применяются одним запросом UPDATE ... RETURNING без
+        предварительного чтения записи. С заголовком If-Match запрос
+        обновляет запись, только если ее updated_at совпадает с версией
+        из ETag (оптимистическая блокировка); иначе возвращается 412.
+
         Args:
             user_repo: Репозиторий пользователей.
             data: Данные для обновления.
             user_id: Идентификатор пользователя.
+            if_match: ETag версии, которую изменяет клиент.
 
         Returns:
-            UserSchema: Обновленные данные пользователя.
+            Response[UserSchema]: Обновленные данные пользователя с новым ETag.
 
         Raises:
-            HTTPException: При отсутствии пользователя или ошибке обновления данных.
+            HTTPException: При отсутствии пользователя, изменении его другим
+                запросом (412), ошибке обновления данных или перегрузке
+                сервиса хеширования паролей (503).
         """
         try:
-            user = await user_repo.get(user_id)
-            if not user:
+            expected = None if if_match is None else parse_user_etags(if_match, user_id)
+
+            values = {
+                field: getattr(data, field)
+                for field in ("name", "surname")
+                if getattr(data, field) is not None
+            }
+            if data.password is not None:
+                values["password"] = await password_hasher.hash(data.password)  # Хеширование при обновлении
+
+            if values:
+                user = await user_repo.update_by_id(user_id, values, expected)
+                # Запись не обновлена: различаем отсутствие пользователя
+                # и его изменение другим запросом после версии из If-Match
+                modified = (
+                    user is None
+                    and expected is not None
+                    and await user_repo.get_updated_at(user_id) is not None
+                )
+            else:
+                user = await user_repo.get_one_or_none(id=user_id)
+                modified = (
+                    user is not None
+                    and expected is not None
+                    and user.updated_at not in expected
+                )
+            if modified:
+                raise HTTPException(
+                    status_code=HTTP_412_PRECONDITION_FAILED,
+                    detail=f"Пользователь с ID {user_id} был изменен",
+                )
+            if user is None:
                 raise HTTPException(
                     status_code=404,
                     detail=f"Пользователь с ID {user_id} не найден"
                 )
 
-            if data.name is not None:
-                user.name = data.name
-            if data.surname is not None:
-                user.surname = data.surname
-            if data.password is not None:
-                user.password = bcrypt.hash(data.password)  # Хеширование при обновлении
+            after_commit(user_repo.session, partial(user_cache.invalidate, user_id))
+            return JSONResponse(
+                content=user_to_schema(user),
+                headers=user_validators(user.id, user.updated_at),
+            )
+        except HTTPException:
+            raise
+        except Exception as e:
+            raise HTTPException(
+                status_code=500,
+                detail=f"Ошибка при обновлении пользователя: {str(e)}"
+            )
 
-            async with user_repo.session.begin():
-                await user_repo.update(user)
+    @patch("/{user_id:int}", middleware=[RateLimitMiddleware()])
+    async def patch_user(
+        self,
+        user_repo: UserRepository,
+        data: UserPatchSchema,
+        user_id: int = Parameter(title="ID пользователя"),
+        if_match: Optional[str] = Parameter(header="If-Match", default=None),
+    ) -> Response[UserSchema]:
+        """Частичное обновление пользователя.
 
-            return user_to_schema(user)
+        Переданные поля сравниваются с текущей записью, и UPDATE
+        изменяет только отличающиеся колонки. Если значения не
+        изменились, запись не обновляется и ``updated_at`` сохраняется.
+        Пароль, совпадающий с текущим, не хешируется заново; если текущий
+        хеш создан по устаревшей политике, он заменяется новым.
+
+        Строка читается без блокировки, чтобы не удерживать ее во время
+        хеширования пароля. UPDATE выполняется, только если ``updated_at``
+        не изменился с момента чтения; иначе возвращается 412.
+
+        Args:
+            user_repo: Репозиторий пользователей.
+            data: Изменяемые поля.
+            user_id: Идентификатор пользователя.
+            if_match: ETag версии, которую изменяет клиент.
+
+        Returns:
+            Response[UserSchema]: Данные пользователя с текущим ETag.
+
+        Raises:
+            HTTPException: При отсутствии пользователя, изменении его другим
+                запросом (412), ошибке обновления данных или перегрузке
+                сервиса хеширования паролей (503).
+        """
+        try:
+            expected = None if if_match is None else parse_user_etags(if_match, user_id)
+
+            supplied = {
+                field: getattr(data, field)
+                for field in data.__struct_fields__
+                if getattr(data, field) is not msgspec.UNSET
+            }
+            row = await user_repo.get_row(
+                user_id, (*USER_SCHEMA_COLUMNS, User.password)
+            )
+            if row is None:
+                raise HTTPException(
+                    status_code=404,
+                    detail=f"Пользователь с ID {user_id} не найден"
+                )
+            user = UserSchema(*row[:-1])
+            if expected is not None and user.updated_at not in expected:
+                raise HTTPException(
+                    status_code=HTTP_412_PRECONDITION_FAILED,
+                    detail=f"Пользователь с ID {user_id} был изменен",
+                )
+
+            values = {
+                field: value
+                for field, value in supplied.items()
+                if field != "password" and value != getattr(user, field)
+            }
+            if "password" in supplied:
+                same, new_hash = await password_hasher.verify_and_update(
+                    supplied["password"], row.password
+                )
+                if not same:
+                    values["password"] = await password_hasher.hash(supplied["password"])
+                elif new_hash is not None:
+                    values["password"] = new_hash
+
+            if values:
+                # Запись могли изменить или удалить после чтения
+                updated = await user_repo.update_by_id(
+                    user_id, values, [user.updated_at]
+                )
+                if updated is None:
+                    raise HTTPException(
+                        status_code=HTTP_412_PRECONDITION_FAILED,
+                        detail=f"Пользователь с ID {user_id} был изменен",
+                    )
+                user = user_to_schema(updated)
+                after_commit(
+                    user_repo.session, partial(user_cache.invalidate, user_id)
+                )
+            return JSONResponse(
+                content=user, headers=user_validators(user.id, user.updated_at)
+            )
         except HTTPException:
             raise
         except Exception as e:
@@ -194,31 +865,33 @@ class UserController(Controller):
                 detail=f"Ошибка при обновлении пользователя: {str(e)}"
             )
 
-    @delete("/{user_id:int}", status_code=HTTP_204_NO_CONTENT)
+    @delete(
+        "/{user_id:int}",
+        status_code=HTTP_204_NO_CONTENT,
+        middleware=[RateLimitMiddleware()],
+    )
     async def delete_user(
         self,
         user_repo: UserRepository,
         user_id: int = Parameter(title="ID пользователя"),
     ) -> None:
-        """Удаление пользователя.
+        """Удаление пользователя одним запросом DELETE ... RETURNING id.
 
         Args:
             user_repo: Репозиторий пользователей.
             user_id: Идентиф��катор пользователя.
 
         Raises:
-            HTTPException: При ошибке удаления пользователя.
+            HTTPException: При отсутствии пользователя или ошибке удаления.
         """
         try:
-            user = await user_repo.get(user_id)
-            if not user:
+            deleted_id = await user_repo.delete_by_id(user_id)
+            if deleted_id is None:
                 raise HTTPException(
                     status_code=404,
                     detail=f"Пользователь с ID {user_id} не найден"
                 )
-
-            async with user_repo.session.begin():
-                await user_repo.delete(user_id)
+            after_commit(user_repo.session, partial(user_cache.invalidate, user_id))
         except HTTPException:
             raise
         except Exception as e:
@@ -0,0 +1,127 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, Sequence, Tuple
+
+from sqlalchemy import ColumnElement
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.core.config import settings
+from src.db.repositories import UserRepository
+
+logger = logging.getLogger(__name__)
+
+
+class CountCache:
+    """Кэш количества строк с фоновым обновлением.
+
+    Значение отдается из кэша сразу; если оно старше ``refresh_after``
+    секунд, запускается фоновое обновление, а запрос получает прежнее
+    значение (stale-while-revalidate). Синхронно считается только
+    отсутствующее в кэше значение; одновременные запросы с одним ключом
+    ждут один и тот же подсчет (single-flight), а не запускают каждый
+    свой ``COUNT(*)``.
+
+    Attributes:
+        refresh_after: Возраст значения в секундах, после которого оно
+            обновляется в фоне.
+        max_size: Максимальное количество хранимых значений.
+    """
+
+    def __init__(self, refresh_after: float = 60, max_size: int = 1000) -> None:
+        self.refresh_after = refresh_after
+        self.max_size = max_size
+        self._values: "OrderedDict[str, Tuple[int, float]]" = OrderedDict()
+        # Выполняющиеся подсчеты по ключам; ссылка на задачу также
+        # защищает ее от сборщика мусора
+        self._computing: Dict[str, "asyncio.Task[int]"] = {}
+
+    def _store(self, key: str, value: int) -> None:
+        self._values[key] = (value, time.monotonic())
+        self._values.move_to_end(key)
+        while len(self._values) > self.max_size:
+            self._values.popitem(last=False)
+
+    async def _compute(self, key: str, compute: Callable[[], Awaitable[int]]) -> int:
+        value = await compute()
+        self._store(key, value)
+        return value
+
+    def _start(
+        self, key: str, compute: Callable[[], Awaitable[int]]
+    ) -> "asyncio.Task[int]":
+        """Запускает подсчет ключа или возвращает уже выполняющийся."""
+        task = self._computing.get(key)
+        if task is None:
+            task = asyncio.create_task(self._compute(key, compute))
+            self._computing[key] = task
+            task.add_done_callback(lambda _: self._computing.pop(key, None))
+        return task
+
+    @staticmethod
+    def _log_refresh_error(task: "asyncio.Task[int]") -> None:
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(
+                "Ошибка фонового обновления количества строк",
+                exc_info=task.exception(),
+            )
+
+    async def get(self, key: str, compute: Callable[[], Awaitable[int]]) -> int:
+        """Возвращает количество из кэша или вычисляет его.
+
+        Args:
+            key: Ключ значения (например, текст запроса с параметрами).
+            compute: Функция точного подсчета. Вызывается в том числе
+                в фоне, поэтому не должна использовать сессию запроса.
+
+        Returns:
+            int: Количество строк.
+        """
+        item = self._values.get(key)
+        if item is None:
+            # Отмена одного ожидающего запроса не отменяет общий подсчет
+            return await asyncio.shield(self._start(key, compute))
+        value, fetched_at = item
+        self._values.move_to_end(key)
+        is_stale = time.monotonic() - fetched_at > self.refresh_after
+        if is_stale and key not in self._computing:
+            self._start(key, compute).add_done_callback(self._log_refresh_error)
+        return value
+
+
+def count_cache_key(filters: Sequence[ColumnElement[bool]]) -> str:
+    """Ключ кэша количества для набора фильтров.
+
+    Args:
+        filters: Условия поиска.
+
+    Returns:
+        str: Текст запроса подсчета вместе со значениями параметров.
+    """
+    compiled = UserRepository.count_statement(filters).compile()
+    return repr((str(compiled), sorted(compiled.params.items(), key=str)))
+
+
+async def count_users(
+    engine: AsyncEngine, filters: Sequence[ColumnElement[bool]]
+) -> int:
+    """Точный подсчет пользователей на отдельном соединении.
+
+    Args:
+        engine: Асинхронный движок SQLAlchemy.
+        filters: Условия поиска.
+
+    Returns:
+        int: Количество пользователей.
+    """
+    async with engine.connect() as connection:
+        result = await connection.execute(UserRepository.count_statement(filters))
+        return result.scalar_one()
+
+
+# Кэш количества пользователей для использования в приложении
+user_count_cache = CountCache(
+    refresh_after=settings.USER_COUNT_CACHE_REFRESH_AFTER,
+    max_size=settings.USER_COUNT_CACHE_MAX_SIZE,
+)
@@ -0,0 +1,90 @@
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional
+
+from src.domain.users.schemas import UserSchema
+from src.lib.conditional import digest_etag, http_date, parse_etags
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def user_etag(user_id: int, updated_at: datetime) -> str:
+    """Сильный ETag пользователя по идентификатору и дате обновления.
+
+    Дата кодируется целым числом микросекунд, поэтому из ETag можно
+    восстановить точное значение ``updated_at`` для условного UPDATE
+    (см. ``parse_user_etags``).
+
+    Args:
+        user_id: Идентификатор пользователя.
+        updated_at: Дата последнего обновления записи (UTC).
+
+    Returns:
+        str: ETag в кавычках, например ``"42-5f1c3a2b9e0c8"``.
+    """
+    return f'"{user_id}-{(updated_at - _EPOCH) // _MICROSECOND:x}"'
+
+
+def parse_user_etags(value: str, user_id: int) -> Optional[List[datetime]]:
+    """Извлекает даты обновления из заголовка If-Match.
+
+    Args:
+        value: Значение заголовка If-Match.
+        user_id: Идентификатор обновляемого пользователя.
+
+    Returns:
+        Optional[List[datetime]]: Значения ``updated_at`` из ETag этого
+            пользователя (пустой список, если ни один ETag ему не
+            соответствует) или None для ``*`` - подходит любая версия.
+    """
+    versions: List[datetime] = []
+    prefix = f'"{user_id}-'
+    for tag in parse_etags(value):
+        if tag == "*":
+            return None
+        if not (tag.startswith(prefix) and tag.endswith('"')):
+            continue
+        try:
+            versions.append(_EPOCH + int(tag[len(prefix) : -1], 16) * _MICROSECOND)
+        except (ValueError, OverflowError):
+            continue
+    return versions
+
+
+def users_list_etag(users: Iterable[UserSchema], *extra: str) -> str:
+    """ETag страницы списка пользователей.
+
+    Содержимое каждой записи однозначно определяется парой
+    (id, updated_at), поэтому хешируются только они, а не тело ответа.
+
+    Args:
+        users: Пользователи страницы.
+        extra: Остальные части представления (например, курсор следующей
+            страницы).
+
+    Returns:
+        str: ETag в кавычках.
+    """
+    return digest_etag(
+        [*(f"{user.id}:{user.updated_at.isoformat()}" for user in users), *extra]
+    )
+
+
+def user_validators(user_id: int, updated_at: datetime) -> Dict[str, str]:
+    """Заголовки условных запросов для ответа с одним пользователем.
+
+    ``Cache-Control: no-cache`` разрешает клиенту хранить ответ, но
+    требует перепроверять его по ETag перед использованием.
+
+    Args:
+        user_id: Идентификатор пользователя.
+        updated_at: Дата последнего обновления записи (UTC).
+
+    Returns:
+        Dict[str, str]: Заголовки ETag, Last-Modified и Cache-Control.
+    """
+    return {
+        "ETag": user_etag(user_id, updated_at),
+        "Last-Modified": http_date(updated_at),
+        "Cache-Control": "no-cache",
+    }
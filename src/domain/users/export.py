@@ -0,0 +1,83 @@
+import csv
+import io
+import logging
+import time
+from typing import Any, AsyncIterator, List, Literal, Sequence
+
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.db.repositories import stream_user_rows
+from src.domain.users.schemas import UserSchema
+from src.lib.serialization import json_encoder
+
+logger = logging.getLogger(__name__)
+
+ExportFormat = Literal["ndjson", "csv"]
+
+# Типы содержимого для форматов выгрузки
+EXPORT_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+
+def encode_ndjson(users: List[UserSchema]) -> bytes:
+    """Кодирует пачку пользователей в NDJSON (одна запись на строку)."""
+    return json_encoder.encode_lines(users)
+
+
+def encode_csv(users: List[UserSchema]) -> bytes:
+    """Кодирует пачку пользователей в строки CSV без заголовка."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerows(
+        (
+            user.id,
+            user.name,
+            user.surname,
+            user.created_at.isoformat(),
+            user.updated_at.isoformat(),
+        )
+        for user in users
+    )
+    return buffer.getvalue().encode("utf-8")
+
+
+async def export_users(
+    engine: AsyncEngine,
+    columns: Sequence[Any],
+    export_format: ExportFormat,
+    batch_size: int,
+) -> AsyncIterator[bytes]:
+    """Генерирует содержимое выгрузки всех пользователей.
+
+    Каждая пачка строк серверного курсора кодируется и отдается клиенту
+    сразу, поэтому потребление памяти не зависит от размера таблицы.
+    По завершении в лог пишется количество строк и скорость выгрузки.
+
+    Args:
+        engine: Асинхронный движок SQLAlchemy.
+        columns: Колонки модели в порядке полей ``UserSchema``.
+        export_format: Формат выгрузки (``ndjson`` или ``csv``).
+        batch_size: Размер пачки строк.
+
+    Yields:
+        bytes: Очередной фрагмент тела ответа.
+    """
+    if export_format == "csv":
+        encode = encode_csv
+        yield (",".join(UserSchema.__struct_fields__) + "\n").encode("utf-8")
+    else:
+        encode = encode_ndjson
+
+    started = time.perf_counter()
+    total = 0
+    async for rows in stream_user_rows(engine, columns, batch_size):
+        total += len(rows)
+        yield encode([UserSchema(*row) for row in rows])
+
+    elapsed = time.perf_counter() - started
+    logger.info(
+        "Выгрузка пользователей (%s): %d строк за %.3f с (%.0f строк/с)",
+        export_format,
+        total,
+        elapsed,
+        total / elapsed if elapsed else 0.0,
+    )
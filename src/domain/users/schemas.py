@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Optional
+from typing import List, Literal, Optional, Union
 
 import msgspec
 
@@ -48,3 +48,90 @@ class UserUpdateSchema(msgspec.Struct):
     name: Optional[str] = msgspec.field()
     surname: Optional[str] = msgspec.field()
     password: Optional[str] = msgspec.field()
+
+
+class UserPatchSchema(msgspec.Struct):
+    """Схема частичного обновления пользователя (PATCH).
+
+    Отсутствующее в запросе поле имеет значение ``msgspec.UNSET`` и не
+    изменяется; ``null`` для полей не допускается.
+
+    Attributes:
+        name: Новое имя пользователя.
+        surname: Новая фамилия пользователя.
+        password: Новый пароль пользователя.
+    """
+
+    name: Union[str, msgspec.UnsetType] = msgspec.UNSET
+    surname: Union[str, msgspec.UnsetType] = msgspec.UNSET
+    password: Union[str, msgspec.UnsetType] = msgspec.UNSET
+
+
+class UserCursorSchema(msgspec.Struct, omit_defaults=True):
+    """Позиция keyset-пагинации списка пользователей.
+
+    Сериализуется в непрозрачный курсор и передается клиенту
+    в заголовке ``X-Next-Cursor``.
+
+    Attributes:
+        order_by: Ключ сортировки, по которому построен курсор.
+        descending: Сортировка по убыванию.
+        id: Идентификатор последнего пользователя страницы.
+        created_at: Дата создания последнего пользователя страницы
+            (только для сортировки по ``created_at``).
+        name: Имя последнего пользователя страницы
+            (только для сортировки по ``name``).
+        surname: Фамилия последнего пользователя страницы
+            (только для сортировки по ``surname``).
+    """
+
+    order_by: Literal["id", "created_at", "name", "surname"]
+    id: int
+    descending: bool = False
+    created_at: Optional[datetime] = None
+    name: Optional[str] = None
+    surname: Optional[str] = None
+
+
+class UserBulkUpdateSchema(msgspec.Struct):
+    """Элемент пакетного обновления пользователей.
+
+    Attributes:
+        id: Идентификатор пользователя.
+        name: Новое имя пользователя (опционально).
+        surname: Новая фамилия пользователя (опционально).
+        password: Новый пароль пользователя (опционально).
+    """
+
+    id: int
+    name: Optional[str] = None
+    surname: Optional[str] = None
+    password: Optional[str] = None
+
+
+class UserBulkDeleteSchema(msgspec.Struct):
+    """Схема пакетного удаления пользователей.
+
+    Attributes:
+        ids: Идентификаторы удаляемых пользователей.
+    """
+
+    ids: List[int]
+
+
+class UserBulkResultSchema(msgspec.Struct, omit_defaults=True):
+    """Результат обработки одного элемента пакетной операции.
+
+    Attributes:
+        index: Позиция элемента в теле запроса.
+        status_code: HTTP-статус обработки элемента.
+        id: Идентификатор пользователя.
+        user: Данные пользователя после операции (для создания и обновления).
+        detail: Описание ошибки, если элемент не обработан.
+    """
+
+    index: int
+    status_code: int
+    id: Optional[int] = None
+    user: Optional[UserSchema] = None
+    detail: Optional[str] = None
@@ -0,0 +1,94 @@
+import time
+from collections import OrderedDict
+from datetime import timedelta
+from typing import Optional, Tuple, Union
+
+from litestar.stores.base import Store
+
+
+def _seconds(value: Union[int, timedelta, None]) -> Optional[float]:
+    """Приводит срок хранения к секундам."""
+    if value is None:
+        return None
+    if isinstance(value, timedelta):
+        return value.total_seconds()
+    return float(value)
+
+
+class LRUMemoryStore(Store):
+    """Хранилище в памяти процесса с ограничением размера (LRU) и TTL.
+
+    Реализует интерфейс :class:`litestar.stores.base.Store`, поэтому
+    взаимозаменяемо с ``RedisStore`` и другими хранилищами Litestar.
+    Все операции выполняются синхронно внутри цикла событий, без
+    точек переключения, поэтому блокировка не требуется.
+
+    Attributes:
+        max_size: Максимальное количество ключей.
+        evictions: Количество ключей, вытесненных по LRU.
+        expirations: Количество ключей, удаленных по истечении TTL.
+    """
+
+    __slots__ = ("max_size", "evictions", "expirations", "_store")
+
+    def __init__(self, max_size: int = 10000) -> None:
+        self.max_size = max_size
+        self.evictions = 0
+        self.expirations = 0
+        self._store: "OrderedDict[str, Tuple[bytes, Optional[float]]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+    def _get_live(self, key: str) -> Optional[Tuple[bytes, Optional[float]]]:
+        """Возвращает запись, удаляя ее, если срок хранения истек."""
+        item = self._store.get(key)
+        if item is None:
+            return None
+        expires_at = item[1]
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._store[key]
+            self.expirations += 1
+            return None
+        return item
+
+    async def set(
+        self, key: str, value: Union[str, bytes], expires_in: Union[int, timedelta, None] = None
+    ) -> None:
+        if isinstance(value, str):
+            value = value.encode("utf-8")
+        ttl = _seconds(expires_in)
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        self._store[key] = (value, expires_at)
+        self._store.move_to_end(key)
+        while len(self._store) > self.max_size:
+            self._store.popitem(last=False)
+            self.evictions += 1
+
+    async def get(
+        self, key: str, renew_for: Union[int, timedelta, None] = None
+    ) -> Optional[bytes]:
+        item = self._get_live(key)
+        if item is None:
+            return None
+        data, expires_at = item
+        renew = _seconds(renew_for)
+        if renew and expires_at is not None:
+            self._store[key] = (data, time.monotonic() + renew)
+        self._store.move_to_end(key)
+        return data
+
+    async def delete(self, key: str) -> None:
+        self._store.pop(key, None)
+
+    async def delete_all(self) -> None:
+        self._store.clear()
+
+    async def exists(self, key: str) -> bool:
+        return self._get_live(key) is not None
+
+    async def expires_in(self, key: str) -> Optional[int]:
+        item = self._get_live(key)
+        if item is None or item[1] is None:
+            return None
+        return int(item[1] - time.monotonic())
@@ -0,0 +1,120 @@
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Iterable, List, Optional
+
+
+def http_date(value: datetime) -> str:
+    """Форматирует дату для заголовка Last-Modified.
+
+    Args:
+        value: Дата; дата без часового пояса считается датой в UTC.
+
+    Returns:
+        str: Дата в формате RFC 9110 (IMF-fixdate).
+    """
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return format_datetime(value.astimezone(timezone.utc), usegmt=True)
+
+
+def parse_http_date(value: str) -> Optional[datetime]:
+    """Разбирает дату из заголовка If-Modified-Since.
+
+    Args:
+        value: Значение заголовка.
+
+    Returns:
+        Optional[datetime]: Дата в UTC без часового пояса или None,
+            если значение некорректно (такой заголовок игнорируется).
+    """
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def parse_etags(value: str) -> List[str]:
+    """Разбирает список ETag из заголовков If-Match и If-None-Match.
+
+    Args:
+        value: Значение заголовка (``*`` или ETag через запятую).
+
+    Returns:
+        List[str]: ETag в том виде, в котором они переданы (с кавычками
+            и префиксом ``W/``).
+    """
+    return [tag.strip() for tag in value.split(",") if tag.strip()]
+
+
+def etag_matches(value: str, etag: str, weak: bool = False) -> bool:
+    """Проверяет, соответствует ли ETag условию заголовка.
+
+    Args:
+        value: Значение заголовка If-Match или If-None-Match.
+        etag: Текущий сильный ETag ресурса.
+        weak: Слабое сравнение (для If-None-Match): префикс ``W/``
+            не учитывается. При сильном сравнении (If-Match) слабые
+            ETag не совпадают никогда.
+
+    Returns:
+        bool: True, если условие выполнено.
+    """
+    for tag in parse_etags(value):
+        if tag == "*":
+            return True
+        if weak and tag.startswith("W/"):
+            tag = tag[2:]
+        if tag == etag:
+            return True
+    return False
+
+
+def is_not_modified(
+    etag: str,
+    last_modified: Optional[datetime],
+    if_none_match: Optional[str],
+    if_modified_since: Optional[str],
+) -> bool:
+    """Определяет, можно ли ответить 304 Not Modified.
+
+    Если передан If-None-Match, If-Modified-Since игнорируется
+    (RFC 9110, 13.2.2). Дата сравнивается с точностью до секунды,
+    так как Last-Modified передается без долей секунды.
+
+    Args:
+        etag: Текущий ETag ресурса.
+        last_modified: Дата последнего изменения ресурса (UTC) или None,
+            если ресурс ее не сообщает.
+        if_none_match: Значение заголовка If-None-Match.
+        if_modified_since: Значение заголовка If-Modified-Since.
+
+    Returns:
+        bool: True, если у клиента актуальная версия ресурса.
+    """
+    if if_none_match is not None:
+        return etag_matches(if_none_match, etag, weak=True)
+    if if_modified_since is not None and last_modified is not None:
+        since = parse_http_date(if_modified_since)
+        if since is not None:
+            return last_modified.replace(microsecond=0) <= since
+    return False
+
+
+def digest_etag(parts: Iterable[str]) -> str:
+    """Сильный ETag по хешу частей представления.
+
+    Args:
+        parts: Строки, однозначно определяющие содержимое ответа.
+
+    Returns:
+        str: ETag в кавычках.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        digest.update(part.encode())
+        digest.update(b"\x00")
+    return f'"{digest.hexdigest()}"'
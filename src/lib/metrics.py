@@ -0,0 +1,196 @@
+import math
+from typing import Dict, List, Sequence, Tuple
+
+# Границы корзин гистограмм длительности по умолчанию (секунды)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    """Форматирует метки в синтаксисе Prometheus (``{name="value"}``).
+
+    Args:
+        names: Имена меток.
+        values: Значения меток в том же порядке.
+
+    Returns:
+        str: Строка меток или пустая строка, если меток нет.
+    """
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values))
+    return "{" + pairs + "}"
+
+
+def format_value(value: float) -> str:
+    """Форматирует значение метрики (``+Inf`` для бесконечности)."""
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+
+def metric_header(name: str, documentation: str, metric_type: str) -> List[str]:
+    """Строки ``# HELP`` и ``# TYPE`` метрики.
+
+    Args:
+        name: Имя метрики.
+        documentation: Описание метрики.
+        metric_type: Тип метрики (``counter``, ``gauge``, ``histogram``).
+
+    Returns:
+        List[str]: Строки заголовка.
+    """
+    return [f"# HELP {name} {_escape(documentation)}", f"# TYPE {name} {metric_type}"]
+
+
+def single_metric(
+    name: str, documentation: str, value: float, metric_type: str = "gauge"
+) -> List[str]:
+    """Строки метрики без меток, значение которой вычисляется при сборе.
+
+    Args:
+        name: Имя метрики.
+        documentation: Описание метрики.
+        value: Текущее значение.
+        metric_type: Тип метрики.
+
+    Returns:
+        List[str]: Заголовок и строка значения.
+    """
+    return metric_header(name, documentation, metric_type) + [
+        f"{name} {format_value(value)}"
+    ]
+
+
+class Counter:
+    """Счетчик Prometheus с произвольными метками.
+
+    Attributes:
+        name: Имя метрики.
+        documentation: Описание метрики.
+        labelnames: Имена меток.
+    """
+
+    def __init__(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, *labelvalues: str, amount: float = 1.0) -> None:
+        """Увеличивает счетчик.
+
+        Args:
+            labelvalues: Значения меток в порядке ``labelnames``.
+            amount: Величина увеличения.
+        """
+        self._values[labelvalues] = self._values.get(labelvalues, 0.0) + amount
+
+    def collect(self) -> List[str]:
+        """Строки метрики в текстовом формате Prometheus."""
+        lines = metric_header(self.name, self.documentation, "counter")
+        for labelvalues, value in self._values.items():
+            labels = format_labels(self.labelnames, labelvalues)
+            lines.append(f"{self.name}{labels} {format_value(value)}")
+        return lines
+
+
+class Histogram:
+    """Гистограмма Prometheus с накопительными корзинами.
+
+    Attributes:
+        name: Имя метрики.
+        documentation: Описание метрики.
+        labelnames: Имена меток.
+        buckets: Верхние границы корзин по возрастанию.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+        # Для каждого набора меток: счетчики корзин, сумма и количество
+        self._values: Dict[LabelValues, Tuple[List[int], List[float]]] = {}
+
+    def observe(self, value: float, *labelvalues: str) -> None:
+        """Добавляет наблюдение.
+
+        Args:
+            value: Наблюдаемое значение.
+            labelvalues: Значения меток в порядке ``labelnames``.
+        """
+        item = self._values.get(labelvalues)
+        if item is None:
+            item = self._values[labelvalues] = ([0] * len(self.buckets), [0.0, 0.0])
+        counts, totals = item
+        for index, bound in enumerate(self.buckets):
+            if value <= bound:
+                counts[index] += 1
+                break
+        totals[0] += value
+        totals[1] += 1
+
+    def collect(self) -> List[str]:
+        """Строки метрики в текстовом формате Prometheus."""
+        lines = metric_header(self.name, self.documentation, "histogram")
+        bucket_labelnames = self.labelnames + ("le",)
+        for labelvalues, (counts, (total, count)) in self._values.items():
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                labels = format_labels(
+                    bucket_labelnames, labelvalues + (format_value(bound),)
+                )
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = format_labels(self.labelnames, labelvalues)
+            lines.append(f"{self.name}_sum{labels} {format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {format_value(count)}")
+        return lines
+
+
+class MetricsRegistry:
+    """Реестр метрик процесса."""
+
+    def __init__(self) -> None:
+        self._metrics: List[Counter | Histogram] = []
+
+    def counter(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> Counter:
+        """Создает и регистрирует счетчик."""
+        metric = Counter(name, documentation, labelnames)
+        self._metrics.append(metric)
+        return metric
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """Создает и регистрирует гистограмму."""
+        metric = Histogram(name, documentation, labelnames, buckets)
+        self._metrics.append(metric)
+        return metric
+
+    def collect(self) -> List[str]:
+        """Строки всех зарегистрированных метрик в текстовом формате Prometheus."""
+        lines: List[str] = []
+        for metric in self._metrics:
+            lines.extend(metric.collect())
+        return lines
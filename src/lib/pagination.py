@@ -0,0 +1,40 @@
+import base64
+import binascii
+from typing import Type, TypeVar
+
+import msgspec
+
+CursorT = TypeVar("CursorT", bound=msgspec.Struct)
+
+
+def encode_cursor(payload: msgspec.Struct) -> str:
+    """Кодирует позицию keyset-пагинации в непрозрачную строку.
+
+    Args:
+        payload: Структура с ключом сортировки последней записи страницы.
+
+    Returns:
+        str: Курсор в URL-безопасном base64 без выравнивания.
+    """
+    raw = msgspec.json.encode(payload)
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(cursor: str, cursor_type: Type[CursorT]) -> CursorT:
+    """Декодирует курсор, полученный от клиента.
+
+    Args:
+        cursor: Строка курсора из параметра запроса.
+        cursor_type: Ожидаемый тип структуры курсора.
+
+    Returns:
+        CursorT: Структура с ключом сортировки.
+
+    Raises:
+        ValueError: Если курсор поврежден или не соответствует типу.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        return msgspec.json.decode(raw, type=cursor_type)
+    except (binascii.Error, ValueError, msgspec.DecodeError) as e:
+        raise ValueError("Некорректный курсор пагинации") from e
@@ -0,0 +1,224 @@
+import math
+import time
+from typing import TYPE_CHECKING, NamedTuple
+
+import msgspec
+from litestar.stores.base import Store
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+
+
+class _BucketState(msgspec.Struct, array_like=True):
+    """Состояние корзины: доступные токены и время последнего пополнения."""
+
+    tokens: float
+    updated_at: float
+
+
+class RateLimitDecision(NamedTuple):
+    """Результат проверки лимита.
+
+    Attributes:
+        allowed: Запрос разрешен.
+        remaining: Оставшиеся целые токены.
+        retry_after: Через сколько секунд появится токен (0, если разрешен).
+    """
+
+    allowed: bool
+    remaining: int
+    retry_after: float
+
+
+class RateLimiter:
+    """Ограничение частоты запросов алгоритмом token bucket.
+
+    Каждый ключ (например, клиент и маршрут) имеет корзину емкостью
+    ``burst`` токенов, пополняемую со скоростью ``rate`` токенов в
+    секунду; запрос расходует один токен. Подклассы определяют, где
+    хранится состояние корзин.
+
+    Attributes:
+        rate: Скорость пополнения (токенов в секунду).
+        burst: Емкость корзины.
+    """
+
+    def __init__(self, rate: float, burst: int) -> None:
+        self.rate = rate
+        self.burst = burst
+        # Полная корзина восстанавливается за это время; после него
+        # состояние не нужно хранить
+        self._ttl = max(math.ceil(burst / rate), 1)
+
+    async def acquire(self, key: str) -> RateLimitDecision:
+        """Расходует токен из корзины ключа.
+
+        Args:
+            key: Ключ корзины.
+
+        Returns:
+            RateLimitDecision: Разрешен ли запрос и когда повторять.
+        """
+        raise NotImplementedError
+
+    def _decision(self, allowed: bool, tokens: float) -> RateLimitDecision:
+        retry_after = 0.0 if allowed else (1 - tokens) / self.rate
+        return RateLimitDecision(allowed, int(tokens), retry_after)
+
+    async def close(self) -> None:
+        """Освобождает ресурсы хранилища при завершении приложения."""
+
+
+class TokenBucketLimiter(RateLimiter):
+    """Ограничение частоты с состоянием в хранилище Litestar.
+
+    Обычно это :class:`~src.lib.cache.LRUMemoryStore` процесса. Чтение
+    и запись состояния не атомарны, поэтому хранилище не должно быть
+    общим для нескольких процессов: для общего лимита используется
+    :class:`RedisTokenBucketLimiter`.
+
+    Attributes:
+        store: Хранилище состояния корзин.
+    """
+
+    def __init__(self, store: Store, rate: float, burst: int) -> None:
+        super().__init__(rate, burst)
+        self.store = store
+        self._decoder = msgspec.msgpack.Decoder(_BucketState)
+        self._encoder = msgspec.msgpack.Encoder()
+
+    async def acquire(self, key: str) -> RateLimitDecision:
+        """Расходует токен из корзины ключа.
+
+        Args:
+            key: Ключ корзины.
+
+        Returns:
+            RateLimitDecision: Разрешен ли запрос и когда повторять.
+        """
+        # Время стены, а не monotonic: состояние может читать другой процесс
+        now = time.time()
+        raw = await self.store.get(key)
+        if raw is None:
+            tokens = float(self.burst)
+        else:
+            state = self._decoder.decode(raw)
+            elapsed = max(now - state.updated_at, 0.0)
+            tokens = min(float(self.burst), state.tokens + elapsed * self.rate)
+
+        allowed = tokens >= 1
+        if allowed:
+            tokens -= 1
+        await self.store.set(
+            key,
+            self._encoder.encode(_BucketState(tokens, now)),
+            expires_in=self._ttl,
+        )
+        return self._decision(allowed, tokens)
+
+    async def close(self) -> None:
+        """Закрывает соединение хранилища при завершении приложения."""
+        await self.store.__aexit__(None, None, None)
+
+
+# Пополнение корзины и расход токена одной командой Redis: скрипт
+# выполняется атомарно, поэтому одновременные запросы одного клиента
+# в разные воркеры не превышают лимит
+_ACQUIRE_SCRIPT = """
+local burst = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local ttl = tonumber(ARGV[4])
+
+local tokens = burst
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'updated_at')
+if state[1] then
+    local elapsed = math.max(now - tonumber(state[2]), 0)
+    tokens = math.min(burst, tonumber(state[1]) + elapsed * rate)
+end
+
+local allowed = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+    allowed = 1
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'updated_at', tostring(now))
+redis.call('EXPIRE', KEYS[1], ttl)
+-- Дробное число из скрипта Redis округлил бы до целого
+return {allowed, tostring(tokens)}
+"""
+
+
+class RedisTokenBucketLimiter(RateLimiter):
+    """Ограничение частоты с общим для всех процессов состоянием в Redis.
+
+    Состояние корзины читается и изменяется Lua-скриптом за одну
+    атомарную операцию.
+
+    Attributes:
+        redis: Клиент Redis.
+        namespace: Префикс ключей корзин.
+    """
+
+    def __init__(
+        self, redis: "Redis", rate: float, burst: int, namespace: str = "ratelimit"
+    ) -> None:
+        super().__init__(rate, burst)
+        self.redis = redis
+        self.namespace = namespace
+        self._acquire_script = redis.register_script(_ACQUIRE_SCRIPT)
+
+    async def acquire(self, key: str) -> RateLimitDecision:
+        """Расходует токен из корзины ключа.
+
+        Args:
+            key: Ключ корзины.
+
+        Returns:
+            RateLimitDecision: Разрешен ли запрос и когда повторять.
+        """
+        allowed, tokens = await self._acquire_script(
+            keys=[f"{self.namespace}:{key}"],
+            args=[self.burst, repr(self.rate), repr(time.time()), self._ttl],
+        )
+        return self._decision(bool(allowed), float(tokens))
+
+    async def close(self) -> None:
+        """Закрывает соединения с Redis при завершении приложения."""
+        await self.redis.aclose(close_connection_pool=True)
+
+
+class InFlightLimiter:
+    """Ограничение количества одновременно обрабатываемых запросов.
+
+    Запрос сверх лимита отклоняется сразу, а не ждет в очереди пула
+    соединений или пула хеширования, поэтому задержка принятых запросов
+    остается ограниченной при перегрузке. Счетчик действует в пределах
+    процесса-воркера.
+
+    Attributes:
+        max_in_flight: Максимум одновременных запросов (0 - без лимита).
+        in_flight: Текущее количество запросов.
+    """
+
+    __slots__ = ("max_in_flight", "in_flight")
+
+    def __init__(self, max_in_flight: int) -> None:
+        self.max_in_flight = max_in_flight
+        self.in_flight = 0
+
+    def try_acquire(self) -> bool:
+        """Занимает место, если лимит не исчерпан.
+
+        Returns:
+            bool: True, если место занято (его нужно освободить
+                через :meth:`release`).
+        """
+        if self.max_in_flight and self.in_flight >= self.max_in_flight:
+            return False
+        self.in_flight += 1
+        return True
+
+    def release(self) -> None:
+        """Освобождает место, занятое :meth:`try_acquire`."""
+        self.in_flight -= 1
@@ -0,0 +1,52 @@
+from typing import Any, TypeVar
+
+import msgspec
+from litestar import Response
+from litestar.enums import MediaType
+from litestar.exceptions import ImproperlyConfiguredException
+from litestar.serialization import default_serializer
+from litestar.types import Serializer
+
+T = TypeVar("T")
+
+# Общий JSON-кодировщик приложения. Litestar при наличии enc_hook кодирует
+# каждый ответ через msgspec.json.encode(..., enc_hook=...), заново
+# подготавливая кодировщик; здесь он создается один раз
+json_encoder = msgspec.json.Encoder(enc_hook=default_serializer)
+
+
+class JSONResponse(Response[T]):
+    """Ответ, кодирующий JSON общим кодировщиком ``json_encoder``.
+
+    Используется как ``response_class`` приложения. Типы без встроенной
+    поддержки msgspec кодируются ``default_serializer`` Litestar;
+    ``type_encoders`` слоев приложения этим классом не учитываются.
+    """
+
+    def render(
+        self,
+        content: Any,
+        media_type: str,
+        enc_hook: Serializer = default_serializer,
+    ) -> bytes:
+        """Кодирует содержимое ответа.
+
+        Args:
+            content: Содержимое ответа.
+            media_type: Тип содержимого.
+            enc_hook: Сериализатор слоев приложения (для JSON не используется).
+
+        Returns:
+            bytes: Тело ответа.
+
+        Raises:
+            ImproperlyConfiguredException: Если содержимое не кодируется в JSON.
+        """
+        if media_type != MediaType.JSON or isinstance(content, (bytes, str)):
+            return super().render(content, media_type, enc_hook)
+        try:
+            return json_encoder.encode(content)
+        except (TypeError, msgspec.EncodeError) as e:
+            raise ImproperlyConfiguredException(
+                "Unable to serialize response content"
+            ) from e
@@ -0,0 +1,28 @@
+"""Генерация схемы OpenAPI в файл при сборке.
+
+    python -m src.openapi openapi.json
+
+Позволяет публиковать документацию без эндпоинтов /schema в работающем
+сервисе (``OPENAPI_ENABLED=False``).
+"""
+
+import os
+import sys
+
+import msgspec
+
+
+def main() -> None:
+    path = sys.argv[1] if len(sys.argv) > 1 else "openapi.json"
+    # Схема доступна только при включенной документации
+    os.environ["OPENAPI_ENABLED"] = "True"
+    from src.app import app
+
+    with open(path, "wb") as file:
+        schema = msgspec.json.encode(app.openapi_schema.to_schema())
+        file.write(msgspec.json.format(schema))
+    print(f"Схема OpenAPI сохранена в {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+from typing import Any
+
+from granian import Granian
+from granian.constants import HTTPModes, Interfaces, Loops
+from granian.server.common import AbstractServer
+
+from src.core.config import settings
+
+
+def build_server() -> AbstractServer[Any]:
+    """Создает сервер Granian по настройкам приложения.
+
+    Приложение передается строкой импорта: каждый процесс-воркер
+    импортирует его сам и создает собственный пул соединений с базой
+    данных (размер пула см. ``build_pool_limits``).
+
+    Returns:
+        AbstractServer[Any]: Настроенный сервер (``Granian``).
+    """
+    return Granian(
+        target="src.app:app",
+        address=settings.SERVER_HOST,
+        port=settings.SERVER_PORT,
+        interface=Interfaces.ASGI,
+        workers=settings.server_workers,
+        runtime_threads=settings.SERVER_RUNTIME_THREADS,
+        backlog=settings.SERVER_BACKLOG,
+        http=HTTPModes(settings.SERVER_HTTP),
+        loop=Loops(settings.SERVER_LOOP),
+        # Упавший воркер перезапускается, а не уменьшает пропускную способность
+        respawn_failed_workers=True,
+    )
+
+
+if __name__ == "__main__":
+    build_server().serve()
@@ -0,0 +1,107 @@
+"""Общие фикстуры тестов API пользователей.
+
+Приложение работает в процессе на SQLite (aiosqlite) во временном
+каталоге. Настройки читаются при импорте модулей ``src``, поэтому
+переменные окружения задаются до импорта приложения.
+"""
+
+import asyncio
+import os
+import tempfile
+from typing import Any, AsyncIterator, Dict, Iterator, List
+
+_database_dir = tempfile.mkdtemp(prefix="user-api-tests-")
+os.environ.update(
+    DATABASE_URL=f"sqlite+aiosqlite:///{_database_dir}/test.sqlite3",
+    DATABASE_REPLICA_URLS="",
+    # Минимальная стоимость bcrypt: тесты проверяют запросы, а не хеширование
+    PASSWORD_BCRYPT_ROUNDS="4",
+    USER_CACHE_BACKEND="none",
+    USER_INSERT_BATCHING="false",
+    RATE_LIMIT_BACKEND="none",
+    MAX_IN_FLIGHT_REQUESTS="0",
+)
+
+import httpx  # noqa: E402
+import pytest  # noqa: E402
+from litestar import Litestar  # noqa: E402
+from sqlalchemy import event  # noqa: E402
+
+from src.app import app as litestar_app  # noqa: E402
+from src.db.models import User  # noqa: E402
+from src.db.session import sqlalchemy_config  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+async def app() -> AsyncIterator[Litestar]:
+    """Приложение с созданной схемой базы данных.
+
+    Lifespan приложения выполняется в отдельной задаче: anyio требует
+    выхода из него в той же задаче, где был вход, а установка и
+    завершение фикстуры выполняются в разных задачах.
+    """
+    async with sqlalchemy_config.engine_instance.begin() as connection:
+        await connection.run_sync(User.metadata.create_all)
+
+    started = asyncio.Event()
+    stopping = asyncio.Event()
+
+    async def run_lifespan() -> None:
+        async with litestar_app.lifespan():
+            started.set()
+            await stopping.wait()
+
+    lifespan = asyncio.create_task(run_lifespan())
+    ready = asyncio.create_task(started.wait())
+    await asyncio.wait({lifespan, ready}, return_when=asyncio.FIRST_COMPLETED)
+    if lifespan.done():
+        ready.cancel()
+        lifespan.result()  # Ошибка запуска приложения
+    yield litestar_app
+    stopping.set()
+    await lifespan
+
+
+@pytest.fixture
+async def client(app: Litestar) -> AsyncIterator[httpx.AsyncClient]:
+    """HTTP-клиент приложения через ASGI-транспорт."""
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://testserver.local"
+    ) as client:
+        yield client
+
+
+@pytest.fixture
+def statements() -> Iterator[List[str]]:
+    """SQL-выражения, отправленные в базу данных во время теста.
+
+    Список можно очистить перед проверяемым запросом, чтобы не учитывать
+    подготовку данных.
+    """
+    captured: List[str] = []
+
+    def before_cursor_execute(
+        conn: Any,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool,
+    ) -> None:
+        captured.append(statement)
+
+    engine = sqlalchemy_config.engine_instance.sync_engine
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    yield captured
+    event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+@pytest.fixture
+async def user(client: httpx.AsyncClient) -> Dict[str, Any]:
+    """Созданный через API пользователь."""
+    response = await client.post(
+        "/users",
+        json={"name": "Ivan", "surname": "Petrov", "password": "initial-password"},
+    )
+    assert response.status_code == 201
+    return response.json()
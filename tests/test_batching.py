@@ -0,0 +1,66 @@
+"""Отказ BatchInserter.insert без работающей фоновой задачи."""
+
+import asyncio
+
+import pytest
+from litestar import Litestar
+
+from src.db.batching import BatchInserter
+from src.db.models import User
+from src.db.session import sqlalchemy_config
+
+
+@pytest.fixture
+def inserter(app: Litestar) -> BatchInserter:
+    """Объединение вставок пользователей в базу тестового приложения."""
+    return BatchInserter(sqlalchemy_config.create_session_maker(), window=0.001)
+
+
+def new_user() -> User:
+    return User(name="Ivan", surname="Petrov", password="x")
+
+
+async def test_insert_writes_batch(inserter: BatchInserter) -> None:
+    await inserter.start()
+    users = await asyncio.gather(*(inserter.insert(new_user()) for _ in range(3)))
+    await inserter.close()
+
+    assert all(user.id is not None for user in users)
+
+
+async def test_insert_rejected_before_start(inserter: BatchInserter) -> None:
+    with pytest.raises(RuntimeError):
+        await inserter.insert(new_user())
+
+
+async def test_insert_rejected_while_closing(inserter: BatchInserter) -> None:
+    await inserter.start()
+    closing = asyncio.create_task(inserter.close())
+    await asyncio.sleep(0)
+
+    with pytest.raises(RuntimeError):
+        await asyncio.wait_for(inserter.insert(new_user()), 1)
+    await closing
+
+
+async def test_insert_rejected_after_task_stopped(inserter: BatchInserter) -> None:
+    await inserter.start()
+    assert inserter._task is not None
+    inserter._task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await inserter._task
+
+    with pytest.raises(RuntimeError):
+        await asyncio.wait_for(inserter.insert(new_user()), 1)
+
+
+async def test_pending_insert_fails_when_task_stops(inserter: BatchInserter) -> None:
+    inserter.window = 10
+    await inserter.start()
+    pending = asyncio.create_task(inserter.insert(new_user()))
+    await asyncio.sleep(0)
+    assert inserter._task is not None
+    inserter._task.cancel()
+
+    with pytest.raises(RuntimeError):
+        await asyncio.wait_for(pending, 1)
@@ -0,0 +1,126 @@
+"""Выбор сжатия ответов по Accept-Encoding и минимальный размер."""
+
+from typing import Any, AsyncIterator, Callable, Dict
+
+import httpx
+import pytest
+from litestar import Litestar, MediaType, get
+
+from src.core.compression import build_compression_config
+from src.core.config import settings
+
+MINIMUM_SIZE = 1024
+
+
+@get("/payload", media_type=MediaType.TEXT, sync_to_thread=False)
+def payload(size: int) -> str:
+    return "x" * size
+
+
+@pytest.fixture
+def make_client(
+    monkeypatch: pytest.MonkeyPatch,
+) -> Callable[..., httpx.AsyncClient]:
+    """Клиент приложения со сжатием по заданным настройкам."""
+
+    def factory(**overrides: Any) -> httpx.AsyncClient:
+        monkeypatch.setattr(settings, "COMPRESSION_MINIMUM_SIZE", MINIMUM_SIZE)
+        for name, value in overrides.items():
+            monkeypatch.setattr(settings, name, value)
+        app = Litestar(
+            route_handlers=[payload], compression_config=build_compression_config()
+        )
+        return httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://testserver.local"
+        )
+
+    return factory
+
+
+async def fetch(
+    client: httpx.AsyncClient, size: int, accept_encoding: str
+) -> httpx.Response:
+    async with client:
+        response = await client.get(
+            "/payload",
+            params={"size": size},
+            headers={"Accept-Encoding": accept_encoding},
+        )
+    assert response.status_code == 200
+    assert response.text == "x" * size
+    return response
+
+
+def test_compression_disabled(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "COMPRESSION_BACKEND", "none")
+
+    assert build_compression_config() is None
+
+
+@pytest.mark.parametrize(
+    ("size", "accept_encoding", "expected"),
+    [
+        (MINIMUM_SIZE * 4, "gzip", "gzip"),
+        (MINIMUM_SIZE * 4, "identity", None),
+        (MINIMUM_SIZE * 4, "br", None),
+        # Меньше минимального размера ответ не сжимается
+        (MINIMUM_SIZE - 1, "gzip", None),
+    ],
+)
+async def test_gzip_negotiation(
+    make_client: Callable[..., httpx.AsyncClient],
+    size: int,
+    accept_encoding: str,
+    expected: str,
+) -> None:
+    client = make_client(COMPRESSION_BACKEND="gzip")
+
+    response = await fetch(client, size, accept_encoding)
+
+    assert response.headers.get("content-encoding") == expected
+    if expected is not None:
+        assert "accept-encoding" in response.headers["vary"].lower()
+        assert response.num_bytes_downloaded < size
+
+
+@pytest.mark.parametrize(
+    ("accept_encoding", "expected"),
+    [
+        ("br, gzip", "br"),
+        # Клиенту без поддержки brotli ответ сжимается gzip
+        ("gzip", "gzip"),
+        ("identity", None),
+    ],
+)
+async def test_brotli_negotiation(
+    make_client: Callable[..., httpx.AsyncClient],
+    accept_encoding: str,
+    expected: str,
+) -> None:
+    pytest.importorskip("brotli")
+    client = make_client(COMPRESSION_BACKEND="brotli")
+
+    response = await fetch(client, MINIMUM_SIZE * 4, accept_encoding)
+
+    assert response.headers.get("content-encoding") == expected
+
+
+async def test_app_compresses_lists_but_not_single_users(
+    client: httpx.AsyncClient, user: Dict[str, Any]
+) -> None:
+    response = await client.post(
+        "/users/bulk",
+        json=[
+            {"name": "Ivan", "surname": f"Petrov{i}", "password": "password"}
+            for i in range(20)
+        ],
+    )
+    assert response.status_code == 201
+    headers = {"Accept-Encoding": "gzip"}
+
+    single = await client.get(f"/users/{user['id']}", headers=headers)
+    page = await client.get("/users", params={"page_size": 20}, headers=headers)
+
+    assert "content-encoding" not in single.headers
+    assert len(page.content) >= settings.COMPRESSION_MINIMUM_SIZE
+    assert page.headers["content-encoding"] == "gzip"
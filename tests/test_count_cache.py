@@ -0,0 +1,86 @@
+"""Кэш количества пользователей (стратегия count=cached)."""
+
+import asyncio
+from typing import List
+
+import pytest
+
+from src.domain.users.counts import CountCache
+
+
+class SlowCount:
+    """Подсчет, ожидающий разрешения теста; считает свои вызовы."""
+
+    def __init__(self, value: int = 42) -> None:
+        self.value = value
+        self.calls = 0
+        self.release = asyncio.Event()
+
+    async def __call__(self) -> int:
+        self.calls += 1
+        await self.release.wait()
+        return self.value
+
+
+async def test_concurrent_misses_share_one_count() -> None:
+    cache = CountCache()
+    compute = SlowCount()
+
+    waiters = [asyncio.create_task(cache.get("key", compute)) for _ in range(10)]
+    await asyncio.sleep(0)
+    compute.release.set()
+
+    assert await asyncio.gather(*waiters) == [42] * 10
+    assert compute.calls == 1
+    assert await cache.get("key", compute) == 42
+    assert compute.calls == 1
+
+
+async def test_failed_count_not_cached() -> None:
+    cache = CountCache()
+    calls: List[int] = []
+
+    async def failing() -> int:
+        calls.append(1)
+        raise RuntimeError("count failed")
+
+    results = await asyncio.gather(
+        cache.get("key", failing), cache.get("key", failing), return_exceptions=True
+    )
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert len(calls) == 1
+    compute = SlowCount(7)
+    compute.release.set()
+    assert await cache.get("key", compute) == 7
+
+
+async def test_cancelled_waiter_keeps_count_running() -> None:
+    cache = CountCache()
+    compute = SlowCount()
+
+    first = asyncio.create_task(cache.get("key", compute))
+    second = asyncio.create_task(cache.get("key", compute))
+    await asyncio.sleep(0)
+    first.cancel()
+    compute.release.set()
+
+    assert await second == 42
+    with pytest.raises(asyncio.CancelledError):
+        await first
+
+
+async def test_stale_value_refreshed_once_in_background() -> None:
+    cache = CountCache(refresh_after=0)
+    initial = SlowCount(1)
+    initial.release.set()
+    await cache.get("key", initial)
+    refresh = SlowCount(2)
+
+    assert [await cache.get("key", refresh) for _ in range(3)] == [1, 1, 1]
+    refresh.release.set()
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+
+    assert refresh.calls == 1
+    assert cache._values["key"][0] == 2
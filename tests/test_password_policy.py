@@ -0,0 +1,27 @@
+"""Проверка политики хеширования паролей при старте приложения."""
+
+import pytest
+from litestar.exceptions import ImproperlyConfiguredException
+
+from src.core import security
+from src.core.config import settings
+
+
+@pytest.mark.parametrize("schemes", ["unknown-scheme", " , "])
+def test_invalid_schemes_fail_at_startup(
+    monkeypatch: pytest.MonkeyPatch, schemes: str
+) -> None:
+    monkeypatch.setattr(security, "_crypt_context", None)
+    monkeypatch.setattr(settings, "PASSWORD_HASH_SCHEMES", schemes)
+
+    with pytest.raises(ImproperlyConfiguredException, match="PASSWORD_HASH_SCHEMES"):
+        security.password_hasher.start()
+
+
+def test_valid_schemes_built_at_startup(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(security, "_crypt_context", None)
+
+    security.password_hasher.start()
+
+    assert security._crypt_context is not None
+    assert security._crypt_context.schemes() == ("bcrypt",)
@@ -0,0 +1,74 @@
+"""Размеры пула соединений и кэш пользователей при нескольких воркерах."""
+
+import logging
+from typing import Tuple
+
+import pytest
+
+from src.core.config import settings
+from src.db.session import build_pool_limits
+from src.domain.users.cache import warn_if_user_cache_disabled
+
+
+@pytest.mark.parametrize(
+    ("max_connections", "workers", "limits"),
+    [
+        # Лимит не меньше полного пула: пул воркера не увеличивается
+        (80, 1, (5, 10)),
+        (80, 4, (5, 10)),
+        (80, 16, (5, 0)),
+        (80, 32, (2, 0)),
+        (80, 200, (1, 0)),
+        (0, 32, (5, 10)),
+    ],
+)
+def test_pool_limits_split_between_workers(
+    monkeypatch: pytest.MonkeyPatch,
+    max_connections: int,
+    workers: int,
+    limits: Tuple[int, int],
+) -> None:
+    monkeypatch.setattr(settings, "DB_POOL_SIZE", 5)
+    monkeypatch.setattr(settings, "DB_MAX_OVERFLOW", 10)
+    monkeypatch.setattr(settings, "DB_MAX_CONNECTIONS", max_connections)
+    monkeypatch.setattr(settings, "SERVER_WORKERS", workers)
+
+    assert build_pool_limits() == limits
+
+
+@pytest.mark.parametrize(
+    ("backend", "workers", "expected"),
+    [
+        (None, 1, "memory"),
+        (None, 8, "none"),
+        ("memory", 8, "memory"),
+        ("redis", 1, "redis"),
+    ],
+)
+def test_user_cache_backend_depends_on_workers(
+    monkeypatch: pytest.MonkeyPatch, backend: str, workers: int, expected: str
+) -> None:
+    monkeypatch.setattr(settings, "USER_CACHE_BACKEND", backend)
+    monkeypatch.setattr(settings, "SERVER_WORKERS", workers)
+
+    assert settings.user_cache_backend == expected
+
+
+@pytest.mark.parametrize(
+    ("backend", "workers", "warned"),
+    [(None, 4, True), (None, 1, False), ("none", 4, False), ("redis", 4, False)],
+)
+def test_disabled_user_cache_warning(
+    monkeypatch: pytest.MonkeyPatch,
+    caplog: pytest.LogCaptureFixture,
+    backend: str,
+    workers: int,
+    warned: bool,
+) -> None:
+    monkeypatch.setattr(settings, "USER_CACHE_BACKEND", backend)
+    monkeypatch.setattr(settings, "SERVER_WORKERS", workers)
+
+    with caplog.at_level(logging.WARNING, logger="src.domain.users.cache"):
+        warn_if_user_cache_disabled()
+
+    assert ("USER_CACHE_BACKEND=redis" in caplog.text) is warned
@@ -0,0 +1,23 @@
+"""Заголовок Server-Timing и исключение проб из профилирования."""
+
+from typing import Any, Dict
+
+import httpx
+
+
+async def test_server_timing_header(
+    client: httpx.AsyncClient, user: Dict[str, Any]
+) -> None:
+    response = await client.get(f"/users/{user['id']}")
+
+    assert response.status_code == 200
+    timing = response.headers["Server-Timing"]
+    assert 'desc="1 queries"' in timing
+    assert "total;dur=" in timing
+
+
+async def test_health_probes_not_profiled(client: httpx.AsyncClient) -> None:
+    response = await client.get("/health/live")
+
+    assert response.status_code == 200
+    assert "Server-Timing" not in response.headers
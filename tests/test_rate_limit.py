@@ -0,0 +1,122 @@
+"""Ограничение частоты изменяющих запросов к /users.
+
+Проверка атомарности корзины в Redis выполняется с сервером из
+переменной окружения ``TEST_REDIS_URL`` и без него пропускается.
+"""
+
+import asyncio
+import os
+from ipaddress import ip_network
+from typing import Any, AsyncIterator, Dict, List, Tuple, cast
+
+import httpx
+import pytest
+from litestar.types import Scope
+
+from src.core import limits
+from src.core.limits import client_address
+from src.lib.cache import LRUMemoryStore
+from src.lib.ratelimit import (RateLimiter, RedisTokenBucketLimiter,
+                               TokenBucketLimiter)
+
+REDIS_URL = os.environ.get("TEST_REDIS_URL")
+
+
+@pytest.fixture
+def rate_limiter(monkeypatch: pytest.MonkeyPatch) -> TokenBucketLimiter:
+    """Лимит в памяти процесса: корзина из двух запросов без пополнения."""
+    limiter = TokenBucketLimiter(LRUMemoryStore(max_size=100), rate=0.001, burst=2)
+    monkeypatch.setattr(limits, "rate_limiter", limiter)
+    return limiter
+
+
+def http_scope(client: str, headers: List[Tuple[bytes, bytes]]) -> Scope:
+    """Минимальный HTTP-scope: адрес соединения и заголовки."""
+    return cast(
+        Scope, {"type": "http", "client": (client, 50000), "headers": headers}
+    )
+
+
+PROXIES = [ip_network("10.0.0.0/8")]
+
+
+@pytest.mark.parametrize(
+    ("peer", "forwarded", "expected"),
+    [
+        # Прямое соединение: заголовок клиента игнорируется
+        ("203.0.113.5", [b"198.51.100.1"], "203.0.113.5"),
+        ("10.0.0.2", [b"198.51.100.1"], "198.51.100.1"),
+        # Подмененный клиентом адрес левее реального игнорируется
+        ("10.0.0.2", [b"1.1.1.1, 198.51.100.1, 10.0.0.3"], "198.51.100.1"),
+        ("10.0.0.2", [b"1.1.1.1", b"198.51.100.1"], "198.51.100.1"),
+        # Без заголовка остается адрес прокси
+        ("10.0.0.2", [], "10.0.0.2"),
+        ("10.0.0.2", [b"10.0.0.3"], "10.0.0.3"),
+    ],
+)
+def test_client_address(peer: str, forwarded: List[bytes], expected: str) -> None:
+    headers = [(b"x-forwarded-for", value) for value in forwarded]
+
+    assert client_address(http_scope(peer, headers), PROXIES) == expected
+
+
+def test_client_address_without_trusted_proxies() -> None:
+    scope = http_scope("10.0.0.2", [(b"x-forwarded-for", b"198.51.100.1")])
+
+    assert client_address(scope) == "10.0.0.2"
+
+
+async def test_reads_not_rate_limited(
+    client: httpx.AsyncClient, user: Dict[str, Any], rate_limiter: TokenBucketLimiter
+) -> None:
+    for _ in range(5):
+        assert (await client.get(f"/users/{user['id']}")).status_code == 200
+        assert (await client.get("/users")).status_code == 200
+
+
+async def test_writes_rate_limited(
+    client: httpx.AsyncClient, user: Dict[str, Any], rate_limiter: TokenBucketLimiter
+) -> None:
+    statuses = [
+        (
+            await client.patch(f"/users/{user['id']}", json={"surname": f"S{i}"})
+        ).status_code
+        for i in range(3)
+    ]
+
+    assert statuses == [200, 200, 429]
+
+
+@pytest.fixture
+async def redis_limiter() -> AsyncIterator[RedisTokenBucketLimiter]:
+    if not REDIS_URL:
+        pytest.skip("TEST_REDIS_URL не задан")
+    from redis.asyncio import Redis
+
+    limiter = RedisTokenBucketLimiter(
+        Redis.from_url(REDIS_URL),
+        rate=0.001,
+        burst=10,
+        namespace=f"test-ratelimit-{os.getpid()}",
+    )
+    yield limiter
+    await limiter.redis.delete(f"{limiter.namespace}:client")
+    await limiter.close()
+
+
+async def test_redis_bucket_atomic(redis_limiter: RedisTokenBucketLimiter) -> None:
+    decisions = await asyncio.gather(
+        *(redis_limiter.acquire("client") for _ in range(50))
+    )
+
+    assert sum(decision.allowed for decision in decisions) == 10
+    assert sorted(decision.remaining for decision in decisions)[-1] == 9
+
+
+def test_limiters_share_base_state() -> None:
+    memory = TokenBucketLimiter(LRUMemoryStore(max_size=10), rate=2.0, burst=5)
+
+    assert isinstance(memory, RateLimiter)
+    assert issubclass(RedisTokenBucketLimiter, RateLimiter)
+    assert (memory.rate, memory.burst, memory._ttl) == (2.0, 5, 3)
+    assert memory._decision(False, 0.5).retry_after == 0.25
@@ -0,0 +1,123 @@
+"""Пакетные эндпоинты POST, PATCH и DELETE /users/bulk."""
+
+from typing import Any, Dict, List
+
+import httpx
+import pytest
+
+MISSING_USER_ID = 10**9
+
+
+@pytest.fixture
+async def users(client: httpx.AsyncClient) -> List[Dict[str, Any]]:
+    """Два пользователя, созданные пакетным запросом."""
+    response = await client.post(
+        "/users/bulk",
+        json=[
+            {"name": "Ivan", "surname": "Petrov", "password": "initial-password"},
+            {"name": "Anna", "surname": "Ivanova", "password": "initial-password"},
+        ],
+    )
+    assert response.status_code == 201
+    return [item["user"] for item in response.json()]
+
+
+async def test_bulk_create_users(
+    client: httpx.AsyncClient, statements: List[str]
+) -> None:
+    response = await client.post(
+        "/users/bulk",
+        json=[
+            {"name": f"Name{i}", "surname": f"Surname{i}", "password": "password"}
+            for i in range(3)
+        ],
+    )
+
+    assert response.status_code == 201
+    body = response.json()
+    assert [item["index"] for item in body] == [0, 1, 2]
+    assert {item["status_code"] for item in body} == {201}
+    assert [item["user"]["name"] for item in body] == ["Name0", "Name1", "Name2"]
+    assert all(item["id"] == item["user"]["id"] for item in body)
+    # Серверные значения возвращает INSERT ... RETURNING, без SELECT;
+    # SQLite выполняет его по строке, PostgreSQL - многострочным INSERT
+    assert statements
+    assert all(statement.startswith("INSERT") for statement in statements)
+    assert all("RETURNING" in statement for statement in statements)
+
+
+async def test_bulk_update_users(
+    client: httpx.AsyncClient, users: List[Dict[str, Any]], statements: List[str]
+) -> None:
+    first, second = users
+    statements.clear()
+    response = await client.patch(
+        "/users/bulk",
+        json=[
+            {"id": first["id"], "name": "Pyotr"},
+            {"id": MISSING_USER_ID, "name": "Nobody"},
+            {"id": second["id"], "surname": "Sidorova", "password": "new-password"},
+        ],
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert [item["index"] for item in body] == [0, 1, 2]
+    assert [item["status_code"] for item in body] == [200, 404, 200]
+    assert body[0]["user"]["name"] == "Pyotr"
+    assert body[0]["user"]["surname"] == first["surname"]
+    assert body[1]["id"] == MISSING_USER_ID
+    assert "user" not in body[1] and body[1]["detail"]
+    assert body[2]["user"]["surname"] == "Sidorova"
+    assert body[2]["user"]["updated_at"] >= second["updated_at"]
+    # Проверка идентификаторов, UPDATE по первичному ключу, чтение результата
+    assert [statement.split()[0] for statement in statements] == [
+        "SELECT",
+        "UPDATE",
+        "UPDATE",
+        "SELECT",
+    ]
+
+
+async def test_bulk_update_missing_users_skips_update(
+    client: httpx.AsyncClient, statements: List[str]
+) -> None:
+    response = await client.patch(
+        "/users/bulk",
+        json=[{"id": MISSING_USER_ID, "password": "new-password"}],
+    )
+
+    assert response.status_code == 200
+    assert [item["status_code"] for item in response.json()] == [404]
+    assert not any(statement.startswith("UPDATE") for statement in statements)
+
+
+async def test_bulk_delete_users(
+    client: httpx.AsyncClient, users: List[Dict[str, Any]], statements: List[str]
+) -> None:
+    statements.clear()
+    response = await client.request(
+        "DELETE",
+        "/users/bulk",
+        json={"ids": [users[0]["id"], MISSING_USER_ID, users[1]["id"]]},
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert [item["index"] for item in body] == [0, 1, 2]
+    assert [item["status_code"] for item in body] == [204, 404, 204]
+    assert body[1]["id"] == MISSING_USER_ID and body[1]["detail"]
+    assert len(statements) == 1
+    assert statements[0].startswith("DELETE")
+    assert "RETURNING" in statements[0]
+
+    response = await client.get(f"/users/{users[0]['id']}")
+    assert response.status_code == 404
+
+
+async def test_bulk_size_limit(client: httpx.AsyncClient) -> None:
+    response = await client.request(
+        "DELETE", "/users/bulk", json={"ids": list(range(1, 20002))}
+    )
+
+    assert response.status_code == 400
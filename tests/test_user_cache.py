@@ -0,0 +1,218 @@
+"""Хранилище LRUMemoryStore и кэш пользователей UserCache.
+
+Проверка с Redis выполняется на ``fakeredis`` (зависимость разработки)
+и без него пропускается.
+"""
+
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
+
+import httpx
+import pytest
+from litestar.stores.base import Store
+
+from src.domain.users import controllers
+from src.domain.users.cache import UserCache
+from src.domain.users.schemas import UserSchema
+from src.lib import cache as cache_module
+from src.lib.cache import LRUMemoryStore
+
+
+class Clock:
+    """Управляемое время для ``time.monotonic`` хранилища."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> Clock:
+    clock = Clock()
+    monkeypatch.setattr(cache_module.time, "monotonic", clock)
+    return clock
+
+
+class FailingStore(LRUMemoryStore):
+    """Хранилище, все операции которого завершаются ошибкой."""
+
+    async def get(self, key: str, renew_for: Any = None) -> Optional[bytes]:
+        raise ConnectionError("store is down")
+
+    async def set(self, key: str, value: Any, expires_in: Any = None) -> None:
+        raise ConnectionError("store is down")
+
+    async def delete(self, key: str) -> None:
+        raise ConnectionError("store is down")
+
+
+def make_user(user_id: int = 1, name: str = "Ivan") -> UserSchema:
+    return UserSchema(
+        id=user_id,
+        name=name,
+        surname="Petrov",
+        created_at=datetime(2026, 1, 1),
+        updated_at=datetime(2026, 1, 1),
+    )
+
+
+async def test_store_ttl_expiry(clock: Clock) -> None:
+    store = LRUMemoryStore(max_size=10)
+    await store.set("a", b"1", expires_in=30)
+    await store.set("b", b"2")
+
+    clock.now += 29
+    assert await store.get("a") == b"1"
+    assert await store.expires_in("a") == 1
+
+    clock.now += 1
+    assert await store.get("a") is None
+    assert await store.get("b") == b"2"
+    assert store.expirations == 1
+    assert len(store) == 1
+
+
+async def test_store_renew_for(clock: Clock) -> None:
+    store = LRUMemoryStore(max_size=10)
+    await store.set("a", b"1", expires_in=10)
+
+    clock.now += 9
+    assert await store.get("a", renew_for=10) == b"1"
+    clock.now += 9
+    assert await store.exists("a")
+
+
+async def test_store_lru_eviction() -> None:
+    store = LRUMemoryStore(max_size=2)
+    await store.set("a", b"1")
+    await store.set("b", b"2")
+    # Чтение делает ключ самым свежим: вытесняется b
+    await store.get("a")
+    await store.set("c", b"3")
+
+    assert await store.get("b") is None
+    assert await store.get("a") == b"1"
+    assert await store.get("c") == b"3"
+    assert store.evictions == 1
+    assert store.expirations == 0
+
+
+async def test_user_cache_hit_and_miss() -> None:
+    user_cache = UserCache(LRUMemoryStore(max_size=10), ttl=30)
+
+    assert await user_cache.get(1) is None
+    await user_cache.set(make_user())
+    assert await user_cache.get(1) == make_user()
+    assert user_cache.stats() == {
+        "hits": 1,
+        "misses": 1,
+        "stale_fills": 0,
+        "evictions": 0,
+        "expirations": 0,
+    }
+
+
+async def test_user_cache_invalidate() -> None:
+    user_cache = UserCache(LRUMemoryStore(max_size=10), ttl=30)
+    await user_cache.set(make_user(1))
+    await user_cache.set(make_user(2))
+
+    await user_cache.invalidate(1, 2)
+
+    assert await user_cache.get(1) is None
+    assert await user_cache.get(2) is None
+
+
+async def test_user_cache_skips_fill_after_invalidation() -> None:
+    user_cache = UserCache(LRUMemoryStore(max_size=10), ttl=30)
+    version = await user_cache.version(1)
+    # Пользователь изменен, пока значение читалось из базы
+    await user_cache.invalidate(1)
+    await user_cache.set(make_user(name="Stale"), version)
+
+    assert await user_cache.get(1) is None
+    assert user_cache.stale_fills == 1
+
+    version = await user_cache.version(1)
+    await user_cache.set(make_user(name="Fresh"), version)
+    cached = await user_cache.get(1)
+    assert cached is not None and cached.name == "Fresh"
+
+
+async def test_user_cache_swallows_store_errors() -> None:
+    user_cache = UserCache(FailingStore(), ttl=30)
+
+    assert await user_cache.version(1) is None
+    await user_cache.set(make_user())
+    await user_cache.invalidate(1)
+    assert await user_cache.get(1) is None
+    assert user_cache.misses == 1
+
+
+@pytest.fixture
+async def redis_store() -> AsyncIterator[Store]:
+    fakeredis = pytest.importorskip("fakeredis")
+    from litestar.stores.redis import RedisStore
+
+    redis = fakeredis.FakeAsyncRedis(server=fakeredis.FakeServer())
+    yield RedisStore(redis, namespace="users")
+    await redis.aclose()
+
+
+async def test_user_cache_with_redis_store(redis_store: Store) -> None:
+    user_cache = UserCache(redis_store, ttl=30)
+
+    version = await user_cache.version(1)
+    await user_cache.set(make_user(), version)
+    assert await user_cache.get(1) == make_user()
+    assert 0 < (await redis_store.expires_in("user:1") or 0) <= 30
+
+    await user_cache.invalidate(1)
+    assert await user_cache.get(1) is None
+    await user_cache.set(make_user(name="Stale"), version)
+    assert await user_cache.get(1) is None
+    assert user_cache.stats()["stale_fills"] == 1
+
+
+@pytest.fixture
+def memory_cache(monkeypatch: pytest.MonkeyPatch) -> Iterator[UserCache]:
+    """Кэш в памяти процесса вместо отключенного в тестах кэша."""
+    user_cache = UserCache(LRUMemoryStore(max_size=100), ttl=30)
+    monkeypatch.setattr(controllers, "user_cache", user_cache)
+    yield user_cache
+
+
+async def test_get_user_served_from_cache(
+    client: httpx.AsyncClient,
+    user: Dict[str, Any],
+    memory_cache: UserCache,
+    statements: List[str],
+) -> None:
+    client.cookies.clear()
+    assert (await client.get(f"/users/{user['id']}")).status_code == 200
+    statements.clear()
+    response = await client.get(f"/users/{user['id']}")
+
+    assert response.status_code == 200
+    assert response.json() == user
+    assert statements == []
+    assert memory_cache.hits == 1
+
+
+async def test_write_invalidates_cache_after_commit(
+    client: httpx.AsyncClient, user: Dict[str, Any], memory_cache: UserCache
+) -> None:
+    client.cookies.clear()
+    await client.get(f"/users/{user['id']}")
+    response = await client.patch(f"/users/{user['id']}", json={"name": "Pyotr"})
+    assert response.status_code == 200
+
+    assert await memory_cache.get(user["id"]) is None
+    # Без cookie read-your-writes чтение снова идет через кэш
+    client.cookies.clear()
+    response = await client.get(f"/users/{user['id']}")
+    assert response.json()["name"] == "Pyotr"
+    cached = await memory_cache.get(user["id"])
+    assert cached is not None and cached.name == "Pyotr"
@@ -0,0 +1,98 @@
+"""Потоковая выгрузка пользователей GET /users/export."""
+
+import csv
+import io
+import json
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, List
+
+import httpx
+import pytest
+from litestar import Litestar
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from src.db.models import User
+from src.db.session import sqlalchemy_config
+from src.domain.users.controllers import USER_SCHEMA_COLUMNS
+from src.domain.users.export import ExportFormat, export_users
+
+CSV_HEADER = "id,name,surname,created_at,updated_at"
+
+
+async def collect(
+    engine: AsyncEngine, export_format: ExportFormat, batch_size: int
+) -> List[bytes]:
+    return [
+        chunk
+        async for chunk in export_users(
+            engine, USER_SCHEMA_COLUMNS, export_format, batch_size
+        )
+    ]
+
+
+@pytest.fixture
+async def empty_engine(tmp_path: Path) -> AsyncIterator[AsyncEngine]:
+    """Движок отдельной базы с пустой таблицей пользователей."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path}/empty.sqlite3")
+    async with engine.begin() as connection:
+        await connection.run_sync(User.metadata.create_all)
+    yield engine
+    await engine.dispose()
+
+
+async def test_export_ndjson(client: httpx.AsyncClient, user: Dict[str, Any]) -> None:
+    response = await client.get("/users/export")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    assert 'filename="users.ndjson"' in response.headers["content-disposition"]
+    # Потоковый ответ: длина тела заранее неизвестна
+    assert "content-length" not in response.headers
+    records = [json.loads(line) for line in response.text.splitlines()]
+    assert user in records
+    ids = [record["id"] for record in records]
+    assert ids == sorted(ids)
+
+
+async def test_export_csv(client: httpx.AsyncClient, user: Dict[str, Any]) -> None:
+    response = await client.get("/users/export", params={"format": "csv"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    assert 'filename="users.csv"' in response.headers["content-disposition"]
+    assert response.text.splitlines()[0] == CSV_HEADER
+    rows = {row["id"]: row for row in csv.DictReader(io.StringIO(response.text))}
+    row = rows[str(user["id"])]
+    assert row["name"] == user["name"]
+    assert row["surname"] == user["surname"]
+    assert "password" not in row
+
+
+async def test_export_unknown_format(client: httpx.AsyncClient) -> None:
+    response = await client.get("/users/export", params={"format": "xml"})
+
+    assert response.status_code == 400
+
+
+@pytest.mark.parametrize("export_format", ["ndjson", "csv"])
+async def test_export_streams_batches(
+    app: Litestar, user: Dict[str, Any], export_format: ExportFormat
+) -> None:
+    engine = sqlalchemy_config.engine_instance
+    # Каждая пачка кодируется и отдается отдельным фрагментом
+    chunks = await collect(engine, export_format, batch_size=1)
+    batches = await collect(engine, export_format, batch_size=1000)
+
+    header = 1 if export_format == "csv" else 0
+    rows = b"".join(batches).count(b"\n") - header
+    assert rows >= 1
+    assert len(chunks) == rows + header
+    assert all(chunk.count(b"\n") == 1 for chunk in chunks)
+    assert b"".join(chunks) == b"".join(batches)
+
+
+async def test_export_empty_table(empty_engine: AsyncEngine) -> None:
+    assert await collect(empty_engine, "ndjson", batch_size=1000) == []
+    assert await collect(empty_engine, "csv", batch_size=1000) == [
+        f"{CSV_HEADER}\n".encode("utf-8")
+    ]
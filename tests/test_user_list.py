@@ -0,0 +1,158 @@
+"""Фильтры и keyset-пагинация списка пользователей GET /users."""
+
+import base64
+import uuid
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+import httpx
+import pytest
+
+from src.domain.users.schemas import UserCursorSchema
+from src.lib.pagination import encode_cursor
+
+
+@pytest.fixture
+def surname_prefix() -> str:
+    """Уникальный префикс фамилии: отделяет пользователей теста от остальных."""
+    return f"Cursor{uuid.uuid4().hex[:8]}"
+
+
+@pytest.fixture
+async def cursor_users(
+    client: httpx.AsyncClient, surname_prefix: str
+) -> List[Dict[str, Any]]:
+    """Пользователи с повторяющимися именами для проверки порядка по id."""
+    response = await client.post(
+        "/users/bulk",
+        json=[
+            {
+                "name": name,
+                "surname": f"{surname_prefix}{surname}",
+                "password": "password",
+            }
+            for name, surname in [
+                ("Boris", "C"),
+                ("Anna", "A"),
+                ("Boris", "A"),
+                ("Vera", "B"),
+                ("Anna", "C"),
+            ]
+        ],
+    )
+    assert response.status_code == 201
+    return [item["user"] for item in response.json()]
+
+
+def sort_key(order_by: str, user: Dict[str, Any]) -> Any:
+    value = user[order_by]
+    if order_by == "created_at":
+        value = datetime.fromisoformat(value)
+    return value, user["id"]
+
+
+async def fetch_all_pages(
+    client: httpx.AsyncClient, surname_prefix: str, order_by: str, sort_order: str
+) -> List[Dict[str, Any]]:
+    """Проходит список страницами по два элемента через ``X-Next-Cursor``."""
+    params: Dict[str, Any] = {
+        "surname": surname_prefix,
+        "surname_match": "prefix",
+        "order_by": order_by,
+        "sort_order": sort_order,
+        "page_size": 2,
+    }
+    users: List[Dict[str, Any]] = []
+    cursor: Optional[str] = None
+    while True:
+        response = await client.get(
+            "/users", params={**params, **({"cursor": cursor} if cursor else {})}
+        )
+        assert response.status_code == 200
+        users.extend(response.json())
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            return users
+        assert len(users) < 10, "курсор не продвигается"
+
+
+@pytest.mark.parametrize("order_by", ["id", "created_at", "name", "surname"])
+@pytest.mark.parametrize("sort_order", ["asc", "desc"])
+async def test_cursor_round_trip(
+    client: httpx.AsyncClient,
+    cursor_users: List[Dict[str, Any]],
+    surname_prefix: str,
+    order_by: str,
+    sort_order: str,
+) -> None:
+    users = await fetch_all_pages(client, surname_prefix, order_by, sort_order)
+
+    expected = sorted(
+        cursor_users,
+        key=lambda user: sort_key(order_by, user),
+        reverse=sort_order == "desc",
+    )
+    assert [user["id"] for user in users] == [user["id"] for user in expected]
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "!!!",
+        base64.urlsafe_b64encode(b"not json").decode().rstrip("="),
+        base64.urlsafe_b64encode(b'{"order_by": "id", "id": "one"}').decode(),
+        base64.urlsafe_b64encode(b'{"order_by": "email", "id": 1}').decode(),
+    ],
+)
+async def test_invalid_cursor(client: httpx.AsyncClient, cursor: str) -> None:
+    response = await client.get("/users", params={"cursor": cursor})
+
+    assert response.status_code == 400
+
+
+async def test_cursor_without_key_value(client: httpx.AsyncClient) -> None:
+    # Курсор сортировки по имени без значения имени
+    cursor = encode_cursor(UserCursorSchema(order_by="name", id=1))
+
+    response = await client.get("/users", params={"cursor": cursor, "order_by": "name"})
+
+    assert response.status_code == 400
+
+
+@pytest.mark.parametrize(
+    "params",
+    [{"order_by": "name"}, {"sort_order": "desc"}],
+)
+async def test_cursor_order_mismatch(
+    client: httpx.AsyncClient,
+    cursor_users: List[Dict[str, Any]],
+    surname_prefix: str,
+    params: Dict[str, str],
+) -> None:
+    response = await client.get(
+        "/users",
+        params={"surname": surname_prefix, "surname_match": "prefix", "page_size": 2},
+    )
+    cursor = response.headers["X-Next-Cursor"]
+
+    response = await client.get("/users", params={"cursor": cursor, **params})
+
+    assert response.status_code == 400
+    assert "порядка сортировки" in response.json()["detail"]
+
+
+async def test_list_created_range_with_timezone(
+    client: httpx.AsyncClient, user: Dict[str, Any]
+) -> None:
+    response = await client.get(
+        "/users",
+        params={
+            "created_after": "2000-01-01T03:00:00+03:00",
+            "created_before": "2999-01-01T00:00:00Z",
+            # Другие тесты тоже создают пользователей: новые - на первой странице
+            "sort_order": "desc",
+        },
+    )
+
+    assert response.status_code == 200
+    assert user["id"] in [item["id"] for item in response.json()]
@@ -0,0 +1,95 @@
+"""Количество SQL-выражений в POST /users, PUT и DELETE /users/{id}."""
+
+from typing import Any, Dict, List
+
+import httpx
+
+MISSING_USER_ID = 10**9
+
+
+async def test_create_user_single_statement(
+    client: httpx.AsyncClient, statements: List[str]
+) -> None:
+    response = await client.post(
+        "/users",
+        json={"name": "Anna", "surname": "Ivanova", "password": "initial-password"},
+    )
+
+    assert response.status_code == 201
+    body = response.json()
+    assert body["id"] is not None
+    assert body["created_at"] is not None and body["updated_at"] is not None
+    # Серверные значения возвращает INSERT ... RETURNING, без SELECT
+    assert len(statements) == 1
+    assert statements[0].startswith("INSERT")
+    assert "RETURNING" in statements[0]
+
+
+async def test_update_user_single_statement(
+    client: httpx.AsyncClient, user: Dict[str, Any], statements: List[str]
+) -> None:
+    statements.clear()
+    response = await client.put(
+        f"/users/{user['id']}",
+        json={"name": "Pyotr", "surname": None, "password": None},
+    )
+
+    assert response.status_code == 200
+    assert response.json()["name"] == "Pyotr"
+    assert len(statements) == 1
+    assert statements[0].startswith("UPDATE")
+    assert "RETURNING" in statements[0]
+
+
+async def test_update_user_password_single_statement(
+    client: httpx.AsyncClient, user: Dict[str, Any], statements: List[str]
+) -> None:
+    statements.clear()
+    response = await client.put(
+        f"/users/{user['id']}",
+        json={"name": None, "surname": None, "password": "another-password"},
+    )
+
+    assert response.status_code == 200
+    assert len(statements) == 1
+    assert statements[0].startswith("UPDATE")
+
+
+async def test_update_missing_user_single_statement(
+    client: httpx.AsyncClient, statements: List[str]
+) -> None:
+    statements.clear()
+    response = await client.put(
+        f"/users/{MISSING_USER_ID}",
+        json={"name": "Pyotr", "surname": None, "password": None},
+    )
+
+    assert response.status_code == 404
+    assert len(statements) == 1
+    assert statements[0].startswith("UPDATE")
+
+
+async def test_delete_user_single_statement(
+    client: httpx.AsyncClient, user: Dict[str, Any], statements: List[str]
+) -> None:
+    statements.clear()
+    response = await client.delete(f"/users/{user['id']}")
+
+    assert response.status_code == 204
+    assert len(statements) == 1
+    assert statements[0].startswith("DELETE")
+    assert "RETURNING" in statements[0]
+
+    response = await client.get(f"/users/{user['id']}")
+    assert response.status_code == 404
+
+
+async def test_delete_missing_user_single_statement(
+    client: httpx.AsyncClient, statements: List[str]
+) -> None:
+    statements.clear()
+    response = await client.delete(f"/users/{MISSING_USER_ID}")
+
+    assert response.status_code == 404
+    assert len(statements) == 1
+    assert statements[0].startswith("DELETE")
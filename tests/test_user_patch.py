@@ -0,0 +1,165 @@
+"""Обнаружение изменений и количество SQL-выражений в PATCH /users/{id}."""
+
+import re
+from datetime import datetime
+from typing import Any, Dict, List
+
+import httpx
+import pytest
+from sqlalchemy import update
+
+from src.core.security import password_hasher
+from src.db.models import User
+from src.db.session import sqlalchemy_config
+from src.domain.users.etags import user_etag
+
+MISSING_USER_ID = 10**9
+
+
+def assigned_columns(statement: str) -> List[str]:
+    """Колонки из SET выражения UPDATE."""
+    assignments = statement.split(" SET ", 1)[1].split(" WHERE ", 1)[0]
+    return re.findall(r"(\w+)=", assignments)
+
+
+@pytest.fixture
+def hash_calls(monkeypatch: pytest.MonkeyPatch) -> List[str]:
+    """Пароли, переданные в ``password_hasher.hash`` во время теста."""
+    calls: List[str] = []
+    original = password_hasher.hash
+
+    async def hash_spy(password: str) -> str:
+        calls.append(password)
+        return await original(password)
+
+    monkeypatch.setattr(password_hasher, "hash", hash_spy)
+    return calls
+
+
+async def test_patch_unchanged_values_skip_update(
+    client: httpx.AsyncClient, user: Dict[str, Any], statements: List[str]
+) -> None:
+    statements.clear()
+    response = await client.patch(
+        f"/users/{user['id']}", json={"name": user["name"], "surname": user["surname"]}
+    )
+
+    assert response.status_code == 200
+    assert response.json() == user
+    assert len(statements) == 1
+    assert statements[0].startswith("SELECT")
+
+
+async def test_patch_updates_only_changed_columns(
+    client: httpx.AsyncClient, user: Dict[str, Any], statements: List[str]
+) -> None:
+    statements.clear()
+    response = await client.patch(
+        f"/users/{user['id']}", json={"name": user["name"], "surname": "Sidorov"}
+    )
+
+    assert response.status_code == 200
+    assert response.json()["surname"] == "Sidorov"
+    assert len(statements) == 2
+    assert statements[0].startswith("SELECT")
+    assert statements[1].startswith("UPDATE")
+    # updated_at обновляется onupdate модели
+    assert assigned_columns(statements[1]) == ["surname", "updated_at"]
+
+
+async def test_patch_same_password_not_rehashed(
+    client: httpx.AsyncClient,
+    user: Dict[str, Any],
+    statements: List[str],
+    hash_calls: List[str],
+) -> None:
+    statements.clear()
+    response = await client.patch(
+        f"/users/{user['id']}", json={"password": "initial-password"}
+    )
+
+    assert response.status_code == 200
+    assert response.json() == user
+    assert hash_calls == []
+    assert len(statements) == 1
+
+
+async def test_patch_new_password_rehashed(
+    client: httpx.AsyncClient,
+    user: Dict[str, Any],
+    statements: List[str],
+    hash_calls: List[str],
+) -> None:
+    statements.clear()
+    response = await client.patch(
+        f"/users/{user['id']}", json={"password": "changed-password"}
+    )
+
+    assert response.status_code == 200
+    assert hash_calls == ["changed-password"]
+    assert len(statements) == 2
+    assert assigned_columns(statements[1]) == ["password", "updated_at"]
+
+
+async def test_patch_null_rejected(
+    client: httpx.AsyncClient, user: Dict[str, Any], statements: List[str]
+) -> None:
+    statements.clear()
+    response = await client.patch(f"/users/{user['id']}", json={"name": None})
+
+    assert response.status_code == 400
+    assert statements == []
+
+
+async def test_patch_stale_if_match(
+    client: httpx.AsyncClient, user: Dict[str, Any], statements: List[str]
+) -> None:
+    # Заведомо устаревшая версия записи
+    stale = user_etag(user["id"], datetime(2000, 1, 1))
+    statements.clear()
+    response = await client.patch(
+        f"/users/{user['id']}", json={"surname": "Smirnov"}, headers={"If-Match": stale}
+    )
+
+    assert response.status_code == 412
+    assert not any(statement.startswith("UPDATE") for statement in statements)
+
+
+async def test_patch_concurrent_change_during_hashing(
+    client: httpx.AsyncClient,
+    user: Dict[str, Any],
+    statements: List[str],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    original = password_hasher.hash
+
+    async def hash_with_concurrent_update(password: str) -> str:
+        # Другой запрос изменяет запись, пока хешируется пароль
+        async with sqlalchemy_config.engine_instance.begin() as connection:
+            await connection.execute(
+                update(User)
+                .where(User.id == user["id"])
+                .values(surname="Smirnov", updated_at=datetime(2001, 1, 1))
+            )
+        return await original(password)
+
+    monkeypatch.setattr(password_hasher, "hash", hash_with_concurrent_update)
+    statements.clear()
+    response = await client.patch(
+        f"/users/{user['id']}", json={"password": "changed-password"}
+    )
+
+    assert response.status_code == 412
+    assert not any("FOR UPDATE" in statement for statement in statements)
+    current = await client.get(f"/users/{user['id']}")
+    assert current.json()["surname"] == "Smirnov"
+
+
+async def test_patch_missing_user(
+    client: httpx.AsyncClient, statements: List[str]
+) -> None:
+    statements.clear()
+    response = await client.patch(f"/users/{MISSING_USER_ID}", json={"name": "Pyotr"})
+
+    assert response.status_code == 404
+    assert len(statements) == 1
@@ -0,0 +1,66 @@
+"""Кэш пользователей и read-your-writes в GET /users/{id}."""
+
+import time
+from typing import Any, Dict, List
+
+import httpx
+import pytest
+
+from src.db.replicas import LAST_WRITE_COOKIE
+from src.db.session import replica_router, sqlalchemy_config
+from src.domain.users.cache import user_cache
+
+
+@pytest.fixture
+def cache_calls(monkeypatch: pytest.MonkeyPatch) -> List[str]:
+    """Вызовы ``user_cache.get`` и ``user_cache.set`` во время теста."""
+    calls: List[str] = []
+
+    async def get(user_id: int) -> None:
+        calls.append("get")
+        return None
+
+    async def set(user: Any, version: Any = None) -> None:
+        calls.append("set")
+
+    monkeypatch.setattr(user_cache, "get", get)
+    monkeypatch.setattr(user_cache, "set", set)
+    return calls
+
+
+async def test_get_user_reads_and_fills_cache(
+    client: httpx.AsyncClient, user: Dict[str, Any], cache_calls: List[str]
+) -> None:
+    client.cookies.clear()
+    response = await client.get(f"/users/{user['id']}")
+
+    assert response.status_code == 200
+    assert cache_calls == ["get", "set"]
+
+
+async def test_get_user_after_write_skips_cache_read(
+    client: httpx.AsyncClient, user: Dict[str, Any], cache_calls: List[str]
+) -> None:
+    client.cookies.set(LAST_WRITE_COOKIE, str(time.time()))
+    response = await client.get(f"/users/{user['id']}")
+
+    assert response.status_code == 200
+    assert response.json() == user
+    assert "get" not in cache_calls
+
+
+async def test_get_user_from_replica_not_cached(
+    client: httpx.AsyncClient,
+    user: Dict[str, Any],
+    cache_calls: List[str],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # Роль реплики играет движок основной базы
+    monkeypatch.setattr(
+        replica_router, "choose", lambda: sqlalchemy_config.engine_instance
+    )
+    client.cookies.clear()
+    response = await client.get(f"/users/{user['id']}")
+
+    assert response.status_code == 200
+    assert cache_calls == ["get"]
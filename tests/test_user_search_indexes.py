@@ -0,0 +1,203 @@
+"""Использование индексов поиска и сортировки пользователей в PostgreSQL.
+
+Планы запросов списка проверяются через ``EXPLAIN`` на базе из
+переменной окружения ``TEST_POSTGRES_URL`` (``postgresql+asyncpg://...``).
+Таблица и индексы создаются по моделям во временной схеме и удаляются
+после тестов. Без PostgreSQL тесты пропускаются, без расширения
+pg_trgm - только проверки триграммных индексов.
+"""
+
+import json
+import os
+from datetime import datetime, timedelta, timezone
+from typing import Any, AsyncIterator, Dict, Iterator, Optional, Set, Tuple
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.schema import CreateIndex, CreateTable
+
+from src.db.explain import Explain
+from src.db.models import User
+from src.db.repositories import MatchMode, UserOrderBy, UserRepository
+from src.domain.users.controllers import USER_SCHEMA_COLUMNS
+
+POSTGRES_URL = os.environ.get("TEST_POSTGRES_URL")
+
+pytestmark = pytest.mark.skipif(not POSTGRES_URL, reason="TEST_POSTGRES_URL не задан")
+
+SEED_ROWS = 20000
+
+
+@pytest.fixture(scope="module")
+async def pg_engine() -> AsyncIterator[Tuple[AsyncEngine, Set[str]]]:
+    """Движок PostgreSQL с заполненной таблицей пользователей.
+
+    Триграммные индексы создаются, только если доступно расширение
+    pg_trgm.
+
+    Yields:
+        Tuple[AsyncEngine, Set[str]]: Движок и имена созданных индексов.
+    """
+    assert POSTGRES_URL is not None
+    schema = f"test_user_search_{os.getpid()}"
+    engine = create_async_engine(
+        POSTGRES_URL,
+        connect_args={"server_settings": {"search_path": f"{schema},public"}},
+    )
+    try:
+        async with engine.begin() as connection:
+            await connection.execute(text(f'CREATE SCHEMA "{schema}"'))
+    except (OSError, SQLAlchemyError) as e:
+        await engine.dispose()
+        pytest.skip(f"PostgreSQL недоступен: {e}")
+    try:
+        async with engine.begin() as connection:
+            await connection.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        has_trgm = True
+    except SQLAlchemyError:
+        has_trgm = False
+
+    try:
+        table = User.__table__
+        indexes = {
+            index
+            for index in table.indexes
+            if has_trgm or not index.dialect_options["postgresql"]["ops"]
+        }
+        async with engine.begin() as connection:
+            await connection.execute(CreateTable(table))
+            for index in indexes:
+                await connection.execute(CreateIndex(index))
+            await connection.execute(
+                text(
+                    'INSERT INTO "user" (id, name, surname, password, created_at, '
+                    "updated_at) SELECT i, 'Name' || (i % 500), 'Surname' || i, 'x', "
+                    "TIMESTAMP '2026-01-01' + i * INTERVAL '1 minute', "
+                    "TIMESTAMP '2026-01-01' + i * INTERVAL '1 minute' "
+                    "FROM generate_series(1, :rows) AS i"
+                ),
+                {"rows": SEED_ROWS},
+            )
+            await connection.execute(text('ANALYZE "user"'))
+        yield engine, {str(index.name) for index in indexes}
+    finally:
+        async with engine.begin() as connection:
+            await connection.execute(text(f'DROP SCHEMA "{schema}" CASCADE'))
+        await engine.dispose()
+
+
+def plan_indexes(plan: Dict[str, Any]) -> Iterator[str]:
+    """Имена индексов во всех узлах плана."""
+    if "Index Name" in plan:
+        yield plan["Index Name"]
+    for child in plan.get("Plans", []):
+        yield from plan_indexes(child)
+
+
+async def explain_indexes(
+    pg_engine: Tuple[AsyncEngine, Set[str]],
+    index: str,
+    order_by: UserOrderBy = "id",
+    after: Optional[Tuple[Any, ...]] = None,
+    **filters: Any,
+) -> Set[str]:
+    """Индексы из плана запроса страницы списка пользователей.
+
+    Тест пропускается, если ожидаемый индекс ``index`` не создан.
+    """
+    engine, created = pg_engine
+    if index not in created:
+        pytest.skip(f"Индекс {index} не создан: нет расширения pg_trgm")
+    statement = UserRepository.list_statement(
+        USER_SCHEMA_COLUMNS,
+        limit=11,
+        order_by=order_by,
+        after=after,
+        filters=UserRepository.search_filters(**filters),
+    )
+    async with engine.connect() as connection:
+        result = await connection.execute(Explain(statement))
+        plan = result.scalar_one()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return set(plan_indexes(plan[0]["Plan"]))
+
+
+@pytest.mark.parametrize(
+    ("field", "value", "match", "index"),
+    [
+        ("name", "Name42", "exact", "ix_user_name_id"),
+        ("surname", "Surname1234", "exact", "ix_user_surname_id"),
+        ("name", "name42", "prefix", "ix_user_name_trgm"),
+        ("surname", "surname1234", "prefix", "ix_user_surname_trgm"),
+        ("name", "me42", "contains", "ix_user_name_trgm"),
+        ("surname", "name1234", "contains", "ix_user_surname_trgm"),
+    ],
+)
+async def test_search_uses_index(
+    pg_engine: Tuple[AsyncEngine, Set[str]],
+    field: str,
+    value: str,
+    match: MatchMode,
+    index: str,
+) -> None:
+    indexes = await explain_indexes(
+        pg_engine, index, **{field: value, f"{field}_match": match}
+    )
+
+    assert index in indexes
+
+
+async def test_created_at_range_uses_index(
+    pg_engine: Tuple[AsyncEngine, Set[str]],
+) -> None:
+    indexes = await explain_indexes(
+        pg_engine,
+        "ix_user_created_at_id",
+        order_by="created_at",
+        created_after=datetime(2026, 1, 2),
+        created_before=datetime(2026, 1, 3),
+    )
+
+    assert "ix_user_created_at_id" in indexes
+
+
+async def test_created_at_range_with_timezone(
+    pg_engine: Tuple[AsyncEngine, Set[str]],
+) -> None:
+    engine, _ = pg_engine
+    # 2026-01-02 00:00 UTC; строки добавлены с шагом в минуту от 2026-01-01
+    moscow = timezone(timedelta(hours=3))
+    statement = UserRepository.count_statement(
+        UserRepository.search_filters(
+            created_after=datetime(2026, 1, 2, 3, tzinfo=moscow),
+            created_before=datetime(2026, 1, 3, tzinfo=timezone.utc),
+        )
+    )
+    async with engine.connect() as connection:
+        count = (await connection.execute(statement)).scalar_one()
+
+    assert count == 24 * 60
+
+
+@pytest.mark.parametrize(
+    ("order_by", "after", "index"),
+    [
+        ("name", None, "ix_user_name_id"),
+        ("surname", None, "ix_user_surname_id"),
+        ("created_at", None, "ix_user_created_at_id"),
+        ("surname", ("Surname5000", 5000), "ix_user_surname_id"),
+        ("created_at", (datetime(2026, 1, 5), 5000), "ix_user_created_at_id"),
+    ],
+)
+async def test_sorting_uses_index(
+    pg_engine: Tuple[AsyncEngine, Set[str]],
+    order_by: UserOrderBy,
+    after: Optional[Tuple[Any, ...]],
+    index: str,
+) -> None:
+    indexes = await explain_indexes(pg_engine, index, order_by=order_by, after=after)
+
+    assert index in indexes